@@ -28,11 +28,14 @@ launch command. The
 
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Iterable
 from contextlib import AbstractContextManager
 from pathlib import Path
@@ -158,6 +161,78 @@ class HardBreakMarkdown(Markdown):
                     child.type = "hardbreak"
 
 
+#: Byte budget for the kept preview rasters (see :class:`RasterCache`) — a few hundred
+#: ordinary docs, or every doc a session moves between at two widths each.
+_RASTER_BUDGET = 16 * 2**20
+
+#: Narrowest width a preview is laid out at; a panel squeezed below it renders at this.
+_MIN_RENDER_WIDTH = 10
+
+
+class RasterCache:
+    """Bounded LRU of rendered previews, keyed on a digest of the source (and preface)
+    plus the width it was laid out at.
+
+    A raster depends on nothing else, so moving the cursor back and forth between two
+    epics — or resizing back to a width already seen — is a digest and a dict lookup
+    rather than a full Rich parse and layout. Entries are weighed by an estimate of
+    their text and spans; past ``budget`` bytes the least recently used are dropped,
+    and one bigger than the whole budget isn't kept. ``hits`` / ``misses`` count
+    lookups. Locked, since the key is computed and the entry stored around a render."""
+
+    def __init__(self, budget: int = _RASTER_BUDGET) -> None:
+        self.budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._kept: OrderedDict[tuple[bytes, int], tuple[Content, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(markup: str, width: int, preface: Text | None = None) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(markup.encode("utf-8", "surrogatepass"))
+        if preface is not None:
+            digest.update(b"\0" + preface.markup.encode("utf-8", "surrogatepass"))
+        return digest.digest(), max(width, _MIN_RENDER_WIDTH)
+
+    @staticmethod
+    def weigh(content: Content) -> int:
+        """Estimated bytes held: the text, plus a style run per span."""
+        return len(content.plain) * 4 + len(content.spans) * 96
+
+    def get(self, key: tuple[bytes, int]) -> Content | None:
+        with self._lock:
+            found = self._kept.get(key)
+            if found is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._kept.move_to_end(key)
+            return found[0]
+
+    def put(self, key: tuple[bytes, int], content: Content) -> None:
+        weight = self.weigh(content)
+        if weight > self.budget:
+            return
+        with self._lock:
+            previous = self._kept.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            while self._kept and self.bytes + weight > self.budget:
+                _, (_, dropped) = self._kept.popitem(last=False)
+                self.bytes -= dropped
+            self._kept[key] = (content, weight)
+            self.bytes += weight
+
+    def __len__(self) -> int:
+        return len(self._kept)
+
+
+#: Every preview's rasters — a doc is the same raster whichever panel shows it.
+_RASTERS = RasterCache()
+
+
 def markdown_content(markup: str, width: int, *, preface: Text | None = None) -> Content:
     """A rendered markdown document as a selectable Textual ``Content``.
 
@@ -168,12 +243,26 @@ def markdown_content(markup: str, width: int, *, preface: Text | None = None) ->
     ``Content``, keeping every heading / emphasis / list / table Rich would draw while
     restoring selection. Because the raster is width-specific, the caller re-renders on
     resize. Trailing pad is stripped per line so a copied selection has no run-on
-    whitespace. ``preface`` (e.g. a red "Blocked by" note) is placed above the doc."""
+    whitespace. ``preface`` (e.g. a red "Blocked by" note) is placed above the doc.
+
+    Made once per source, preface and width and kept in :data:`_RASTERS`, so revisits
+    and repeated resizes don't lay the document out again."""
+    key = RasterCache.key(markup, width, preface)
+    kept = _RASTERS.get(key)
+    if kept is not None:
+        return kept
+    content = _rasterise(markup, width, preface)
+    _RASTERS.put(key, content)
+    return content
+
+
+def _rasterise(markup: str, width: int, preface: Text | None) -> Content:
+    """The render itself, uncached — see :func:`markdown_content`."""
     text = Text()
     if preface is not None:
         text.append_text(preface)
         text.append("\n\n")
-    render_width = max(width, 10)
+    render_width = max(width, _MIN_RENDER_WIDTH)
     console = Console(width=render_width, color_system="truecolor")
     segments = console.render(HardBreakMarkdown(markup), console.options.update_width(render_width))
     for line in Segment.split_lines(segments):
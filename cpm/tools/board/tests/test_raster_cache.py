@@ -0,0 +1,61 @@
+"""Preview rasters are kept per source and width, within a byte budget.
+
+Asserts on render counts and object identity rather than timings, so the test says
+whether a revisit re-rendered rather than how fast this machine happened to be.
+"""
+
+from rich.text import Text
+
+import board
+from board import RasterCache, markdown_content
+
+DOC = "# Epic 1\n\n**Status**: in-progress\n**Owner**: someone\n\nA paragraph of body text."
+
+
+def test_revisits_and_repeated_resizes_reuse_the_raster(monkeypatch):
+    monkeypatch.setattr(board, "_RASTERS", RasterCache())
+    rendered = []
+    render = board._rasterise
+
+    def counted(markup, width, preface):
+        rendered.append(width)
+        return render(markup, width, preface)
+
+    monkeypatch.setattr(board, "_rasterise", counted)
+    other = DOC.replace("Epic 1", "Epic 2")
+
+    for _ in range(3):  # the cursor moving back and forth between two epics
+        first = markdown_content(DOC, 60)
+        markdown_content(other, 60)
+    markdown_content(DOC, 40)
+    markdown_content(DOC, 60)
+
+    assert rendered == [60, 60, 40]  # one render per document per width
+    assert markdown_content(DOC, 60) is first
+    assert (board._RASTERS.hits, board._RASTERS.misses) == (6, 3)
+
+
+def test_a_preface_is_part_of_what_the_raster_is_kept_under(monkeypatch):
+    monkeypatch.setattr(board, "_RASTERS", RasterCache())
+    blocked = Text("Blocked by: 02-epic", style="red")
+
+    plain = markdown_content(DOC, 60)
+    prefaced = markdown_content(DOC, 60, preface=blocked)
+
+    assert "Blocked by" in prefaced.plain and "Blocked by" not in plain.plain
+
+
+def test_the_least_recently_used_raster_is_dropped_past_the_budget(monkeypatch):
+    monkeypatch.setattr(board, "_RASTERS", RasterCache())
+    one, two, three = (markdown_content(f"# Doc {n}\n\n" + "text " * 200, 60) for n in "123")
+    rasters = RasterCache(budget=RasterCache.weigh(one) * 2 + 10)
+    keys = [RasterCache.key(f"doc {n}", 60) for n in "123"]
+
+    rasters.put(keys[0], one)
+    rasters.put(keys[1], two)
+    rasters.get(keys[0])  # the first is now the more recently used
+    rasters.put(keys[2], three)
+
+    assert rasters.get(keys[1]) is None
+    assert rasters.get(keys[0]) is one and rasters.get(keys[2]) is three
+    assert rasters.bytes == RasterCache.weigh(one) + RasterCache.weigh(three) <= rasters.budget
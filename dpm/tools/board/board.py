@@ -11,9 +11,11 @@ Run directly with uv; the PEP 723 block above is what provisions it, so there is
 (AD2, ENV1):
 
     uv run dpm/tools/board/board.py            # the TUI
+    uv run dpm/tools/board/board.py --watch    # the TUI, re-reading a project when it is written
     uv run dpm/tools/board/board.py list
     uv run dpm/tools/board/board.py add PATH
     uv run dpm/tools/board/board.py remove PATH
+    uv run dpm/tools/board/board.py stats      # where a survey of every project spends its time
 
 **The board is an MCP client and nothing else** (FR2). It opens no SQLite connection, reads no file
 under a project's ``docs/`` or ``.dpm/``, and parses no markdown: everything it knows about a project
@@ -31,11 +33,19 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import json
+import os
+import re
 import sys
-from contextlib import contextmanager
-from dataclasses import dataclass, replace
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field, replace
 from functools import partial
 from pathlib import Path
+from typing import Any
 
 from rich.color import Color
 from rich.color_triplet import ColorTriplet
@@ -50,8 +60,10 @@ from textual.binding import Binding
 from textual.command import DiscoveryHit, Hit, Provider
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.content import Content
+from textual.css.query import NoMatches
 from textual.screen import ModalScreen
 from textual.strip import Strip
+from textual.timer import Timer
 from textual.widgets import DirectoryTree, Footer, Header, Input, Label, OptionList, Static
 
 from board_view import (
@@ -60,6 +72,9 @@ from board_view import (
     READING_STYLE,
     STATE_STYLE,
     UNREADABLE_STYLE,
+    DIAGNOSIS_COLUMNS,
+    Diagnosis,
+    Diagnostics,
     EpicView,
     Gap,
     ProjectView,
@@ -74,7 +89,7 @@ from board_view import (
     story_preview,
     style_for,
 )
-from cache import Cache
+from cache import HIT, MISSED, STALE, Cache, Stats
 from mcp_client import (
     SERVER_FAILED,
     SERVER_MISSING,
@@ -82,6 +97,7 @@ from mcp_client import (
     ServerPool,
     Unreadable,
 )
+from metrics import CACHE, METRICS, ON_EXIT, RASTER, RASTERS, READ, SURVEY
 from registry import (
     add_project,
     list_projects,
@@ -113,12 +129,14 @@ from status_model import (
     STORIES,
     STORY_CRITERIA,
     TASKS,
+    WINDOWS,
     Candidate,
     blockers,
     by_epic,
     candidates,
     dependencies,
     epic_state,
+    execute,
     gating_kinds,
     hits,
     progress,
@@ -127,6 +145,12 @@ from status_model import (
     untraced_requirements,
     violations,
 )
+from watcher import watch_projects
+
+
+#: How many projects `list` reads at once. Each may be a server spawn, so this is the same bound
+#: the browser puts on its surveys and for the same reason (see :data:`SURVEY_WIDTH`).
+LIST_WIDTH = 8
 
 
 def refusal(path: str) -> str | None:
@@ -195,67 +219,238 @@ def _describe(entry, counts: dict[str, int] | None, state: Unreadable | None) ->
     )
 
 
-async def _survey(entries, make_pool) -> list[str]:
-    """Read every registered project through one pool, and describe each one.
+async def _read_entry(pool: ServerPool, entry) -> tuple[dict[str, int] | None, Unreadable | None]:
+    """One registered project's counts, or the state it is in instead — never a raise.
 
     **A project that cannot be read is a row, not an exception** (FR11). The whole point of the
     mixed registry is that one broken project does not take the board down with it, so the state is
     caught per entry and rendered beside the projects that are fine.
     """
-    rows = []
+    if not entry.exists():
+        return None, None
+
+    try:
+        return await read_project(pool, Path(entry.path)), None
+    except Unreadable as state:
+        # Every failure the pool can reach arrives in this one shape — the board declining
+        # before it spawns anything, a server that refused to start, and a server that
+        # started and then could not answer are all states with remedies (FR11), and each
+        # is a row beside the projects that are fine.
+        return None, state
+    except ServerNotFound as missing:
+        return None, Unreadable(SERVER_MISSING, str(missing))
+    except Exception as unexpected:  # noqa: BLE001 — one project's failure is one row (NFR2)
+        # The same containment `survey_project` gives the browser, for the same reason: a
+        # `list` that raised on the third of twelve projects would report nothing about the
+        # nine it had not reached and nothing about the two it had.
+        return None, Unreadable(SERVER_FAILED, f"{type(unexpected).__name__}: {unexpected}")
+
+
+async def _survey(entries, make_pool, emit) -> None:
+    """Read every registered project through one pool, handing each row to ``emit`` in order.
+
+    **Concurrent, and streamed in registry order** (NFR3). The browser stopped reading projects
+    one after another for the reason this had to as well: each waited on every server registered
+    before it, and a `list` behind a cron job or a status line waited on the slowest one before it
+    printed anything. At most :data:`LIST_WIDTH` projects are read at once — each may be a spawn —
+    and a row is emitted as soon as it and every row above it are in. The rows held back meanwhile
+    are the reorder buffer: a caller piping this into anything line-oriented gets the registry's
+    order, which is the only order a second run can be compared against.
+
+    ``emit`` is called as ``emit(entry, counts, state)``, with the same meanings as
+    :func:`_describe`'s.
+    """
+    slots = asyncio.Semaphore(LIST_WIDTH)
+    ready: dict[int, tuple] = {}
+    emitted = 0
 
     async with make_pool() as pool:
-        for entry in entries:
-            if not entry.exists():
-                rows.append(_describe(entry, None, None))
-                continue
 
-            try:
-                rows.append(_describe(entry, await read_project(pool, Path(entry.path)), None))
-            except Unreadable as state:
-                # Every failure the pool can reach arrives in this one shape — the board declining
-                # before it spawns anything, a server that refused to start, and a server that
-                # started and then could not answer are all states with remedies (FR11), and each
-                # is a row beside the projects that are fine.
-                rows.append(_describe(entry, None, state))
-            except ServerNotFound as missing:
-                rows.append(_describe(entry, None, Unreadable(SERVER_MISSING, str(missing))))
-            except Exception as unexpected:  # noqa: BLE001 — one project's failure is one row (NFR2)
-                # The same containment `survey_project` gives the browser, for the same reason: a
-                # `list` that raised on the third of twelve projects would report nothing about the
-                # nine it had not reached and nothing about the two it had.
-                rows.append(
-                    _describe(
-                        entry,
-                        None,
-                        Unreadable(SERVER_FAILED, f"{type(unexpected).__name__}: {unexpected}"),
-                    )
-                )
+        async def read(index: int, entry) -> None:
+            nonlocal emitted
+
+            async with slots:
+                ready[index] = (entry, *await _read_entry(pool, entry))
+
+            while emitted in ready:
+                emit(*ready.pop(emitted))
+                emitted += 1
 
-    return rows
+        await asyncio.gather(*(read(index, entry) for index, entry in enumerate(entries)))
 
 
-def _list(registry_file: Path | None, out, err, make_pool) -> int:
-    """Print the registry with each project's state, read from its own server (FR1, FR2, FR3)."""
+def _record(entry, counts: dict[str, int] | None, state: Unreadable | None) -> dict:
+    """One row as JSON: the project, and either its counts or the state it is in.
+
+    The same three outcomes :func:`_describe` renders, with the state split into the parts a
+    dashboard would want apart — its name to group on, the remedy to show, the detail to log.
+    """
+    record = {"path": entry.path, "label": entry.label}
+
+    if state is not None:
+        return {**record, "state": state.state, "remedy": state.remedy, "detail": state.detail}
+
+    if counts is None:
+        return {**record, "state": "missing"}
+
+    return {**record, "state": None, **counts}
+
+
+def _list(registry_file: Path | None, out, err, make_pool, form: str = "text") -> int:
+    """Print the registry with each project's state, read from its own server (FR1, FR2, FR3).
+
+    ``form`` is ``text`` — a line a row — or ``ndjson``, an object a row, both streamed as rows
+    land; or ``json``, one array, which by its shape cannot be printed until the last row is in.
+    """
     entries = list_projects(registry_file=registry_file)
+    records: list[dict] = []
 
-    if not entries:
-        return 0
+    def emit(entry, counts, state) -> None:
+        if form == "json":
+            records.append(_record(entry, counts, state))
+        elif form == "ndjson":
+            print(json.dumps(_record(entry, counts, state)), file=out, flush=True)
+        else:
+            print(_describe(entry, counts, state), file=out, flush=True)
 
-    try:
-        rows = asyncio.run(_survey(entries, make_pool))
-    except ServerNotFound as missing:
-        # Board-level, not per-project: without a server there is nothing to say about any of them,
-        # and the message names every place that was looked.
-        print(missing, file=err)
-        return 1
+    if entries:
+        try:
+            asyncio.run(_survey(entries, make_pool, emit))
+        except ServerNotFound as missing:
+            # Board-level, not per-project: without a server there is nothing to say about any of
+            # them, and the message names every place that was looked.
+            print(missing, file=err)
+            return 1
+
+    if form == "json":
+        print(json.dumps(records, indent=2), file=out)
+
+    return 0
+
+
+async def _profile(entries, make_pool) -> None:
+    """Survey every registered project the way the browser does, :data:`LIST_WIDTH` at a time."""
+    slots = asyncio.Semaphore(LIST_WIDTH)
+
+    async with make_pool() as pool:
+
+        async def read(view: ProjectView) -> None:
+            async with slots:
+                await survey_project(pool, view)
+
+        await asyncio.gather(*(read(view) for view in registry_views(entries) if view.pending))
+
+
+def _stats(registry_file: Path | None, out, err, make_pool, *, as_json: bool = False) -> int:
+    """Where a survey of the registry spends its time: by phase, and in each by tool and project.
+
+    **The browser's reads, not `list`'s.** The question this answers is why the *board* is slow, and
+    `list` asks three questions of each project where a survey asks eight — a tool only the board
+    calls would never appear in the report. The registry is measured from a standing start, so the
+    figures are this command's and not whatever else the process did first.
+    """
+    METRICS.clear()
+    entries = list_projects(registry_file=registry_file)
+
+    if entries:
+        try:
+            asyncio.run(_profile(entries, make_pool))
+        except ServerNotFound as missing:
+            print(missing, file=err)
+            return 1
+
+    snapshot = METRICS.snapshot()
+    print(json.dumps(snapshot, indent=2) if as_json else describe_metrics(snapshot), file=out)
+
+    return 0
+
+
+#: How many tools and projects the text report names under each phase, slowest first.
+SLOWEST = 5
+
+
+def describe_metrics(snapshot: dict) -> str:
+    """A :meth:`metrics.Metrics.snapshot` as text: each phase, then its slowest tools and projects.
 
-    for row in rows:
-        print(row, file=out)
+    Slowest by total rather than by mean, because a board is slow by the sum of what it waits on:
+    a tool called once at 200ms costs less than one called forty times at 10ms.
+    """
+    lines = []
+
+    for phase, views in snapshot["timings"].items():
+        lines.append(f"{phase:<12}{_timing(views['all'])}")
+
+        for view in ("tools", "projects"):
+            ranked = sorted(views[view].items(), key=lambda item: -item[1]["total"])
+
+            for name, timing in ranked[:SLOWEST]:
+                lines.append(f"  {name:<40}{_timing(timing)}")
+
+    for event, views in snapshot["counts"].items():
+        counted = "  ".join(f"{outcome} {n}" for outcome, n in sorted(views["all"].items()))
+        lines.append(f"{event:<12}{counted}")
+
+    return "\n".join(lines) if lines else "nothing was read"
+
+
+def _timing(timing: dict) -> str:
+    def ms(seconds: float | None) -> str:
+        return "-" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+    return (
+        f"{timing['count']:>6} × mean {ms(timing['mean'])}  p90 {ms(timing['p90'])}  "
+        f"max {ms(timing['max'])}  total {ms(timing['total'])}"
+    )
+
+
+def _cache_stats(cache: Cache, out) -> int:
+    """Report how well the cache serves and what it holds: by project, then by tool (FR13).
+
+    Largest first in both tables, because the question that brings someone here is nearly always
+    where the space went. Nothing is written — a report that compacted the store on its way out
+    would be describing a cache it had just changed.
+    """
+    print(describe_stats(cache.stats()), file=out)
 
     return 0
 
 
+def describe_stats(stats: Stats) -> str:
+    """The ``cache stats`` report as text: the hit ratio, then one line per project and per tool."""
+    counted = {outcome: 0 for outcome in (HIT, STALE, MISSED)}
+
+    for outcomes in stats.outcomes.values():
+        for outcome in counted:
+            counted[outcome] += outcomes.get(outcome, 0)
+
+    ratio = stats.hit_ratio
+    lines = [
+        f"hit ratio  {'—' if ratio is None else f'{ratio:.1%}'}  "
+        f"({counted[HIT]} fresh, {counted[STALE]} stale, {counted[MISSED]} missed)"
+    ]
+
+    for heading, usage in (("projects", stats.projects), ("tools", stats.tools)):
+        lines.append(heading)
+
+        for name, held in sorted(usage.items(), key=lambda item: (-item[1].bytes, item[0])):
+            lines.append(f"  {name}  {held.entries} entries  {_bytes(held.bytes)}")
+
+        if not usage:
+            lines.append("  (nothing cached)")
+
+    return "\n".join(lines)
+
+
+def _bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
 def _remove(path: str, registry_file: Path | None, out) -> int:
     """Unregister a project. Removing one that was never registered is not an error."""
     remove_project(path, registry_file=registry_file)
@@ -279,7 +474,9 @@ def offered_by_id(offers: list[Candidate]) -> dict[str, Candidate]:
     return found
 
 
-async def read_view(pool: ServerPool, root: Path, name: str, *, fresh: bool = False) -> ProjectView:
+async def read_view(
+    pool: ServerPool, root: Path, name: str, *, fresh: bool = False, stale: bool = False
+) -> ProjectView:
     """Everything one project contributes to the browser, in one pass over its rows.
 
     Five unscoped reads answer for the whole project — every story row carries the ``epic_id`` it
@@ -295,19 +492,33 @@ async def read_view(pool: ServerPool, root: Path, name: str, *, fresh: bool = Fa
     would render one project out of two different moments — an epic counted ready by a readiness
     read taken now against stories counted from a read taken minutes ago.
 
+    **The eight are one plan, run concurrently** (:func:`status_model.execute`). None of them needs
+    another's answer, so the row waits for the slowest read rather than for all eight in a line; the
+    pool caps how many reach the server at once. The same ``fresh`` goes to every read in it, so
+    running them together changes when they are asked and nothing about which moment they describe.
+
+    ``stale`` lets the plan paint answers past their window while the pool asks for them again
+    (FR13), and the row says so: :attr:`ProjectView.refreshing` is set while any of them is
+    outstanding, and :func:`revalidate_project` is what replaces the row once they are back.
+
     **The integrity check is read here rather than beside the badge** (FR17). Inside the survey it
     goes through the pool like every other read and is therefore behind FR13's freshness cache; read
     where it is rendered it would be uncached and would run again on every repaint, which for a
     sweep over thirteen invariants and a foreign-key check is a cost paid per keystroke.
     """
-    epics = await rows(pool, root, EPICS, fresh=fresh)
-    stories = await rows(pool, root, STORIES, fresh=fresh)
-    specs = await rows(pool, root, SPECS, fresh=fresh)
-    retros = await rows(pool, root, RETROS, fresh=fresh)
-    edges = await dependencies(pool, root, fresh=fresh)
-    gating = await gating_kinds(pool, root, fresh=fresh)
-    ready = await ready_epic_ids(pool, root, fresh=fresh)
-    broken = await violations(pool, root, fresh=fresh)
+    planned = await execute(
+        {
+            "epics": rows(pool, root, EPICS, fresh=fresh, stale=stale),
+            "stories": rows(pool, root, STORIES, fresh=fresh, stale=stale),
+            "specs": rows(pool, root, SPECS, fresh=fresh, stale=stale),
+            "retros": rows(pool, root, RETROS, fresh=fresh, stale=stale),
+            "edges": dependencies(pool, root, fresh=fresh, stale=stale),
+            "gating": gating_kinds(pool, root, fresh=fresh, stale=stale),
+            "ready": ready_epic_ids(pool, root, fresh=fresh, stale=stale),
+            "broken": violations(pool, root, fresh=fresh, stale=stale),
+        }
+    )
+    epics, stories, specs, retros, edges, gating, ready, broken = planned.values.values()
 
     index = {row["id"]: row for row in (*epics, *stories)}
     grouped = by_epic(stories)
@@ -337,6 +548,8 @@ async def read_view(pool: ServerPool, root: Path, name: str, *, fresh: bool = Fa
         epics=tuple(views),
         progress=progress(stories),
         violations=broken,
+        read_time=planned.critical_path,
+        refreshing=pool.revalidating(root),
     )
 
 
@@ -346,10 +559,14 @@ async def read_document_preview(pool: ServerPool, root: Path, row: EpicView) ->
     The read tool is named for the kind, so the kind is on the row rather than guessed from the
     id: ``read_spec`` refuses an id that turns out to be an epic rather than answering for it.
     """
-    document = await pool.read(root, DOCUMENT_READS[row.kind], {"id": row.id})
-    sections = await rows(pool, root, SECTIONS, {"document_id": row.id, "include_body": True})
+    planned = await execute(
+        {
+            "document": pool.read(root, DOCUMENT_READS[row.kind], {"id": row.id}),
+            "sections": rows(pool, root, SECTIONS, {"document_id": row.id, "include_body": True}),
+        }
+    )
 
-    return document_preview(document, sections)
+    return document_preview(**planned.values)
 
 
 async def read_story_preview(pool: ServerPool, root: Path, row: StoryView) -> str:
@@ -358,10 +575,14 @@ async def read_story_preview(pool: ServerPool, root: Path, row: StoryView) -> st
     ``include_body`` on both, because the withheld column is the content in each case — a
     criterion's ``text`` is the criterion, and a task's ``description`` is what it says to do.
     """
-    criteria = await rows(pool, root, STORY_CRITERIA, {"story_id": row.id, "include_body": True})
-    tasks = await rows(pool, root, TASKS, {"story_id": row.id, "include_body": True})
+    planned = await execute(
+        {
+            "criteria": rows(pool, root, STORY_CRITERIA, {"story_id": row.id, "include_body": True}),
+            "tasks": rows(pool, root, TASKS, {"story_id": row.id, "include_body": True}),
+        }
+    )
 
-    return story_preview(row, criteria, tasks)
+    return story_preview(row, **planned.values)
 
 
 def previews(pool: ServerPool):
@@ -443,6 +664,10 @@ async def search_project(pool: ServerPool, project: ProjectView, query: str) ->
     the failure most likely to take a whole answer down rather than one row. It contributes nothing
     and says nothing; the projects that answered are the result.
 
+    A project whose server failed a moment ago costs nothing here either: the pool refuses its reads
+    at once with the state it failed in, rather than paying a Node boot and a drain to hear the same
+    failure again (see :meth:`ServerPool.unreadable`).
+
     ``Exception`` and not ``BaseException``, which is what keeps a cancellation out of it: this runs
     in a worker the board cancels when the search screen closes, and a cancelled read swallowed here
     would be a project silently missing from a list the user is still reading.
@@ -451,12 +676,16 @@ async def search_project(pool: ServerPool, project: ProjectView, query: str) ->
         return []
 
     try:
-        found = await hits(pool, project.path, query, limit=SEARCH_LIMIT)
-        sections = await rows(pool, project.path, SECTIONS)
+        planned = await execute(
+            {
+                "found": hits(pool, project.path, query, limit=SEARCH_LIMIT),
+                "sections": rows(pool, project.path, SECTIONS),
+            }
+        )
     except Exception:  # noqa: BLE001 — the containment boundary is the point (NFR2)
         return []
 
-    return resolve_hits(project, found, sections)
+    return resolve_hits(project, **planned.values)
 
 
 async def search_projects(pool: ServerPool, projects, query: str) -> list[Result]:
@@ -532,6 +761,55 @@ async def gaps_projects(pool: ServerPool, projects) -> list[Gap]:
     return [gap for found in rows_per_project for gap in found]
 
 
+async def diagnose_projects(pool: ServerPool, projects) -> Diagnostics:
+    """What ``Ctrl+D`` shows: each project's server and reads, as the pool has already recorded them.
+
+    **Read, not measured.** The pid, the reads in flight and the last line on stderr are the pool's
+    own state; the timings and the cache's outcomes are :mod:`metrics`' — the same figures ``board.py
+    stats`` prints. A second timer kept for this screen would be one that could disagree with them,
+    and the screen is for finding out why the board is slow, not for a second opinion on it.
+
+    The one thing asked for is each server's resident set, through ``ps`` (see
+    :meth:`ServerPool.memory`): once for every live server rather than once per row.
+
+    **Every figure from the pool's registry**, so one screen never mixes two. The surveys are timed
+    into it as well; the rasters, which no pool makes, are in it when it is the process's own.
+    """
+    memory = await pool.memory()
+    figures = pool.metrics
+    lines = []
+
+    for project in projects:
+        key = project.path.resolve()
+        named = str(key)
+        client = pool.running(key)
+        outcomes = figures.counted(CACHE, project=named)
+
+        lines.append(
+            Diagnosis(
+                name=project.name,
+                pending=project.pending,
+                pid=None if client is None else client.pid,
+                rss=memory.get(key),
+                in_flight=pool.in_flight(key),
+                first_row=figures.first(SURVEY, project=named),
+                last_read=figures.latest(READ, project=named),
+                hits=outcomes[HIT],
+                asked=sum(outcomes.values()),
+                said=client.diagnostics[-1] if client is not None and client.diagnostics else None,
+            )
+        )
+
+    rasters = figures.timing(RASTER)
+
+    return Diagnostics(
+        projects=tuple(lines),
+        rasters=rasters.count,
+        raster_p90=rasters.quantile(0.9) if rasters.count else None,
+        raster_last=figures.latest(RASTER),
+    )
+
+
 def registry_views(entries) -> list[ProjectView]:
     """Every registered project as a row, from the registry alone (NFR3).
 
@@ -574,7 +852,13 @@ async def survey_project(
         return replace(view, pending=False)
 
     try:
-        return await read_view(pool, view.path, view.name, fresh=fresh)
+        # Timed under the root as its server knows it, beside the pool's own figures for it, and
+        # only here: a row that is never read has no time to first row (see `diagnose_projects`).
+        with pool.metrics.timed(SURVEY, project=str(view.path.resolve())):
+            # Stale answers are painted unless the user asked for fresh ones, which is the one
+            # case where an answer past its window is exactly what they pressed the key to get
+            # rid of.
+            return await read_view(pool, view.path, view.name, fresh=fresh, stale=not fresh)
     except Unreadable as state:
         return _unreadable(view, state)
     except ServerNotFound as missing:
@@ -595,6 +879,21 @@ async def survey_project(
         return _unreadable(view, Unreadable(SERVER_FAILED, f"{type(unexpected).__name__}: {unexpected}"))
 
 
+async def revalidate_project(pool: ServerPool, view: ProjectView) -> ProjectView | None:
+    """A refreshing row once its owed re-reads are asked and back, or ``None`` if nothing changed.
+
+    ``None`` is the common answer and the reason this exists apart from :func:`survey_project`: an
+    answer past its window is nearly always still right, and a row rebuilt and repainted over
+    identical answers would flicker every project on the board once a window. When something did
+    change — or a re-read failed, which is a change too — the row is surveyed again, and every
+    answer it needs is now fresh in the cache.
+    """
+    if not await pool.settled(view.path):
+        return None
+
+    return await survey_project(pool, replace(view, refreshing=False))
+
+
 def _unreadable(view: ProjectView, state: Unreadable) -> ProjectView:
     """The row a project in a named state renders as: the state, and what to do about it (FR11)."""
     return replace(view, unreadable=state.state, remedy=state.remedy, pending=False)
@@ -612,6 +911,16 @@ PREVIEWED = ("epic", "story")
 #: user just ended stops being reported while they are still looking at the row it was on.
 LIVE_POLL = 2.0
 
+#: How many projects the board surveys at once.
+#:
+#: **Every survey may be a spawn**, so this is the bound on Node processes starting together: a
+#: hundred-project registry read all at once is a hundred handshakes competing for the same cores,
+#: and the project under the cursor finishes when the hundredth does. Bounded, the rest wait their
+#: turn in priority order (see :class:`PriorityGate`) — and a warm cache answers most of them
+#: without a spawn, so the slots turn over in milliseconds. A row painted stale is refreshed through
+#: the same slots, after every first survey (see :meth:`BoardApp._urgency`).
+SURVEY_WIDTH = 8
+
 
 @dataclass(frozen=True)
 class Command:
@@ -645,6 +954,11 @@ COMMANDS: tuple[Command, ...] = (
         "List every requirement no coverage row names, across every registered project",
         "coverage_gaps",
     ),
+    Command(
+        "Diagnostics",
+        "Each project's server, memory and reads, and the preview raster's times",
+        "diagnostics",
+    ),
     Command("Register a project", "Choose a directory to add to the board", "register"),
     Command("Refresh", "Read every registered project again", "refresh"),
     Command("Show/hide done", "Show or hide complete, superseded and withdrawn rows", "toggle_retired"),
@@ -788,6 +1102,122 @@ MINIMUM_RASTER = 10
 #: characters. See :func:`_panel_width`.
 FALLBACK_WIDTH = 80
 
+#: How long a panel's width has to hold still before the preview is rasterised at it, in seconds.
+#: Dragging a terminal split delivers a resize per column crossed; a raster per resize is work for
+#: widths nobody will see, and this is short enough that the one that is seen is not waited for.
+RESIZE_SETTLE = 0.05
+
+#: How long the cursor has to rest on a row before its preview is read, in seconds. A held arrow
+#: key repeats faster than this — thirty times a second is usual — so the rows it passes over are
+#: never read at all; a single keypress waits a few frames longer for its preview.
+PREVIEW_SETTLE = 0.06
+
+#: A preview this many characters long or longer is laid out a section at a time, as it is scrolled
+#: to, rather than whole before any of it is shown — see :class:`Sections`. Below it a whole raster
+#: takes a few milliseconds, and one piece is simpler than several.
+PROGRESSIVE_AT = 64 * 1024
+
+#: Sections shorter than this are laid out with the one after them, and a section longer than the
+#: second is cut at a paragraph break — so a spec of a thousand one-line sections is not a thousand
+#: rasters, and a spec that is one enormous section is not one.
+SECTION_MIN = 2 * 1024
+SECTION_MAX = 16 * 1024
+
+#: Lines beyond the visible ones, each way, laid out before the reader scrolls to them; and lines
+#: beyond which a section laid out earlier is let go again.
+AHEAD = 100
+KEEP = 400
+
+#: A line a section may begin at: a heading, outside a fence.
+SECTION_HEADING = re.compile(r"#{1,6}\s")
+FENCE = re.compile(r"\s{0,3}(```|~~~)")
+
+#: How much the rasters kept for reuse may hold, in bytes as :meth:`Rasters.weigh` estimates them.
+#: A few hundred ordinary previews, or a few dozen spec-sized ones at two widths each — which is
+#: every document a session moves between, at a size nobody will notice the board holding.
+RASTER_BUDGET = 16 * 2**20
+
+
+class Rasters:
+    """Rasters already made, by source and width, least recently used first and within a budget (NFR3).
+
+    **A raster is a function of its source and its width and nothing else**, so the one made the
+    last time a document was shown at this width is the one it would be made into again. Without
+    this it is made again on every visit: a cursor moving back and forth between two epics lays
+    each out in full every time it lands, and so does every resize of either panel. With it, a
+    revisit is a digest and a dictionary lookup.
+
+    Keyed on a digest of the source rather than the source: a spec-sized document held as the key
+    as well as inside its raster would count twice against a budget that only counts it once. And on
+    the width as laid out, after :data:`MINIMUM_RASTER`, so the widths that draw the same raster
+    are one entry.
+
+    Locked, because previews are rasterised off the event loop (see :meth:`BoardApp._fill_preview`)
+    as well as on it. What a fallback returns — a source the renderer could not take — is not kept:
+    it is cheap to make, and a renderer that fails once is not one whose answer should be memorised.
+    """
+
+    def __init__(self, budget: int = RASTER_BUDGET) -> None:
+        self.budget = budget
+        #: What the kept rasters weigh between them, against :attr:`budget`.
+        self.bytes = 0
+        self._kept: OrderedDict[tuple[bytes, int], tuple[Content, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(markup: str, width: int) -> tuple[bytes, int]:
+        digest = hashlib.blake2b(markup.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+        return digest, max(width, MINIMUM_RASTER)
+
+    @staticmethod
+    def weigh(content: Content) -> int:
+        """An estimate of what a raster holds: its text, and a style run per span."""
+        return len(content.plain) * 4 + len(content.spans) * 96
+
+    def get(self, key: tuple[bytes, int]) -> Content | None:
+        with self._lock:
+            found = self._kept.get(key)
+
+            if found is None:
+                return None
+
+            self._kept.move_to_end(key)
+
+            return found[0]
+
+    def put(self, key: tuple[bytes, int], content: Content) -> None:
+        """Keep ``content``, dropping the least recently used until it fits. One larger than the
+        whole budget is not kept at all — it would only empty the cache to hold itself."""
+        weight = self.weigh(content)
+
+        if weight > self.budget:
+            return
+
+        with self._lock:
+            previous = self._kept.pop(key, None)
+            self.bytes -= previous[1] if previous is not None else 0
+
+            while self._kept and self.bytes + weight > self.budget:
+                _, (_, dropped) = self._kept.popitem(last=False)
+                self.bytes -= dropped
+
+            self._kept[key] = content, weight
+            self.bytes += weight
+
+    def __len__(self) -> int:
+        return len(self._kept)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._kept.clear()
+            self.bytes = 0
+
+
+#: The board's rasters, for every panel and both previews — a document is the same raster whichever
+#: panel shows it.
+RASTER_CACHE = Rasters()
+
 
 class HardBreakMarkdown(Markdown):
     """`Markdown` that renders a single newline as a line break, GitHub-style (FR6).
@@ -818,7 +1248,9 @@ def markdown_content(markup: str, width: int) -> Content:
     keeps every heading, emphasis, list and table Rich would draw and gives the selection back.
 
     The raster is width-specific — that is what the width argument means — so the caller re-renders
-    it when the panel resizes.
+    it when the panel resizes. Made once per source and width, and kept (see :class:`Rasters`): a
+    revisit or a resize back to a width already seen is answered from :data:`RASTER_CACHE`, and only
+    a raster actually made is timed under :data:`metrics.RASTER`.
 
     **No colour system is named** (NFR3, ENVX4). The segments this produces carry `Style` objects
     rather than escape codes, and Textual downgrades them at output against the terminal it actually
@@ -834,11 +1266,23 @@ def markdown_content(markup: str, width: int) -> Content:
     markdown unrendered is worse than showing it rendered and better than every other outcome: the
     reader still has the text.
     """
+    key = Rasters.key(markup, width)
+    kept = RASTER_CACHE.get(key)
+    METRICS.count(RASTERS, HIT if kept is not None else MISSED)
+
+    if kept is not None:
+        return kept
+
     try:
-        return _rasterised(markup, width)
+        with METRICS.timed(RASTER):
+            content = _rasterised(markup, width)
     except Exception:
         return Content(markup)
 
+    RASTER_CACHE.put(key, content)
+
+    return content
+
 
 def _rasterised(markup: str, width: int) -> Content:
     """The render itself. Separate so the guard above has one expression to wrap."""
@@ -1120,6 +1564,75 @@ class GapsScreen(ModalScreen[Gap | None]):
         self.dismiss(None)
 
 
+class DiagnosticsScreen(ModalScreen[None]):
+    """Why the board is slow, without leaving it: each project's server and reads, live (NFR3).
+
+    A modal for the other two screens' reason — it is a question about the board, and the columns
+    behind it are what the answer is about. Usually about one of them in particular: a row still
+    saying "reading…" long after its neighbours have filled in, and whether that is a server that
+    never started, one that started and has not answered, or a survey still queued for a slot.
+
+    **Re-read every :attr:`EVERY` seconds while it is up**, each in a worker that replaces the last
+    (NFR3), because the interesting case is a project that is *about* to answer and a table frozen
+    at the moment it opened would never show it doing so.
+    """
+
+    BINDINGS = [("escape", "cancel", "Close")]
+
+    #: Seconds between re-reads of the figures.
+    EVERY = 1.0
+
+    RUNNING = "Reading the pool…"
+
+    def __init__(self, projects: list[ProjectView], diagnose) -> None:
+        super().__init__()
+        self._projects = projects
+        self._diagnose = diagnose
+        self._diagnostics: Diagnostics | None = None
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="diagnostics"):
+            yield Label("Servers, reads and the preview raster", id="diagnostics-title")
+            yield Static(self.RUNNING, id="diagnostics-table")
+            yield Static("", id="diagnostics-raster")
+
+    def on_mount(self) -> None:
+        if self._diagnose is None:
+            return
+
+        self._reread()
+        self.set_interval(self.EVERY, self._reread)
+
+    @property
+    def diagnostics(self) -> Diagnostics | None:
+        """The figures last painted, or ``None`` before the first read has landed.
+
+        Public for :attr:`GapsScreen.results`' reason: it is how a driver knows the worker landed.
+        What was shown is read off the painted table.
+        """
+        return self._diagnostics
+
+    def _reread(self) -> None:
+        self.run_worker(self._run(), exclusive=True)
+
+    async def _run(self) -> None:
+        self._diagnostics = found = await self._diagnose(self._projects)
+
+        table = Table(box=None, pad_edge=False, expand=True)
+
+        for heading in DIAGNOSIS_COLUMNS:
+            table.add_column(heading, no_wrap=heading != "state")
+
+        for row in found.projects:
+            table.add_row(*row.cells, style=READING_STYLE if row.pending else None)
+
+        self.query_one("#diagnostics-table", Static).update(table)
+        self.query_one("#diagnostics-raster", Static).update(found.raster_label)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+
 class BoardCommands(Provider):
     """The palette's source of commands — :data:`COMMANDS` and nothing else (FR18).
 
@@ -1225,6 +1738,167 @@ def _marked_row(summary: str, *, badge: str, pill: str) -> Table:
     return grid
 
 
+def sections_of(source: str) -> list[str]:
+    """``source`` cut into pieces that each render as they would in place (FR6, NFR3).
+
+    At headings, because a heading starts a block that owes nothing to the one before it — and
+    never inside a fence, where a line that looks like a heading is code. Sections under
+    :data:`SECTION_MIN` go with the next; one over :data:`SECTION_MAX` is cut at its next blank line
+    outside a fence, which is a paragraph break and loses nothing but a loose list's looseness.
+    """
+    pieces: list[str] = []
+    current: list[str] = []
+    size = 0
+    fenced = False
+
+    for line in source.split("\n"):
+        if FENCE.match(line):
+            fenced = not fenced
+
+        heading = not fenced and SECTION_HEADING.match(line) and size >= SECTION_MIN
+        paragraph = not fenced and not line.strip() and size >= SECTION_MAX
+
+        if heading or paragraph:
+            pieces.append("\n".join(current).strip("\n"))
+            current, size = [], 0
+
+        current.append(line)
+        size += len(line) + 1
+
+    pieces.append("\n".join(current).strip("\n"))
+
+    return [piece for piece in pieces if piece.strip()]
+
+
+@dataclass
+class Sections:
+    """A long preview, laid out a section at a time as the panel scrolls to it (FR6, NFR3).
+
+    **What the reader sees first costs what it costs, however long the document is.** Laid out
+    whole, a spec of a few hundred sections held its panel blank until its last line was placed,
+    and kept every line as `Content` for as long as it was up. This lays out the sections from the
+    top until the panel is full and :data:`AHEAD` lines past it, paints them, and lays out the rest
+    as the panel is scrolled towards them — so the first line of a megabyte spec is up as soon as
+    the first line of a short one.
+
+    **Heights are kept; rasters are not.** Every section laid out so far has a known height at this
+    width, which is what places the next one and what the scrollbar is measured against. A section
+    more than :data:`KEEP` lines off screen is let go, and laid out again if it is scrolled back to.
+    What the panel paints is only the run of sections it holds, with the lines above and below it
+    as padding (:meth:`window`) — so the page does not move under the reader when a section goes,
+    and a repaint wraps the few hundred lines near the screen rather than every line passed.
+    """
+
+    pieces: list[str]
+    width: int
+    #: The height of each section laid out so far, in order from the first: the frontier.
+    heights: list[int] = field(default_factory=list)
+    #: The rasters held, by section — those within :data:`KEEP` lines of the screen.
+    rasters: dict[int, Content] = field(default_factory=dict)
+
+    @classmethod
+    def lay_out(cls, source: str, width: int, lines: int, *, through: int = 0) -> "Sections":
+        """Cut ``source`` and lay out enough of it to fill ``lines`` past section ``through``.
+
+        Pure, so it runs off the event loop. ``through`` is for a resize: a panel scrolled to the
+        fortieth section needs the thirty-nine above it measured at the new width, to know where
+        the fortieth starts — their heights, and not their rasters.
+        """
+        sections = cls(sections_of(source), width)
+
+        while not sections.done:
+            index = len(sections.heights)
+
+            if index > through and sections.end > sections.start(through) + lines:
+                break
+
+            sections.take(index, markdown_content(sections.pieces[index], width))
+
+            if index < through:
+                sections.rasters.pop(index)
+
+        return sections
+
+    @property
+    def done(self) -> bool:
+        return len(self.heights) == len(self.pieces)
+
+    @property
+    def end(self) -> int:
+        """The line the laid-out sections reach."""
+        return self.start(len(self.heights))
+
+    def start(self, index: int) -> int:
+        """The line section ``index`` starts at, one blank line after the one above it."""
+        return sum(self.heights[:index]) + index
+
+    def take(self, index: int, raster: Content) -> None:
+        """Hold ``raster`` as section ``index``, the frontier's next or one let go earlier."""
+        self.rasters[index] = raster
+
+        if index == len(self.heights):
+            self.heights.append(raster.plain.count("\n") + 1)
+
+    def wanted(self, top: int, bottom: int) -> int | None:
+        """The next section to lay out for a screen showing lines ``top`` to ``bottom``, if any.
+
+        Nearest the screen first: one let go that is back within :data:`AHEAD` lines, and then the
+        frontier's next if the laid-out sections stop short of the screen's bottom and AHEAD past it.
+        """
+        start = 0
+
+        for index, height in enumerate(self.heights):
+            if index not in self.rasters and start < bottom + AHEAD and start + height > top - AHEAD:
+                return index
+
+            start += height + 1
+
+        if not self.done and self.end < bottom + AHEAD:
+            return len(self.heights)
+
+        return None
+
+    def let_go(self, top: int, bottom: int) -> bool:
+        """Drop rasters more than :data:`KEEP` lines off screen; whether any were."""
+        far = [
+            index
+            for index in self.rasters
+            if self.start(index) > bottom + KEEP
+            or self.start(index) + self.heights[index] < top - KEEP
+        ]
+
+        for index in far:
+            del self.rasters[index]
+
+        return bool(far)
+
+    def at(self, line: int) -> int:
+        """The section painted at ``line``, or the last laid out."""
+        for index in range(len(self.heights)):
+            if self.start(index + 1) > line:
+                return index
+
+        return max(len(self.heights) - 1, 0)
+
+    def window(self) -> tuple[int, Content, int]:
+        """What the panel paints: the lines above the sections held, those sections, the lines below.
+
+        A section let go between two held ones — scrolled past quickly enough that nothing near it
+        was asked for — is its height in blank lines, which keeps the ones after it in their place.
+        """
+        if not self.rasters:
+            return self.end, Content(""), 0
+
+        first, last = min(self.rasters), max(self.rasters)
+        held = Content("\n\n").join(
+            self.rasters.get(index) or Content("\n" * (self.heights[index] - 1))
+            for index in range(first, last + 1)
+        )
+        below = max(self.end - self.start(last + 1), 0)
+
+        return self.start(first), held, below
+
+
 class PreviewBody(Static):
     """A preview panel's body: markdown source, rasterised at whatever width the panel has (FR6).
 
@@ -1234,6 +1908,25 @@ class PreviewBody(Static):
     width the panel had a moment ago — which is the stale layout the re-render exists to replace,
     written one step later. A widget's own `Resize` is delivered with its new size, which is the
     only width worth rasterising at.
+
+    **And the re-render is off the event loop, as the first render is** (NFR3). A resize is the one
+    raster :meth:`BoardApp._fill_preview` does not make, and it arrives once per column a dragged
+    split crosses: rendered here and now, a spec-sized preview froze the whole board for every one
+    of them. So a resize waits :data:`RESIZE_SETTLE` for the width to stop changing, rasterises on a
+    thread, and paints only if that width and that source are still the panel's when it lands.
+
+    **One raster in flight, and the latest width next.** A thread cannot be cancelled, so a raster
+    started per settled width would leave a drag slower than the settle queueing one behind another
+    for widths already gone. Resizes that arrive while one is running only move the width; when it
+    lands and the panel has moved on, it is dropped and the panel is rasterised once more at wherever
+    it is now — every width in between is never made. Until then the old raster stays up: laid out
+    for a moment-old width, which a reader can read, rather than blank, which they cannot.
+
+    **A long source is laid out as it is scrolled to** (see :class:`Sections`), by one worker at a
+    time that lays out the section nearest the screen that is missing and paints, until none is.
+    The scrollbar measures what has been laid out so far and grows as the reader nears its end. A
+    resize lays the document out again from the top, as far as the section on screen — heights and
+    not rasters for the ones above it — and puts that section back where the reader was.
     """
 
     def __init__(self, **kwargs: object) -> None:
@@ -1242,6 +1935,17 @@ class PreviewBody(Static):
         #: The markdown last put in this panel. Held because the raster is width-specific and a
         #: painted `Content` cannot be reflowed back into the markdown it came from.
         self.source = ""
+        # The resize waiting for the width to settle, restarted by each one after it; and whether a
+        # raster is already being made for one, which looks at the width again when it lands.
+        self._settling: Timer | None = None
+        self._reflowing = False
+        # A long source's sections, when that is what is up; and whether a worker is laying more of
+        # them out, which looks at the screen again after each.
+        self._sections: Sections | None = None
+        self._extending = False
+
+    def on_mount(self) -> None:
+        self.watch(self.parent, "scroll_y", self._follow, init=False)
 
     def show(self, source: str) -> None:
         """Put ``source`` in the panel, rendered here and now.
@@ -1259,12 +1963,122 @@ class PreviewBody(Static):
         again at the next width. A `Content` cannot be reflowed back into the markdown it came from.
         """
         self.source = source
+        self._sections = None
+        self.styles.padding = 0
 
         self.update(content)
 
+    def place_sections(self, source: str, sections: Sections) -> None:
+        """Take a long source's first sections, and lay out the rest as the panel is scrolled."""
+        self.source = source
+        self._sections = sections
+
+        self._paint(sections)
+        self._follow()
+
+    def _paint(self, sections: Sections) -> None:
+        above, held, below = sections.window()
+        self.styles.padding = (above, 0, below, 0)
+
+        self.update(held)
+
+    def screen_lines(self) -> tuple[int, int]:
+        """The first line the panel shows and the line after its last."""
+        top = round(self.parent.scroll_y)
+
+        return top, top + self.parent.size.height
+
+    def _follow(self, *_: object) -> None:
+        """Lay out whatever the screen has come near, unless a worker already is."""
+        if self._sections is not None and not self._extending:
+            self._extending = True
+            self.run_worker(self._extend(self._sections), group="sections")
+
+    async def _extend(self, sections: Sections) -> None:
+        try:
+            while self._sections is sections:
+                top, bottom = self.screen_lines()
+                let_go = sections.let_go(top, bottom)
+                index = sections.wanted(top, bottom)
+
+                if index is None:
+                    if let_go:
+                        self._paint(sections)
+
+                    return
+
+                raster = await asyncio.to_thread(
+                    markdown_content, sections.pieces[index], sections.width
+                )
+
+                if self._sections is sections:
+                    sections.take(index, raster)
+                    self._paint(sections)
+        finally:
+            self._extending = False
+
     def on_resize(self, event: object) -> None:
         """Render the same source again, because the raster was laid out at the old width."""
-        self.update(self.rasterise(self.source))
+        # Sections laid out grow the panel, and a panel that grew is not one to lay out again.
+        if self._sections is not None and self._sections.width == _panel_width(self):
+            return
+
+        if self._settling is not None:
+            self._settling.stop()
+
+        self._settling = self.set_timer(RESIZE_SETTLE, self._reflow)
+
+    def _reflow(self) -> None:
+        """Rasterise at the width the panel settled at, unless a raster in flight will look again."""
+        self._settling = None
+
+        if not self._reflowing:
+            self._reflowing = True
+            self.run_worker(self._reflowed(), group="reflow")
+
+    async def _reflowed(self) -> None:
+        try:
+            while True:
+                source, width = self.source, _panel_width(self)
+
+                if self._sections is not None:
+                    if await self._relaid(source, width):
+                        return
+
+                    continue
+
+                content = (
+                    await asyncio.to_thread(markdown_content, source, width)
+                    if source
+                    else Content("")
+                )
+
+                if (self.source, _panel_width(self)) == (source, width):
+                    self.update(content)
+
+                    return
+        finally:
+            self._reflowing = False
+
+    async def _relaid(self, source: str, width: int) -> bool:
+        """Lay a long source out again at ``width``, and scroll back to the section on screen.
+
+        Whether it was painted: not if the panel moved on while it was laid out.
+        """
+        sections = self._sections
+        top, bottom = self.screen_lines()
+        through = sections.at(top)
+        laid = await asyncio.to_thread(
+            Sections.lay_out, source, width, bottom - top, through=through
+        )
+
+        if self._sections is not sections or _panel_width(self) != width:
+            return False
+
+        self.place_sections(source, laid)
+        self.call_after_refresh(self.parent.scroll_to, y=laid.start(through), animate=False)
+
+        return True
 
     def rasterise(self, source: str) -> Content:
         """``source`` at this panel's width. Pure, so it can be run off the event loop."""
@@ -1314,6 +2128,149 @@ def _preview_panel(kind: str) -> VerticalScroll:
     return panel
 
 
+#: Rows each side of the cursor whose previews are read before the cursor gets there.
+PREFETCH_ROWS = 3
+
+#: The raster slot previews read ahead are made in — one of their own, so the panels' slots, which
+#: the cursor's rasters queue in, never hold one (see :meth:`BoardApp._rasterise_for`).
+AHEAD_SLOT = "ahead"
+
+#: How many characters of preview read ahead of the cursor the board holds, all panels together. A
+#: preview over it is read for the cursor when it arrives and never ahead of it.
+PREFETCH_BUDGET = 4 * 2**20
+
+
+def neighbours(rows: Sequence[Any], index: int, reach: int) -> list[Any]:
+    """The rows within ``reach`` of ``index``, nearest first, and the one below before the one above.
+
+    Below first because a column is read downwards: the row a cursor reaches next is far more
+    often the one under it than the one it just left.
+    """
+    near = []
+
+    for distance in range(1, reach + 1):
+        near += [rows[n] for n in (index + distance, index - distance) if 0 <= n < len(rows)]
+
+    return near
+
+
+class ReadAhead:
+    """Previews read before the cursor reached their rows, least recently used let go first (NFR3).
+
+    **Held against the row they were read for, and answered only for that row.** An epic is the
+    same row until a survey says something about it changed — its state, its progress, its stories
+    — and a row that compares unequal to the one read ahead is one whose preview may have changed
+    too, so it is read again rather than painted from what it was. For the document bodies a row
+    does not carry, a project's previews are let go (:meth:`forget`) when a survey of it lands with
+    anything different, or fresh — a write to its database — and no other project's are.
+
+    Within :data:`PREFETCH_BUDGET` characters, because what is read ahead is what the cursor may
+    never visit: a handful of spec-sized documents each side of it is memory held on a guess.
+    """
+
+    def __init__(self, budget: int = PREFETCH_BUDGET) -> None:
+        self.budget = budget
+        #: Characters held between them, against :attr:`budget`.
+        self.size = 0
+        self._held: OrderedDict[tuple[Path, str, str], tuple[object, str]] = OrderedDict()
+
+    @staticmethod
+    def key(root: Path, row: EpicView | StoryView) -> tuple[Path, str, str]:
+        return root, type(row).__name__, row.id
+
+    def get(self, root: Path, row: EpicView | StoryView) -> str | None:
+        key = self.key(root, row)
+        found = self._held.get(key)
+
+        if found is None or found[0] != row:
+            return None
+
+        self._held.move_to_end(key)
+
+        return found[1]
+
+    def put(self, root: Path, row: EpicView | StoryView, text: str) -> bool:
+        """Hold ``text`` for ``row``, dropping the least recently used until it fits; whether it was."""
+        if len(text) > self.budget:
+            return False
+
+        key = self.key(root, row)
+        previous = self._held.pop(key, None)
+        self.size -= len(previous[1]) if previous is not None else 0
+
+        while self._held and self.size + len(text) > self.budget:
+            _, (_, dropped) = self._held.popitem(last=False)
+            self.size -= len(dropped)
+
+        self._held[key] = row, text
+        self.size += len(text)
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self._held)
+
+    def forget(self, root: Path) -> None:
+        """Let go of every preview read ahead in the project at ``root``."""
+        for key in [key for key in self._held if key[0] == root]:
+            self.size -= len(self._held.pop(key)[1])
+
+
+class PriorityGate:
+    """At most ``width`` holders at once, the rest admitted best-ranked first as slots free up.
+
+    **Ranked when a slot frees, not when a caller arrives.** The order a board wants is about where
+    the user is looking — the highlighted project, then the rows on screen — and that changes every
+    time the cursor moves. A queue sorted on arrival would keep serving the order the board opened
+    in; ranking each waiter at the moment a slot is handed out means a row the cursor has just
+    reached jumps the queue with nothing having to tell the gate it moved.
+
+    ``rank`` takes what each caller waits under and returns something sortable, lowest first.
+    """
+
+    def __init__(self, width: int, rank: Callable[[Any], Any]) -> None:
+        self.width = width
+        self._rank = rank
+        self._holding = 0
+        self._waiting: list[tuple[Any, asyncio.Future]] = []
+
+    @asynccontextmanager
+    async def slot(self, key: Any):
+        if self._holding < self.width and not self._waiting:
+            self._holding += 1
+        else:
+            admitted = asyncio.get_running_loop().create_future()
+            self._waiting.append((key, admitted))
+
+            try:
+                await admitted
+            except asyncio.CancelledError:
+                # Either still waiting — leave the queue — or admitted in the same tick the caller
+                # was cancelled, in which case the slot it was handed goes to the next in line.
+                if admitted.done() and not admitted.cancelled():
+                    self._release()
+                else:
+                    self._waiting = [entry for entry in self._waiting if entry[1] is not admitted]
+
+                raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        self._holding -= 1
+
+        while self._waiting and self._holding < self.width:
+            best = min(range(len(self._waiting)), key=lambda at: self._rank(self._waiting[at][0]))
+            _, admitted = self._waiting.pop(best)
+
+            if not admitted.done():
+                self._holding += 1
+                admitted.set_result(None)
+
+
 class BoardApp(App[None]):
     """The three-column browser: Projects → Epics → Stories, previews beneath (FR4, ENV7).
 
@@ -1378,6 +2335,9 @@ class BoardApp(App[None]):
         # unshifted `g` would sit among launch, open, attach and copy, where every other key acts on
         # the row under the cursor and this one does not.
         ("ctrl+g", "coverage_gaps", "Gaps"),
+        # `ctrl+d` for diagnostics, on a modified key for `ctrl+g`'s reason: it is about the board
+        # rather than the row under the cursor, and the CPM board binds no modified key at all.
+        ("ctrl+d", "diagnostics", "Diagnostics"),
         # FR8's four. Single letters because they are the board's working keys — the thing a user
         # opens it to do — and each is in the palette too, so the capability is discoverable
         # without the footer being read at the moment it happens to be needed.
@@ -1515,6 +2475,25 @@ class BoardApp(App[None]):
     #gaps-results {
         height: 1fr;
     }
+    /* The diagnostics screen (NFR3). The search screen's width, because its rows carry eight
+       figures and the last line a server wrote to stderr. */
+    DiagnosticsScreen {
+        align: center middle;
+    }
+    #diagnostics {
+        width: 110;
+        height: 28;
+        border: solid $panel;
+        background: $surface;
+    }
+    #diagnostics-title, #diagnostics-raster {
+        padding: 0 1;
+        color: $text-muted;
+    }
+    #diagnostics-table {
+        height: 1fr;
+        padding: 0 1;
+    }
     """
 
     def __init__(
@@ -1523,6 +2502,7 @@ class BoardApp(App[None]):
         *,
         reader=None,
         survey=None,
+        revalidate=None,
         reload=None,
         register=None,
         unregister=None,
@@ -1532,6 +2512,8 @@ class BoardApp(App[None]):
         clear_cache=None,
         search=None,
         gaps=None,
+        watch=None,
+        diagnose=None,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -1547,6 +2529,11 @@ class BoardApp(App[None]):
         #: passed straight through: the app holds no cache and knows nothing about one.
         self._survey = survey
 
+        #: ``async (ProjectView) -> ProjectView | None`` — a row painted from stale answers, once the
+        #: pool has asked for them again (FR13): the rebuilt row, or ``None`` when nothing changed.
+        #: Injected beside ``survey`` because it is the second half of the same read.
+        self._revalidate = revalidate
+
         #: ``async (projects, query) -> list[Result]`` — every project's hits for one query (FR15).
         #: Injected like every other read: the app owns no pool, and the fan-out is the one action
         #: that would otherwise have it talking to twelve servers at once.
@@ -1563,6 +2550,17 @@ class BoardApp(App[None]):
         #: the key would delete the *user's* own cache file.
         self._forget = clear_cache
 
+        #: ``async (roots, changed) -> None`` — run until cancelled, calling ``changed(root)`` when a
+        #: project's database has been written (see :mod:`watcher`). Injected, and off unless the
+        #: board was asked for it: a default would have every test that stands the app up watching
+        #: directories, and the user's own projects among them.
+        self._watch = watch
+
+        #: ``async (projects) -> Diagnostics`` — what the pool has recorded about each project's
+        #: server and reads (NFR3). Injected because the app owns no pool, and it is the one
+        #: injection that only reads what the others have already done.
+        self._diagnose = diagnose
+
         #: ``() -> list[ProjectView]`` — the registry, re-read. Injected rather than read here for
         #: the same reason as the two above: the app owns no registry file any more than it owns a
         #: pool, and a default that fell back to the real one would have a test refreshing the
@@ -1610,6 +2608,19 @@ class BoardApp(App[None]):
         #: Per panel, the id of the row whose preview is being awaited — see :meth:`_preview`.
         self._awaited: dict[str, str] = {}
 
+        #: Per panel, the raster last started on a thread — see :meth:`_rasterise_for`.
+        self._rastering: dict[str, asyncio.Future] = {}
+
+        #: Previews read for the rows around the cursor, and the panels whose previews are being
+        #: read for the cursor now or read ahead of it — see :meth:`_read_ahead_of`.
+        self._read_ahead = ReadAhead()
+        self._filling: set[str] = set()
+        self._looking_ahead: set[str] = set()
+
+        #: Projects whose databases were written while their first survey was reading — see
+        #: :meth:`database_changed`.
+        self._written: set[Path] = set()
+
         #: The epics `space` has put in the ralph selection (FR14), by id.
         #:
         #: **Ids, not rows.** Every survey replaces the row objects, so a held row would be one that
@@ -1621,6 +2632,11 @@ class BoardApp(App[None]):
         #: project contributes nothing to another's launch, and comes back intact on returning to it.
         self._ralph: set[str] = set()
 
+        #: The surveys' slots, and the refreshes': :data:`SURVEY_WIDTH` at once, handed out by where
+        #: each project sits relative to the cursor and the viewport at the moment one frees (see
+        #: :meth:`_urgency`).
+        self._surveying = PriorityGate(SURVEY_WIDTH, self._urgency)
+
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1647,6 +2663,7 @@ class BoardApp(App[None]):
         self.query_one("#projects", OptionList).focus()
         self.start_survey()
         self.start_pills()
+        self.start_watching()
 
     # --- reading -------------------------------------------------------------
 
@@ -1661,6 +2678,12 @@ class BoardApp(App[None]):
         Nothing is awaited in this method, which is the requirement: it is called from
         ``on_mount`` and has to return before the first paint.
 
+        **Started together, admitted a few at a time.** Each worker waits for one of
+        :data:`SURVEY_WIDTH` slots before it reads, so a long registry does not start every server
+        at once; which waiter a freed slot goes to is decided then, by the cursor (see
+        :meth:`_urgency`), so the project a user is looking at is never queued behind the ones
+        they are not.
+
         ``indices`` narrows it to some of the rows. A registration adds one project, and putting
         every other row back to `reading…` and re-spawning its server for that is a board-wide
         flicker over a change that touched one of them.
@@ -1685,7 +2708,8 @@ class BoardApp(App[None]):
         project can legitimately appear twice under two names, so matching on identity would be
         matching on a value that is no longer there or is not unique.
         """
-        filled = await self._survey(project, fresh=fresh)
+        async with self._surveying.slot((index, False)):
+            filled = await self._survey(project, fresh=fresh)
 
         if index >= len(self.selection.projects):
             return
@@ -1693,8 +2717,77 @@ class BoardApp(App[None]):
         # The live count is the pill poll's answer, not the survey's, and the two land
         # independently: a survey that replaced the row wholesale would drop a pill that arrived
         # while it was reading.
-        self.selection.projects[index] = replace(filled, live=self.selection.projects[index].live)
+        landed = replace(filled, live=self.selection.projects[index].live)
+
+        if fresh or landed != self.selection.projects[index]:
+            self._read_ahead.forget(landed.path)
+
+        self.selection.projects[index] = landed
+        self._place_project(index)
+
+        if landed.path in self._written:
+            self.database_changed(landed.path)
+
+        if filled.refreshing and self._revalidate is not None:
+            await self._refresh_project(index, self.selection.projects[index])
+
+    def _urgency(self, waiting: tuple[int, bool]) -> tuple[bool, int, int]:
+        """Which waiting survey goes next: the highlighted project, then the ones on screen.
+
+        Registry order within each band, which is the order the column is painted in — so the rows
+        on screen fill top to bottom rather than in whatever order their workers happened to queue.
+
+        ``waiting`` is the row's index and whether it is a refresh. **Every refresh ranks after
+        every first survey**: a row being refreshed already shows something, and one still reading
+        shows nothing — so a project the cursor reaches while the board revalidates is read before
+        any of the rows that are only being checked.
+        """
+        index, refresh = waiting
+
+        if index == self.selection.project:
+            return refresh, 0, index
+
+        return refresh, (1 if index in self._on_screen() else 2), index
+
+    def _on_screen(self) -> range:
+        """The project rows the Projects column is showing right now, by index. One line a row."""
+        try:
+            column = self.query_one("#projects", OptionList)
+        except NoMatches:
+            return range(0)
+
+        top = round(column.scroll_offset.y)
+
+        return range(top, top + max(column.scrollable_content_region.height, 1))
+
+    async def _refresh_project(self, index: int, painted: ProjectView) -> None:
+        """Replace a row painted from stale answers, once they are back — if anything changed.
+
+        The marker comes off either way. The row is replaced only when the re-read says something
+        is different, and only if the row there is still the refreshing one this painted: a
+        force-refresh or a registration that landed in the meantime put a newer row there, and this
+        one's answer is about a moment that one already superseded. Not an identity check, because
+        the pill poll replaces a row to change its count and that is not a newer reading.
+        """
+        # In a slot like a survey, because it is one: a re-read of a project whose server has gone
+        # is a spawn, and past the window every row on the board is owed one at once.
+        async with self._surveying.slot((index, True)):
+            newer = await self._revalidate(painted)
 
+        rows = self.selection.projects
+
+        if index >= len(rows) or not rows[index].refreshing or rows[index].path != painted.path:
+            return
+
+        rows[index] = replace(newer or painted, refreshing=False, live=rows[index].live)
+
+        if newer is None or newer == painted:
+            self.paint_projects()
+        else:
+            self._read_ahead.forget(painted.path)
+            self._place_project(index)
+
+    def _place_project(self, index: int) -> None:
         # Only the row that arrived changed, so only the columns that show it are repainted. A
         # full repaint per arrival would re-request the highlighted row's preview once per project
         # in the registry, for a panel whose contents did not change.
@@ -1703,6 +2796,46 @@ class BoardApp(App[None]):
         else:
             self.paint_projects()
 
+    # --- live refresh --------------------------------------------------------
+
+    def start_watching(self) -> None:
+        """Re-read a project when its database is written, if the board was given a watcher.
+
+        The roots are handed over as a function of the rows rather than as a list, so a project
+        registered or unregistered while the board is open is watched or forgotten without the
+        watcher being restarted.
+        """
+        if self._watch is None:
+            return
+
+        self.run_worker(
+            self._watch(
+                lambda: [row.path for row in self.selection.projects], self.database_changed
+            ),
+            exclusive=False,
+        )
+
+    def database_changed(self, root: Path) -> None:
+        """One project's database changed: re-read that project, fresh, and no other (FR13).
+
+        **A row still pending is re-read once it lands, not left alone.** Its first survey is
+        eight reads, and some of them may have been answered before the write that brought this
+        here; starting a second beside it would only have the two race to paint. So the project is
+        noted in :attr:`_written` and :meth:`_fill_project` brings it back here when the last of its
+        rows has landed, which is when a fresh survey of it is the newest thing it can be.
+        """
+        rows = self.selection.projects
+        changed = [index for index, row in enumerate(rows) if row.path == root]
+
+        if any(rows[index].pending for index in changed):
+            self._written.add(root)
+            return
+
+        self._written.discard(root)
+
+        if changed:
+            self.start_survey(changed, fresh=True)
+
     # --- live sessions (FR12) ------------------------------------------------
 
     def start_pills(self) -> None:
@@ -1803,6 +2936,19 @@ class BoardApp(App[None]):
         the browser before a pool is bound to it — the label is all there is, which is the right
         answer rather than a blank panel.
         """
+        group = f"{kind}-preview"
+
+        if row is not None and self._awaited.get(kind) == row.id:
+            # A repaint with the cursor where it was — a survey landing — and the read for this row
+            # still going: it is the one wanted, and starting it again would only push it back.
+            if any(worker.group == group and not worker.is_finished for worker in self.workers):
+                return
+
+        # Whatever the panel was filling is for a row the cursor has left: its read is cancelled
+        # where it stands, and withdrawn — its reply dropped on arrival — if it had been sent.
+        self.workers.cancel_group(self, group)
+        self._awaited.pop(kind, None)
+
         if row is None:
             self._paint_preview(kind, "")
             return
@@ -1818,7 +2964,9 @@ class BoardApp(App[None]):
         # since left must not paint over the row it is on now. The panel is of the *highlighted*
         # row, and "whichever read finished last" is a different and wrong rule.
         self._awaited[kind] = row.id
-        self.run_worker(self._fill_preview(kind, project.path, row), exclusive=False)
+        # A coroutine made only when the worker runs: one cancelled before it started would
+        # otherwise be a coroutine never awaited.
+        self.run_worker(partial(self._fill_preview, kind, project.path, row), group=group)
 
     async def _fill_preview(self, kind: str, root: Path, row: EpicView | StoryView) -> None:
         """Read the row's preview, render it, and paint it if the cursor is still on that row.
@@ -1832,17 +2980,172 @@ class BoardApp(App[None]):
         markdown render of a large document is arithmetic rather than I/O, so awaiting it on the
         loop blocks every keystroke behind it. The width is read here, on the loop, because it is
         the widget's — only the rendering goes to the thread.
+
+        **One per panel, and cancelled when the cursor leaves.** :meth:`_preview` cancels the
+        panel's worker before starting the next, so a held arrow key over three hundred epics is
+        one read in flight at most rather than three hundred queued behind each other: the rest are
+        cancelled in their :data:`PREVIEW_SETTLE` before they ask, or mid-read, which withdraws the
+        request and drops the reply the server sends anyway (see
+        :meth:`mcp_client.MCPClient._withdraw`). The checks on :attr:`_awaited` stay, for the one
+        wait cancellation cannot reach — a raster already on its thread.
+
+        **A long document is laid out only as far as the panel shows** (see :class:`Sections`), so
+        its first line is up as soon as a short one's would be, and the rest follows the scroll.
+
+        **A row read ahead is painted at once** — no settle and no read — and once this row is up
+        the rows around it are read ahead in turn (see :meth:`_read_ahead_of`).
         """
-        text = await self._reader(root, row)
+        text = self._read_ahead.get(root, row)
+
+        if text is None:
+            await asyncio.sleep(PREVIEW_SETTLE)
+
+            self._filling.add(kind)
+
+            try:
+                text = await self._reader(root, row)
+            finally:
+                self._filling.discard(kind)
+
+            # Kept with the ones read ahead, so stepping back to it is as quick as stepping on.
+            self._read_ahead.put(root, row, text)
 
         if self._awaited.get(kind) != row.id:
             return
 
         body = self.query_one(f"#{kind}-preview-body", PreviewBody)
-        content = await asyncio.to_thread(markdown_content, text, _panel_width(body))
 
-        if self._awaited.get(kind) == row.id:
-            body.place(text, content)
+        if len(text) >= PROGRESSIVE_AT:
+            top, bottom = body.screen_lines()
+            sections = await self._rasterise_for(
+                kind, Sections.lay_out, text, _panel_width(body), bottom - top
+            )
+
+            if self._awaited.get(kind) == row.id:
+                body.place_sections(text, sections)
+        else:
+            content = await self._rasterise_for(kind, markdown_content, text, _panel_width(body))
+
+            if self._awaited.get(kind) == row.id:
+                body.place(text, content)
+
+        self._look_ahead(kind)
+
+    def _ahead(self, kind: str) -> list[tuple[str, EpicView | StoryView]]:
+        """The rows worth reading before the cursor reaches them, by the panel that would show them.
+
+        The :data:`PREFETCH_ROWS` each side of the cursor in ``kind``'s column, nearest first; and
+        for an epic, the first of its stories, which is the story panel's next preview whichever
+        way the cursor goes from here.
+        """
+        if kind == "story":
+            return [
+                ("story", row)
+                for row in neighbours(self.selection.stories, self.selection.story, PREFETCH_ROWS)
+            ]
+
+        ahead: list[tuple[str, EpicView | StoryView]] = [
+            ("epic", row)
+            for row in neighbours(self.selection.epics, self.selection.epic, PREFETCH_ROWS)
+        ]
+
+        return ahead + [("story", row) for row in self.selection.stories[:1]]
+
+    def _look_ahead(self, kind: str) -> None:
+        """Read ahead of the cursor in ``kind``'s column, unless a worker already is."""
+        if kind not in self._looking_ahead:
+            self._looking_ahead.add(kind)
+            self.run_worker(partial(self._read_ahead_of, kind), group=f"{kind}-ahead")
+
+    async def _read_ahead_of(self, kind: str) -> None:
+        """Read the previews of the rows around the cursor, one at a time, while nothing else reads.
+
+        **Below every read and raster the cursor is waiting on** (NFR3). Each row is read only
+        while no panel's own preview is being read (:attr:`_filling`), so a cursor that moves on
+        finds the server and the read lanes free for the row it stopped at; the read already in
+        flight is the most that can be in its way. The rows are worked out again from the cursor
+        before each, so a prefetch that started for one row serves whichever row the cursor is on
+        by then.
+
+        Rasterised too, at the width of the panel that would show it, which puts the raster in
+        :data:`RASTER_CACHE` for the moment the cursor arrives — in :data:`AHEAD_SLOT` rather than
+        the panel's, so the cursor's own raster never queues behind one made on a guess, and not
+        at all while one of the cursor's is being read or made. Not a long document either: that
+        one is laid out a section at a time anyway, and only as far as the panel shows.
+
+        **A read ahead that fails is dropped.** Whatever went wrong is the cursor's to find out
+        when it gets there, through the read that reports it.
+        """
+        tried: set[tuple[Path, str, str]] = set()
+
+        try:
+            while not self._filling:
+                project = self.selection.current_project
+
+                if project is None or self._reader is None:
+                    return
+
+                root = project.path
+                wanted = [
+                    (panel, row)
+                    for panel, row in self._ahead(kind)
+                    if ReadAhead.key(root, row) not in tried
+                    and self._read_ahead.get(root, row) is None
+                ]
+
+                if not wanted:
+                    return
+
+                panel, row = wanted[0]
+                tried.add(ReadAhead.key(root, row))
+
+                try:
+                    text = await self._reader(root, row)
+                except Exception:  # noqa: BLE001 — the cursor's own read reports it (NFR2)
+                    return
+
+                if (
+                    self._read_ahead.put(root, row, text)
+                    and len(text) < PROGRESSIVE_AT
+                    and not self._foreground_busy()
+                ):
+                    body = self.query_one(f"#{panel}-preview-body", PreviewBody)
+                    await self._rasterise_for(
+                        AHEAD_SLOT, markdown_content, text, _panel_width(body)
+                    )
+        finally:
+            self._looking_ahead.discard(kind)
+
+    def _foreground_busy(self) -> bool:
+        """Whether a panel's own preview is being read or rasterised — the cursor's, not a guess."""
+        return bool(self._filling) or any(
+            not raster.done()
+            for slot, raster in self._rastering.items()
+            if slot != AHEAD_SLOT
+        )
+
+    async def _rasterise_for(self, kind: str, render: Callable[..., Any], *arguments: Any) -> Any:
+        """``render(*arguments)`` on a thread, once slot ``kind``'s last raster has finished.
+
+        A slot per panel, and :data:`AHEAD_SLOT` for what is read ahead of the cursor.
+
+        **A thread cannot be cancelled**, so a worker cancelled mid-raster leaves its raster
+        running; one started beside it for the next row would be two at once, and a held key
+        would pile them up. So each waits for the panel's previous raster to land — without taking
+        it over, so a cancellation here leaves that one to finish — and is then the one the next
+        waits for. Shielded for the same reason: a worker cancelled while its own raster runs
+        leaves it recorded, and the next still waits on it.
+        """
+        previous = self._rastering.get(kind)
+
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+
+        raster = self._rastering[kind] = asyncio.ensure_future(
+            asyncio.to_thread(render, *arguments)
+        )
+
+        return await asyncio.shield(raster)
 
     def _paint_preview(self, kind: str, source: str) -> None:
         """Put ``source`` in ``kind``'s panel (FR6).
@@ -2145,6 +3448,10 @@ class BoardApp(App[None]):
         """Open the coverage-gaps screen over every registered project (FR16)."""
         self.push_screen(GapsScreen(self.selection.projects, self._gaps), self.found)
 
+    def action_diagnostics(self) -> None:
+        """Open the diagnostics screen over every registered project (NFR3)."""
+        self.push_screen(DiagnosticsScreen(self.selection.projects, self._diagnose))
+
     def found(self, result: Result | Gap | None) -> None:
         """Move the three columns to the project and epic a chosen row came from (FR15, FR16).
 
@@ -2261,7 +3568,7 @@ def run_cli(
     err=None,
     make_pool=None,
 ) -> int:
-    """The board's command line: ``add`` / ``list`` / ``remove``.
+    """The board's command line: ``add`` / ``list`` / ``remove``, ``cache stats`` and ``stats``.
 
     ``registry_file``, ``out``, ``err`` and ``make_pool`` are injected so the whole surface is
     drivable in-process. A test that had to spawn a subprocess to read a refusal would be asserting
@@ -2273,15 +3580,31 @@ def run_cli(
     """
     out = out or sys.stdout
     err = err or sys.stderr
+
+    def make_cache() -> Cache:
+        # Pruned against the registry the command was given, so a project unregistered here —
+        # or by another board — takes its entries with it at the next save.
+        return Cache(
+            windows=WINDOWS,
+            registered=lambda: [
+                Path(entry.path) for entry in list_projects(registry_file=registry_file)
+            ],
+        )
+
     # The default pool caches (FR13); an injected one decides for itself, which is what keeps a test
     # about a read from being answered out of the user's own cache file. `list` gets it as well as
     # the browser: it is the command a shell prompt or a status line calls, and the round trip it
     # saves there is a server per project per invocation.
-    make_pool = make_pool or (lambda: ServerPool(cache=Cache()))
+    make_pool = make_pool or (lambda: ServerPool(cache=make_cache()))
 
     parser = argparse.ArgumentParser(
         prog="dpm-board", description="The dpm board: browse registered projects, or manage them."
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Re-read a project as soon as its database is written.",
+    )
     # Optional, because the board's default is the thing it is for: no subcommand opens the TUI.
     sub = parser.add_subparsers(dest="command", required=False)
 
@@ -2292,23 +3615,55 @@ def run_cli(
     remove_parser = sub.add_parser("remove", help="Unregister a project path.")
     remove_parser.add_argument("path")
 
-    sub.add_parser("list", help="List registered projects.")
+    list_parser = sub.add_parser("list", help="List registered projects.")
+    forms = list_parser.add_mutually_exclusive_group()
+    forms.add_argument(
+        "--json", dest="form", action="store_const", const="json", help="One JSON array."
+    )
+    forms.add_argument(
+        "--ndjson", dest="form", action="store_const", const="ndjson",
+        help="One JSON object per line, each printed as its project is read.",
+    )
+
+    cache_parser = sub.add_parser("cache", help="Inspect the status cache.")
+    cache_sub = cache_parser.add_subparsers(dest="cache_command", required=True)
+    cache_sub.add_parser("stats", help="Hit ratio, and size by project and by tool.")
+
+    stats_parser = sub.add_parser(
+        "stats", help="Read every project as the board does, and report where the time went."
+    )
+    stats_parser.add_argument("--json", action="store_true", help="The whole snapshot as JSON.")
 
     args = parser.parse_args(argv)
 
-    if args.command == "add":
-        return _add(args.path, args.label, registry_file, out, err)
+    def dispatch() -> int:
+        if args.command == "add":
+            return _add(args.path, args.label, registry_file, out, err)
+
+        if args.command == "remove":
+            return _remove(args.path, registry_file, out)
 
-    if args.command == "remove":
-        return _remove(args.path, registry_file, out)
+        if args.command == "list":
+            return _list(registry_file, out, err, make_pool, args.form or "text")
 
-    if args.command == "list":
-        return _list(registry_file, out, err, make_pool)
+        if args.command == "cache":
+            return _cache_stats(make_cache(), out)
 
-    return _browse(registry_file, err, make_pool)
+        if args.command == "stats":
+            return _stats(registry_file, out, err, make_pool, as_json=args.json)
+
+        return _browse(registry_file, err, make_pool, watch=args.watch)
+
+    try:
+        return dispatch()
+    finally:
+        # To stderr, whatever the command: the board's own exit is the case this is for, and after
+        # the TUI has let go of the terminal stderr is the stream nothing else is writing to.
+        if os.environ.get(ON_EXIT):
+            print(json.dumps(METRICS.snapshot()), file=err)
 
 
-def _browse(registry_file: Path | None, err, make_pool) -> int:
+def _browse(registry_file: Path | None, err, make_pool, *, watch: bool = False) -> int:
     """Open the browser over every registered project (FR4, NFR3).
 
     **Nothing is read before the app starts.** The rows come from the registry, which is a file;
@@ -2316,12 +3671,14 @@ def _browse(registry_file: Path | None, err, make_pool) -> int:
     keep the terminal blank until the slowest server in the registry had finished its handshake,
     which is the behaviour NFR3 exists to forbid.
     """
-    asyncio.run(_browse_with(registry_file, make_pool))
+    asyncio.run(_browse_with(registry_file, make_pool, watch=watch))
 
     return 0
 
 
-async def _browse_with(registry_file: Path | None, make_pool) -> None:
+async def _browse_with(
+    registry_file: Path | None, make_pool, *, watch: bool = False
+) -> None:
     """Run the browser with a live pool behind its reads, closed when the app exits.
 
     One pool for the whole session: a preview is read when a row is highlighted, which goes on for
@@ -2339,6 +3696,7 @@ async def _browse_with(registry_file: Path | None, make_pool) -> None:
             reload(),
             reader=previews(pool),
             survey=lambda project, *, fresh=False: survey_project(pool, project, fresh=fresh),
+            revalidate=lambda project: revalidate_project(pool, project),
             reload=reload,
             register=lambda path: add_project(str(path), None, registry_file=registry_file),
             unregister=lambda path: remove_project(str(path), registry_file=registry_file),
@@ -2350,6 +3708,8 @@ async def _browse_with(registry_file: Path | None, make_pool) -> None:
             clear_cache=None if pool.cache is None else pool.cache.clear,
             search=lambda projects, query: search_projects(pool, projects, query),
             gaps=lambda projects: gaps_projects(pool, projects),
+            watch=watch_projects if watch else None,
+            diagnose=lambda projects: diagnose_projects(pool, projects),
         )
 
         await app.run_async()
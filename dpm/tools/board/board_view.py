@@ -80,6 +80,14 @@ READING = "reading…"
 #: The style for that row. Dim, like retired work: it is on screen, it is not yet news.
 READING_STYLE = "dim"
 
+#: What a project shows while figures it is already painting are being asked for again (FR13).
+#:
+#: **After the figure, not instead of it.** A row served from an answer past its window is still
+#: the last thing the server said about a database that has not changed since, so the figure stays
+#: and this says it is being checked. Replacing it with :data:`READING` would blank a board a user
+#: opened to read, for the length of a spawn, over answers that are almost always still right.
+REFRESHING = "↻ refreshing"
+
 #: The live-session pill (FR12): a project with work running in a session the board launched.
 #:
 #: The dot is what makes it readable at a glance in a column of names and figures; the word is what
@@ -279,6 +287,17 @@ class ProjectView:
     #: its FR11 state instead, and a badge beside it would be a claim about a database nobody opened.
     violations: int = 0
 
+    #: How long this project's read plan took on its critical path, in seconds — the longest of
+    #: the reads the survey made, which is what the row waited for. ``None`` for a row that was
+    #: never read. Left out of equality: two views of the same project are the same rows whichever
+    #: server answered faster.
+    read_time: float | None = field(default=None, compare=False)
+
+    #: Whether any of the answers this row was built from are past their window and being asked for
+    #: again in the background. Left out of equality, like ``read_time``: a re-read that came back
+    #: with the same answers is the same row, and the board repaints only rows that changed.
+    refreshing: bool = field(default=False, compare=False)
+
     @property
     def summary(self) -> str:
         """The row's left-hand side: what the project is called and how it is getting on.
@@ -295,6 +314,9 @@ class ProjectView:
         if self.pending:
             return f"{self.name}  ·  {READING}"
 
+        if self.refreshing:
+            return f"{self.name}  ·  {self.progress or NOTHING}  {REFRESHING}"
+
         return f"{self.name}  ·  {self.progress or NOTHING}"
 
     @property
@@ -383,6 +405,95 @@ class Gap:
         return f"{self.name}  ·  {self.requirement}"
 
 
+#: The diagnostics table's headings, in the order :attr:`Diagnosis.cells` fills them.
+DIAGNOSIS_COLUMNS = (
+    "project", "pid", "rss", "in flight", "first row", "last read", "cache hits", "state"
+)
+
+
+def _ms(seconds: float | None) -> str:
+    return "—" if seconds is None else f"{seconds * 1000:.0f}ms"
+
+
+@dataclass(frozen=True)
+class Diagnosis:
+    """One project's server and reads as the pool has recorded them — a row of ``Ctrl+D``'s table.
+
+    Every figure is one the pool or :mod:`metrics` already holds; nothing here was timed for the
+    table's sake. ``None`` is *not yet*, and is printed as a dash rather than as a zero: a project
+    whose first row has not arrived has no time to first row, and ``0ms`` would say it was instant.
+    """
+
+    name: str
+    pending: bool
+    pid: int | None = None
+    rss: int | None = None
+    in_flight: int = 0
+    first_row: float | None = None
+    last_read: float | None = None
+    hits: int = 0
+    asked: int = 0
+    said: str | None = None
+
+    @property
+    def waiting_on(self) -> str:
+        """Why a row still says "reading…", from the same three facts a user would check by hand.
+
+        Nothing in flight is a survey still queued for a slot; reads in flight with no server is a
+        spawn or a handshake that has not answered; reads in flight on a running server is the
+        server taking its time. The last thing the server wrote to stderr goes beside any of them,
+        because when one of those is the answer, that line is usually the reason.
+        """
+        if not self.pending:
+            state = "read"
+        elif not self.in_flight:
+            state = "queued"
+        elif self.pid is None:
+            state = "starting its server"
+        else:
+            state = f"waiting on {self.in_flight} read{'s' if self.in_flight != 1 else ''}"
+
+        return f"{state}: {self.said}" if self.said else state
+
+    @property
+    def cells(self) -> tuple[str, ...]:
+        """The row as printed, one string per :data:`DIAGNOSIS_COLUMNS` entry."""
+        return (
+            self.name,
+            "—" if self.pid is None else str(self.pid),
+            "—" if self.rss is None else f"{self.rss / 2**20:.1f} MiB",
+            str(self.in_flight),
+            _ms(self.first_row),
+            _ms(self.last_read),
+            f"{self.hits}/{self.asked}" if self.asked else "—",
+            self.waiting_on,
+        )
+
+
+@dataclass(frozen=True)
+class Diagnostics:
+    """Everything ``Ctrl+D`` shows: a :class:`Diagnosis` per project and the preview raster's times.
+
+    The raster is the board's and not any project's — one panel rasterises whatever the cursor is
+    on — so it is a line under the table rather than a column in it.
+    """
+
+    projects: tuple[Diagnosis, ...] = ()
+    rasters: int = 0
+    raster_p90: float | None = None
+    raster_last: float | None = None
+
+    @property
+    def raster_label(self) -> str:
+        if not self.rasters:
+            return "preview raster: none yet"
+
+        return (
+            f"preview raster: {self.rasters} × p90 {_ms(self.raster_p90)}, "
+            f"last {_ms(self.raster_last)}"
+        )
+
+
 def visible(rows: Sequence, *, show_retired: bool) -> tuple:
     """``rows`` with the finished ones dropped, or all of them when ``show_retired`` (FR19).
 
@@ -11,44 +11,136 @@ is not consulted and need not be present. `cpm/tools/board` stamps on `HEAD` and
 because *its* state is files under version control — this one's is not, and a project that is not a
 repository has to render like any other.
 
-**The schema version is the third part of the stamp, and it is why a cold board still spawns one
-server.** An entry produced under an earlier schema is stale however untouched the file is: the
-derivation that produced it may not be the derivation in force. The version arrives in the
-`initialize` handshake — the connection is not open when it is answered and no read tool reports it,
-so there is nowhere else it could come from — which means the board does not know it until *some*
-server has started. An entry is therefore never served against an unknown schema, and the cost is
-paid in spawns: the first read of a session goes out, as does every read that started before that
-first handshake came back. What it buys is the rest of the session, where a stamped entry is answered
-from disk without a call — which is what AD6 is for, and is not something a guessed version could
-give safely.
-
-**This file and the registry are the only two things the board writes** (ENVX3), and both live under
-the XDG config root. Nothing here ever writes inside a registered project.
+**And its write-ahead log's**, because in WAL mode a write lands in ``dpm.db-wal`` and the database
+file does not move until a checkpoint copies it across. A stamp on the database alone matched
+straight through every write since the last checkpoint, and the window was all that ended it. The
+log is stat-ed like the database, never opened. The shared-memory index beside them is left out on
+purpose: every reader writes to it, the board's own servers included, so a stamp that covered it
+would be invalidated by the read that filled the entry.
+
+**The schema version is the third part of the stamp, and it is remembered per server executable.**
+An entry produced under an earlier schema is stale however untouched the file is: the derivation
+that produced it may not be the derivation in force. The version arrives in the `initialize`
+handshake — the connection is not open when it is answered and no read tool reports it, so there is
+nowhere else it could come from — and a board that forgot it at exit would have to spawn a server
+before it could serve a single entry, which is a warm start that costs what a cold one does.
+
+So the version is kept in this file too, beside the `tools/list` the same server advertised, keyed
+on the executable's **identity**: its path, mtime and size (:class:`Identity`). A plugin upgrade
+installs a new executable under a new version directory, and a checkout that rebuilds one rewrites
+it; either way the identity changes, nothing learned from the old one is found, and the first read
+goes out to learn it again. A warm start against the same executable paints every project inside
+the window from disk and spawns nothing at all. What the identity cannot see — a server whose
+derivation changed while the file that launches it did not — is bounded the way the stamp's own
+blind spot is, by the window: the first read past it spawns a server, and that handshake replaces
+whatever was remembered.
+
+**One shard per project, not one file for the board.** A single file is read whole at startup and
+rewritten whole at exit, so a board over a long registry pays for every project's answers to paint
+the first row, and a session that read one project rewrites all of them. The store is a directory
+instead: a shard per project root, read the first time that root is asked about, and written back
+at :meth:`Cache.save` only if one of its entries changed — each shard by the same rename dance the
+registry uses, so a torn write is a shard that was never replaced rather than one that parses
+short. The executables' records sit beside them in a small file of their own, since the pool needs
+them before it has asked about any project. The single file the store used to be is not migrated —
+everything in it is recomputable by asking again — and the first save removes it.
+
+**Bounded, and by recency of use.** Nothing else forgets — previews for every story ever
+highlighted, search results, projects unregistered months ago — so the store is held to a byte
+budget and an entry budget (:data:`MAX_BYTES`, :data:`MAX_ENTRIES`), and each entry carries the
+last time it was served. :meth:`Cache.save` drops the shards of roots no longer registered, and
+when the running totals in the ledger say the store is over either budget it compacts: every shard
+is read, the least recently served entries go first, and the store is left under a low-water mark
+rather than at the line, so the next session does not compact again.
+
+**This directory and the registry are the only things the board writes** (ENVX3), and both live
+under the XDG config root. Nothing here ever writes inside a registered project.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from registry import CONFIG_DIR, DATABASE, config_home
 
-#: The cache's filename, beside the registry in the XDG config directory.
-CACHE_FILE = "cache.json"
+#: The cache's directory, beside the registry in the XDG config directory.
+CACHE_DIR = "cache"
+
+#: The single file the cache was before it was a directory, beside where the directory is now.
+#: Nothing reads it; :meth:`Cache.save` removes it, so an upgraded board does not leave it behind.
+LEGACY_FILE = "cache.json"
+
+#: The file in it holding what each server executable said about itself (see :class:`Identity`).
+SERVERS_FILE = "servers.json"
+
+#: The file in it holding the store's running totals and how often each tool's lookups were served.
+#: Totals rather than a record per shard, so that reading it costs the same whatever the store holds.
+LEDGER_FILE = "ledger.json"
+
+#: The store's budgets: on-disk bytes across every shard, and entries across every project.
+#:
+#: **Bytes are what a user notices and entries are what a session pays for.** A store of a few
+#: enormous previews and one of a great many row counts are both full in different ways, so either
+#: limit alone would let the other grow without bound.
+MAX_BYTES = 64 * 1024 * 1024
+MAX_ENTRIES = 50_000
+
+#: What fraction of each budget a compaction leaves the store at. Evicting only to the line would
+#: put the next session's first new entry over it, and compaction reads every shard.
+LOW_WATER = 0.8
+
+#: How old an entry's recorded last hit has to be before serving it again is worth a write.
+#:
+#: A hit changes the entry in memory every time, but writing every hit back would make a session
+#: that only *read* a project rewrite its shard — which is what the shards exist to avoid. Eviction
+#: is least-recently-used over days and weeks, so an hour's resolution loses nothing it orders by.
+TOUCH = 3600.0
+
+#: What one lookup came to, as the ledger counts it per tool: served inside its window, served past
+#: it, or not servable at all.
+HIT = "hit"
+STALE = "stale"
+MISSED = "miss"
+
+#: The write-ahead log beside the database, stamped with it (see the module docstring).
+WAL = DATABASE.with_name(f"{DATABASE.name}-wal")
 
 #: How long an entry is trusted after it is written, in seconds.
 #:
 #: **The stamp is what invalidates an entry; this is what bounds the stamp's blind spot.** A write
-#: that leaves the database's mtime and size exactly as they were is indistinguishable from no write
-#: at all, and the window is the difference between a board that is wrong for a few minutes and one
-#: that is wrong until the file changes again. A force-refresh is the other half of that answer, and
-#: is the one a user reaches for when they know they have just written something.
+#: that leaves the database's and the log's mtimes and sizes exactly as they were is
+#: indistinguishable from no write at all, and the window is the difference between a board that is
+#: wrong for a few minutes and one that is wrong until the file changes again. A force-refresh is
+#: the other half of that answer, and is the one a user reaches for when they know they have just
+#: written something.
 WINDOW = 300.0
 
+#: Past its window, an entry whose stamp still matches is **stale** rather than gone. It is served
+#: to a caller that asks for stale answers — the survey, which paints it at once and marks the row
+#: as refreshing — while the pool asks the server again behind it (see
+#: :meth:`mcp_client.ServerPool.read`). The stamp is still what invalidates: an entry whose
+#: database has changed is a miss however recently it was written.
+
+#: What a shard holds: the root it is for, and that root's entries by :func:`entry_key`. The root
+#: is written into the shard because the filename is a digest of it, and a directory of digests is
+#: unreadable to anyone asking which project filled the disk.
+ROOT = "root"
+ENTRIES = "entries"
+
+#: Beside the entries, how many rows each list read answered with when it was last read whole, by
+#: :func:`entry_key` with the paging arguments left out. Not an answer and never served as one: it is
+#: what :func:`status_model.rows` sizes its pages by, and a count from last week that is wrong costs
+#: a round trip, not a wrong figure.
+ROWS = "rows"
+
 #: What :meth:`Cache.get` returns when it has nothing — a sentinel rather than ``None``, because a
 #: tool answering with ``null`` is a cached value like any other and would otherwise be a miss
 #: forever.
@@ -57,26 +149,104 @@ MISS = object()
 
 @dataclass(frozen=True)
 class Stamp:
-    """What a cached answer was true of: the database as it stood, under a known schema."""
+    """What a cached answer was true of: the database as it stood, under a known schema.
+
+    ``wal`` is the log's ``(mtime, size)``, or ``None`` when there is no log — which is a state of
+    its own, and the one a database is in after a checkpoint that removed it.
+    """
 
     mtime: int
     size: int
     schema: int
+    wal: tuple[int, int] | None = None
 
     def as_json(self) -> list[int]:
-        return [self.mtime, self.size, self.schema]
+        return [self.mtime, self.size, self.schema, *(self.wal or ())]
 
     @classmethod
     def from_json(cls, record: Any) -> "Stamp | None":
-        """A stamp read back from the file, or ``None`` for anything this version cannot read."""
-        if isinstance(record, list) and len(record) == 3 and all(
-            isinstance(part, int) for part in record
-        ):
+        """A stamp read back from the file, or ``None`` for anything this version cannot read.
+
+        Three parts is a stamp with no log, which is also how every stamp written before the log
+        was stamped reads back: it matches a database that has none, and nothing else.
+        """
+        if not isinstance(record, list) or not all(isinstance(part, int) for part in record):
+            return None
+
+        if len(record) == 3:
             return cls(*record)
 
+        if len(record) == 5:
+            return cls(*record[:3], wal=(record[3], record[4]))
+
         return None
 
 
+@dataclass(frozen=True)
+class Identity:
+    """Which server executable something was learned from: its path, and its mtime and size.
+
+    The same two attributes the stamp takes from a database, for the same reason — they are
+    readable with a ``stat`` — and the path beside them because two installed versions of the
+    plugin can hold executables that agree on both.
+    """
+
+    path: str
+    mtime: int
+    size: int
+
+    def key(self) -> str:
+        return json.dumps([self.path, self.mtime, self.size])
+
+
+def identity_of(server: Path) -> Identity | None:
+    """The identity ``server`` has right now, or ``None`` when it cannot be stat-ed."""
+    try:
+        stat = server.stat()
+    except OSError:
+        return None
+
+    return Identity(path=str(server.resolve()), mtime=stat.st_mtime_ns, size=stat.st_size)
+
+
+@dataclass(frozen=True)
+class Usage:
+    """What one project, or one tool across every project, holds in the store."""
+
+    entries: int = 0
+    bytes: int = 0
+    #: The most recent time any of its entries was served or written, or ``None`` for nothing held.
+    hit: float | None = None
+
+    def plus(self, size: int, hit: float | None) -> "Usage":
+        latest = hit if self.hit is None else max(self.hit, hit or self.hit)
+
+        return Usage(self.entries + 1, self.bytes + size, latest)
+
+
+@dataclass(frozen=True)
+class Stats:
+    """The store as ``board.py cache stats`` reports it: how well it serves, and what it holds."""
+
+    #: Lookups by tool, then by outcome (:data:`HIT`, :data:`STALE`, :data:`MISSED`), over every
+    #: session the ledger has seen.
+    outcomes: dict[str, dict[str, int]]
+    projects: dict[str, Usage]
+    tools: dict[str, Usage]
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Served lookups over all of them — a stale answer painted is served — or ``None``."""
+        counted = Counter()
+
+        for outcome in self.outcomes.values():
+            counted.update(outcome)
+
+        asked = sum(counted.values())
+
+        return (counted[HIT] + counted[STALE]) / asked if asked else None
+
+
 def stamp_of(root: Path, schema: int | None) -> Stamp | None:
     """The stamp a project has right now, or ``None`` when it cannot have one.
 
@@ -85,9 +255,9 @@ def stamp_of(root: Path, schema: int | None) -> Stamp | None:
     the board has not yet been told which derivation is in force — see the module docstring for why
     that is a miss rather than a guess.
 
-    The database file is *stat*-ed and never opened, which is what keeps this inside FR2's must-NOT:
-    the board reads no file under a project's ``.dpm/``, and AD6 names these two attributes as the
-    stamp precisely because they are readable without doing so.
+    The database file and its log are *stat*-ed and never opened, which is what keeps this inside
+    FR2's must-NOT: the board reads no file under a project's ``.dpm/``, and AD6 names these two
+    attributes as the stamp precisely because they are readable without doing so.
     """
     if schema is None:
         return None
@@ -97,12 +267,28 @@ def stamp_of(root: Path, schema: int | None) -> Stamp | None:
     except OSError:
         return None
 
-    return Stamp(mtime=stat.st_mtime_ns, size=stat.st_size, schema=schema)
+    try:
+        log = (root / WAL).stat()
+    except OSError:
+        wal = None
+    else:
+        wal = (log.st_mtime_ns, log.st_size)
+
+    return Stamp(mtime=stat.st_mtime_ns, size=stat.st_size, schema=schema, wal=wal)
 
 
 def cache_path() -> Path:
     """Where the cache lives. Never created as a side effect of asking for it."""
-    return config_home() / CONFIG_DIR / CACHE_FILE
+    return config_home() / CONFIG_DIR / CACHE_DIR
+
+
+def shard_name(root: Path) -> str:
+    """The file one project's entries live in: a digest of its root, as the cache keys it.
+
+    A digest rather than the path made safe for a filename, because a path escaped into one is
+    either ambiguous or longer than a filesystem will take, and the root is inside the shard anyway.
+    """
+    return hashlib.sha256(str(root).encode()).hexdigest()[:32] + ".json"
 
 
 def entry_key(root: Path, tool: str, arguments: dict | None) -> str:
@@ -119,9 +305,14 @@ def entry_key(root: Path, tool: str, arguments: dict | None) -> str:
 class Cache:
     """Answers kept by (project, call), valid while the project's stamp is unchanged.
 
-    Held in memory for the session and written once, by :meth:`save`. A flush per read would
-    rewrite the whole file on every one of the seven calls each project makes at startup, which is
-    a write amplified by the registry's length for a file nobody reads until the next session.
+    Held in memory for the session and written by :meth:`save`, once, at the end. A flush per read
+    would rewrite a shard on every one of the calls a project makes at startup, for a file nobody
+    reads until the next session. Read lazily, a shard at a time: a project is loaded the first time
+    it is asked about, so a board that paints one project has read one shard.
+
+    ``registered`` is what the store is pruned against — the roots the registry still holds, asked
+    for at :meth:`save` rather than at construction, because the browser can register and unregister
+    projects for as long as it is open. ``None`` prunes nothing, which is what a test's store wants.
     """
 
     def __init__(
@@ -129,30 +320,75 @@ class Cache:
         path: Path | None = None,
         *,
         window: float = WINDOW,
+        windows: dict[str, float] | None = None,
         clock=time.time,
         enabled: bool = True,
+        max_bytes: int = MAX_BYTES,
+        max_entries: int = MAX_ENTRIES,
+        registered: Callable[[], Iterable[Path]] | None = None,
     ) -> None:
         self.path = path if path is not None else cache_path()
         self.window = window
+        #: Per-tool windows, by tool name, overriding ``window`` for the tools they name. A tool's
+        #: answer changes as often as the thing it reports does, and those differ by an order of
+        #: magnitude: an integrity sweep is over invariants that hold for weeks, and an epic list
+        #: is the first thing a user edits.
+        self.windows = dict(windows or {})
         self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._registered = registered
         self._clock = clock
-        self._entries: dict[str, dict] = self._load()
-        self._dirty = False
-
-    def _load(self) -> dict[str, dict]:
-        """Read the file, treating anything unreadable as an empty cache.
+        #: Each loaded project's entries, by root as the cache keys it. A root not here has not
+        #: been asked about yet, which is different from one whose shard was empty.
+        self._shards: dict[str, dict[str, dict]] = {}
+        #: What each loaded shard weighed on disk when it was read, as ``(bytes, entries)`` — the
+        #: other half of the difference :meth:`save` applies to the ledger's totals.
+        self._sizes: dict[str, tuple[int, int]] = {}
+        #: Each loaded project's row counts (see :data:`ROWS`), by root as the cache keys it.
+        self._counts: dict[str, dict[str, int]] = {}
+        #: The roots whose shards :meth:`save` has to write back.
+        self._dirty: set[str] = set()
+        self._servers: dict[str, dict] = self._read(self.path / SERVERS_FILE)
+        self._servers_dirty = False
+        self._ledger: dict = self._read(self.path / LEDGER_FILE)
+        #: This session's lookups, by tool and outcome, not yet added to the ledger.
+        self._tally: defaultdict[str, Counter] = defaultdict(Counter)
+
+    @staticmethod
+    def _read(path: Path) -> dict:
+        """Read one file of the store, treating anything unreadable as empty.
 
         **A damaged cache is not an error.** It holds nothing that cannot be recomputed by asking
         the servers again, so a board that refused to start over a truncated JSON file would be
         failing over the one thing it is safe to throw away.
         """
         try:
-            loaded = json.loads(self.path.read_text() or "{}")
+            loaded = json.loads(path.read_text() or "{}")
         except (OSError, ValueError):
             return {}
 
         return loaded if isinstance(loaded, dict) else {}
 
+    def _shard(self, root: Path) -> dict[str, dict]:
+        """``root``'s entries, read from its shard the first time they are asked for."""
+        key = str(root)
+
+        if key not in self._shards:
+            file = self.path / shard_name(root)
+            loaded = self._read(file)
+            entries = loaded.get(ENTRIES)
+            # A shard naming some other root is a digest collision or a file moved by hand. Either
+            # way its entries are not this project's, and serving them would be the one failure a
+            # cache cannot have.
+            mine = loaded.get(ROOT) == key
+            counts = loaded.get(ROWS)
+            self._shards[key] = entries if mine and isinstance(entries, dict) else {}
+            self._counts[key] = counts if mine and isinstance(counts, dict) else {}
+            self._sizes[key] = (_size(file), len(self._shards[key]))
+
+        return self._shards[key]
+
     def get(self, root: Path, tool: str, arguments: dict | None, stamp: Stamp | None) -> Any:
         """The cached answer for one call, or :data:`MISS`.
 
@@ -160,20 +396,47 @@ class Cache:
         that same stamp, and it was written recently enough. The stamp is checked first because it
         is the one that carries the meaning — the window only bounds what the stamp cannot see.
         """
+        value, expired = self.lookup(root, tool, arguments, stamp)
+
+        return MISS if expired else value
+
+    def lookup(
+        self, root: Path, tool: str, arguments: dict | None, stamp: Stamp | None
+    ) -> tuple[Any, bool]:
+        """The cached answer for one call and whether it is past its window.
+
+        ``(MISS, False)`` when there is nothing to serve: no stamp, no entry, or an entry written
+        against a different one. An entry whose stamp matches is returned however old it is, with
+        ``True`` beside it once its tool's window has passed — whether a stale answer is worth
+        painting is the caller's decision, not this one's.
+
+        A served entry's last hit moves to now, which is what eviction orders by; see :data:`TOUCH`
+        for when that is written back.
+        """
         if not self.enabled or stamp is None:
-            return MISS
+            return MISS, False
 
-        entry = self._entries.get(entry_key(root, tool, arguments))
+        entry = self._shard(root).get(entry_key(root, tool, arguments))
+        written = entry.get("written") if entry is not None else None
 
-        if entry is None or Stamp.from_json(entry.get("stamp")) != stamp:
-            return MISS
+        if (
+            entry is None
+            or Stamp.from_json(entry.get("stamp")) != stamp
+            or not isinstance(written, (int, float))
+        ):
+            self._tally[tool][MISSED] += 1
+            return MISS, False
 
-        written = entry.get("written")
+        now = self._clock()
+        expired = now - written > self.windows.get(tool, self.window)
+        self._tally[tool][STALE if expired else HIT] += 1
 
-        if not isinstance(written, (int, float)) or self._clock() - written > self.window:
-            return MISS
+        if now - _hit_of(entry) > TOUCH:
+            self._dirty.add(str(root))
 
-        return entry.get("value")
+        entry["hit"] = now
+
+        return entry.get("value"), expired
 
     def put(
         self, root: Path, tool: str, arguments: dict | None, stamp: Stamp | None, value: Any
@@ -182,43 +445,370 @@ class Cache:
         if not self.enabled or stamp is None:
             return
 
-        self._entries[entry_key(root, tool, arguments)] = {
+        now = self._clock()
+        self._shard(root)[entry_key(root, tool, arguments)] = {
             "stamp": stamp.as_json(),
-            "written": self._clock(),
+            "written": now,
+            "hit": now,
             "value": value,
         }
-        self._dirty = True
+        self._dirty.add(str(root))
+
+    def rows_for(self, root: Path, tool: str, arguments: dict | None) -> int | None:
+        """How many rows ``tool`` answered with for ``root`` when it was last read whole, or ``None``.
+
+        Stamp-blind on purpose: this is a guess at the size of an answer, asked for before the
+        answer is, and a project that has grown since is one that needs an extra page.
+        """
+        if not self.enabled:
+            return None
+
+        self._shard(root)
+        count = self._counts[str(root)].get(entry_key(root, tool, arguments))
+
+        return count if isinstance(count, int) else None
+
+    def count(self, root: Path, tool: str, arguments: dict | None, rows: int) -> None:
+        """Record how many rows one whole list read came to, for :meth:`rows_for` next time."""
+        if not self.enabled or self.rows_for(root, tool, arguments) == rows:
+            return
+
+        self._counts[str(root)][entry_key(root, tool, arguments)] = rows
+        self._dirty.add(str(root))
+
+    def schema_for(self, identity: Identity | None) -> int | None:
+        """The schema version ``identity``'s handshake reported last time, or ``None``.
+
+        This is what lets a warm start serve an entry before any server has started: the stamp
+        needs a schema, and the only other place one comes from is a handshake.
+        """
+        schema = self._server(identity).get("schema")
+
+        return schema if isinstance(schema, int) else None
+
+    def tools_for(self, identity: Identity | None) -> list[dict] | None:
+        """The ``tools/list`` ``identity`` advertised last time, or ``None`` if it has not been asked."""
+        tools = self._server(identity).get("tools")
+
+        return tools if isinstance(tools, list) else None
+
+    def learn(
+        self,
+        identity: Identity | None,
+        *,
+        schema: int | None = None,
+        tools: list[dict] | None = None,
+    ) -> None:
+        """Record what one executable said about itself. Anything not passed is left as it was."""
+        if not self.enabled or identity is None:
+            return
+
+        record = dict(self._server(identity))
+
+        if schema is not None:
+            record["schema"] = schema
+
+        if tools is not None:
+            record["tools"] = tools
+
+        if record != self._server(identity):
+            self._servers[identity.key()] = record
+            self._servers_dirty = True
+
+    def _server(self, identity: Identity | None) -> dict:
+        if not self.enabled or identity is None:
+            return {}
+
+        record = self._servers.get(identity.key())
+
+        return record if isinstance(record, dict) else {}
+
+    def stats(self) -> Stats:
+        """Everything the store holds, by project and by tool, with the ledger's hit counts.
+
+        Reads every shard, which nothing on the board's own path does — this is for ``board.py
+        cache stats``, where the whole store is the question. **Only reads**: a shard found under
+        the wrong name is left where it is, for the next compaction to remove.
+        """
+        self._load_all()
+        projects: dict[str, Usage] = {}
+        tools: dict[str, Usage] = {}
+
+        for root, entries in self._shards.items():
+            for key, entry in entries.items():
+                size, hit, tool = _weight(key, entry), _hit_of(entry), _tool_of(key)
+                projects[root] = projects.get(root, Usage()).plus(size, hit)
+                tools[tool] = tools.get(tool, Usage()).plus(size, hit)
+
+        return Stats(outcomes=self._outcomes(), projects=projects, tools=tools)
+
+    def _outcomes(self) -> dict[str, dict[str, int]]:
+        """The ledger's counts with this session's added — what the next ledger will hold."""
+        recorded = self._ledger.get("outcomes")
+        merged: dict[str, Counter] = defaultdict(Counter)
+
+        for tool, counts in (recorded if isinstance(recorded, dict) else {}).items():
+            if isinstance(counts, dict):
+                merged[tool].update(
+                    {name: n for name, n in counts.items() if isinstance(n, int)}
+                )
+
+        for tool, counts in self._tally.items():
+            merged[tool].update(counts)
+
+        return {tool: dict(counts) for tool, counts in merged.items()}
 
     def clear(self) -> None:
         """Forget everything, in memory and on disk (FR13).
 
-        The file is removed rather than rewritten as an empty object: a user clearing the cache is
-        usually establishing that it is not the cause of what they are looking at, and a file that
-        is still there invites the next reader to wonder whether it was.
+        The store is removed rather than rewritten as empty shards: a user clearing the cache is
+        usually establishing that it is not the cause of what they are looking at, and a directory
+        that is still there invites the next reader to wonder whether it was. Only the files this
+        class writes are removed, so a directory somebody put something else in survives it.
         """
-        self._entries = {}
-        self._dirty = False
-        self.path.unlink(missing_ok=True)
+        self._shards = {}
+        self._counts = {}
+        self._sizes = {}
+        self._dirty = set()
+        self._servers = {}
+        self._servers_dirty = False
+        self._ledger = {}
+        self._tally = defaultdict(Counter)
+
+        for written in self.path.glob("*.json*") if self.path.is_dir() else ():
+            written.unlink(missing_ok=True)
+
+        try:
+            self.path.rmdir()
+        except OSError:
+            pass
 
     def save(self) -> None:
-        """Write the cache out, atomically, if anything changed.
+        """Write back every shard that changed, each atomically, and nothing that did not.
 
         The same rename dance the registry uses and for a weaker reason: a truncated cache is
         recoverable by definition. It is here anyway because the failure it prevents — a half-written
-        file that parses as a *shorter* one — is silent, and because the two files sitting side by
-        side should not have two different durability stories.
+        file that parses as a *shorter* one — is silent, and because the files sitting side by side
+        should not have two different durability stories. Per shard, so a session that read one
+        project out of fifty rewrites one file.
+
+        Then the store is held to its budgets: unregistered roots are dropped, and a store the
+        ledger says is over budget — or one with no ledger to say — is compacted (see the module
+        docstring). The ledger is written last, so totals on disk never describe shards that are not.
+
+        **A session that cached no answers writes nothing**, even when it learned what a server is.
+        The schema and the tool list are only worth keeping as the key to entries served without a
+        spawn, and a file holding them alone would be the board leaving something behind after a
+        `list` over projects that could not be read.
         """
-        if not self.enabled or not self._dirty:
+        if not self.enabled:
             return
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        staged = self.path.with_name(f"{self.path.name}.tmp")
+        self._retire_legacy()
+        self._prune()
+        dirty = [root for root in sorted(self._dirty) if self._shards.get(root)]
+
+        if not dirty and not self.path.is_dir():
+            return
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        totals = self._totals()
+
+        for root in dirty:
+            previous = self._store(root)
+            totals = _added(totals, previous, self._sizes[root])
+
+        self._dirty = set()
+
+        if totals is None or totals[0] > self.max_bytes or totals[1] > self.max_entries:
+            totals = self._compact()
+
+        if self._servers_dirty:
+            self._write(self.path / SERVERS_FILE, self._servers)
+            self._servers_dirty = False
+
+        if dirty or self._tally or totals != self._totals():
+            self._ledger = {
+                "bytes": totals[0],
+                "entries": totals[1],
+                "outcomes": self._outcomes(),
+            }
+            self._tally = defaultdict(Counter)
+            self._write(self.path / LEDGER_FILE, self._ledger)
+
+    def _totals(self) -> tuple[int, int] | None:
+        """The ledger's ``(bytes, entries)`` for the whole store, or ``None`` when it has none."""
+        totals = self._ledger.get("bytes"), self._ledger.get("entries")
+
+        return totals if all(isinstance(total, int) for total in totals) else None
+
+    def _store(self, root: str) -> tuple[int, int]:
+        """Write one shard back — or remove it, once nothing is left in it — and weigh the result."""
+        file = self.path / shard_name(Path(root))
+        entries = self._shards[root]
+        previous, self._sizes[root] = self._sizes.get(root, (0, 0)), (0, 0)
+
+        if entries:
+            self._write(file, {ROOT: root, ENTRIES: entries, ROWS: self._counts.get(root, {})})
+            self._sizes[root] = (_size(file), len(entries))
+        else:
+            file.unlink(missing_ok=True)
+
+        return previous
+
+    def _shard_files(self) -> list[Path]:
+        if not self.path.is_dir():
+            return []
+
+        return [
+            file
+            for file in self.path.glob("*.json")
+            if file.name not in (SERVERS_FILE, LEDGER_FILE)
+        ]
+
+    def _load_all(self) -> list[Path]:
+        """Read every shard on disk into memory; the files that are not where their root says.
+
+        Returned rather than removed, because :meth:`stats` reads the store through this and is
+        not a write; :meth:`_compact`, which is one, removes them.
+        """
+        strays = []
+
+        for file in self._shard_files():
+            root = self._read(file).get(ROOT)
+
+            if not isinstance(root, str) or file.name != shard_name(Path(root)):
+                strays.append(file)
+            else:
+                self._shard(Path(root))
+
+        return strays
+
+    def _retire_legacy(self) -> None:
+        """Remove :data:`LEGACY_FILE`, left behind by a board from before the store was sharded."""
+        legacy = self.path.with_name(LEGACY_FILE)
+
+        if legacy != self.path and legacy.is_file():
+            legacy.unlink(missing_ok=True)
+
+    def _prune(self) -> None:
+        """Drop every root the registry no longer holds, in memory and on disk.
+
+        Shards on disk are matched by filename against the registered roots' digests, so a prune
+        that finds nothing to drop reads nothing. One that does reads the shard it is about to
+        remove, for the entry count the ledger has to lose with it.
+        """
+        if self._registered is None:
+            return
+
+        kept = {str(root) for root in self._registered()}
+        names = {shard_name(Path(root)) for root in kept}
+
+        for root in [root for root in self._shards if root not in kept]:
+            self._shards[root] = {}
+            self._dirty.discard(root)
+            self._ledger = _dropped(self._ledger, self._store(root))
+            del self._shards[root], self._sizes[root]
+            self._counts.pop(root, None)
+
+        for file in self._shard_files():
+            if file.name not in names:
+                entries = self._read(file).get(ENTRIES)
+                self._ledger = _dropped(
+                    self._ledger, (_size(file), len(entries) if isinstance(entries, dict) else 0)
+                )
+                file.unlink(missing_ok=True)
+
+    def _compact(self) -> tuple[int, int]:
+        """Evict least recently served entries until the store is under :data:`LOW_WATER`.
+
+        Returns the store's new totals, counted from the shards themselves — which is also what
+        repairs a ledger that had drifted, or was never written. A shard found under a name that
+        is not its root's goes too: nothing would ever serve it.
+        """
+        for stray in self._load_all():
+            stray.unlink(missing_ok=True)
+
+        ranked = sorted(
+            (_hit_of(entry), root, key, _weight(key, entry))
+            for root, entries in self._shards.items()
+            for key, entry in entries.items()
+        )
+        weight = sum(size for *_, size in ranked)
+        count = len(ranked)
+        evicted = set()
+
+        for _, root, key, size in ranked:
+            if weight <= self.max_bytes * LOW_WATER and count <= self.max_entries * LOW_WATER:
+                break
+
+            del self._shards[root][key]
+            evicted.add(root)
+            weight -= size
+            count -= 1
+
+        for root in evicted:
+            self._store(root)
+
+        return (
+            sum(size for size, _ in self._sizes.values()),
+            sum(entries for _, entries in self._sizes.values()),
+        )
+
+    @staticmethod
+    def _write(path: Path, content: dict) -> None:
+        staged = path.with_name(f"{path.name}.tmp")
 
         try:
-            staged.write_text(json.dumps(self._entries) + "\n")
-            os.replace(staged, self.path)
+            staged.write_text(json.dumps(content) + "\n")
+            os.replace(staged, path)
         except OSError:
             staged.unlink(missing_ok=True)
             raise
 
-        self._dirty = False
+
+def _size(file: Path) -> int:
+    try:
+        return file.stat().st_size
+    except OSError:
+        return 0
+
+
+def _hit_of(entry: dict) -> float:
+    """When an entry was last served, or written if it never has been — what eviction orders by."""
+    for field in ("hit", "written"):
+        if isinstance(entry.get(field), (int, float)):
+            return entry[field]
+
+    return 0.0
+
+
+def _weight(key: str, entry: dict) -> int:
+    """What one entry costs in its shard, near enough: its key and its record as serialised."""
+    return len(key) + len(json.dumps(entry))
+
+
+def _tool_of(key: str) -> str:
+    return json.loads(key)[1]
+
+
+def _added(
+    totals: tuple[int, int] | None, previous: tuple[int, int], current: tuple[int, int]
+) -> tuple[int, int] | None:
+    """The totals after one shard went from ``previous`` to ``current``; unknown stays unknown."""
+    if totals is None:
+        return None
+
+    return tuple(total - before + after for total, before, after in zip(totals, previous, current))
+
+
+def _dropped(ledger: dict, removed: tuple[int, int]) -> dict:
+    """``ledger`` with one removed shard's bytes and entries taken off its totals."""
+    if not all(isinstance(ledger.get(total), int) for total in ("bytes", "entries")):
+        return ledger
+
+    return {
+        **ledger,
+        "bytes": max(0, ledger["bytes"] - removed[0]),
+        "entries": max(0, ledger["entries"] - removed[1]),
+    }
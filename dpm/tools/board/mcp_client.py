@@ -27,17 +27,30 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from collections import defaultdict, deque
-from collections.abc import Callable
+import time
+from collections import Counter, defaultdict, deque
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 # What makes a directory a dpm project, imported rather than restated: the pre-spawn check and the
 # registry's `add` have to be asking the same question, or a project can be registrable and
 # unreadable at once.
 from registry import DATABASE
-from cache import MISS, Cache, Stamp, stamp_of
+from cache import (
+    HIT,
+    MISS,
+    MISSED,
+    STALE,
+    Cache,
+    Identity,
+    Stamp,
+    entry_key,
+    identity_of,
+    stamp_of,
+)
+from metrics import CACHE, CALL, HANDSHAKE, METRICS, READ, SHARED, SPAWN, TOOLS_LIST, Metrics
 
 #: Environment variable holding an explicit path to the server executable.
 SERVER_OVERRIDE = "DPM_MCP_SERVER"
@@ -59,6 +72,19 @@ PLUGIN_NAME = "dpm"
 #: two agree rather than merely interoperate.
 PROTOCOL_VERSION = "2025-06-18"
 
+#: The notification that withdraws a request whose answer is no longer wanted.
+#:
+#: MCP's own, and advisory: a server may still answer. dpm's does — `src/server/mcp.js` drops every
+#: notification it has no handler for, and answers each request synchronously before it reads the
+#: next line, so by the time this arrives the reply is usually written. What makes a withdrawal
+#: real is the client's half: the id is remembered and its late reply dropped on arrival (see
+#: :meth:`MCPClient._read`). The notification is sent anyway, for a server that can act on it.
+CANCELLED = "notifications/cancelled"
+
+#: How many unsolicited messages a client keeps, newest last. Enough to see what a server has been
+#: saying lately; the whole conversation is the :class:`Recorder`'s to keep, not a live client's.
+UNMATCHED_KEPT = 32
+
 #: How the board identifies itself in the handshake.
 CLIENT_INFO = {"name": "dpm-board", "version": "0.1.0"}
 
@@ -155,6 +181,54 @@ DRAIN_TIMEOUT = 2.0
 #: warning a long session produced is a leak that only shows up in the sessions people leave open.
 DIAGNOSTIC_LINES = 200
 
+#: How many reads the pool puts on one project's server at once.
+#:
+#: **A cap per project, not per board.** The client pipelines (see :meth:`MCPClient._read`), so the
+#: limit is not about the pipe: it is about one Node process answering a survey's eight reads, two
+#: previews and a search together, where the reads past the first few only queue inside the server
+#: and make the ones a user is waiting on finish later. Every project gets its own, because a
+#: server being busy says nothing about any other.
+READ_WIDTH = 4
+
+#: How many servers the pool starts at once, whoever asked for them.
+#:
+#: **A cap on the pool, not on a caller.** The board admits its surveys a few at a time already (see
+#: ``board.SURVEY_WIDTH``), but a survey is not the only thing that spawns: every answer served
+#: stale is asked for again behind the row, and on a warm start past the window that is every
+#: project on the board at once — a handshake per project competing for the same cores, which is
+#: the storm the survey gate was there to prevent. Held across the start, the handshake and the
+#: surface check; a read of a server already running never waits for it.
+SPAWN_WIDTH = 8
+
+#: How long a server may sit without a read before the pool reaps it, in seconds.
+#:
+#: **AD4 keeps a server for the board's lifetime because startup is on the interaction path** — but
+#: a board left open over a long registry is one Node process and one open database per project,
+#: long after the cache has answered everything they were started for. Reaped, a server costs one
+#: handshake on the next miss, which is what AD4 priced a *first* read at anyway.
+IDLE = 300.0
+
+#: How many servers the pool keeps running at once. Past it, the server read longest ago is reaped
+#: to make room — never one with a read in flight, so under a burst wider than this the cap is
+#: exceeded rather than waited on: a read queued behind another project's server would be exactly
+#: the cross-project wait NFR3 forbids.
+MAX_LIVE = 16
+
+#: The states a project is left alone in for a while once its server has failed with one, and how
+#: long: :data:`BACKOFF` seconds after the first failure, doubling with each failure after it, and
+#: never more than :data:`BACKOFF_LIMIT`.
+#:
+#: **The states whose cause is outside the board and outside the project's database.** Each costs a
+#: Node boot, a handshake and a drain of up to :data:`DRAIN_TIMEOUT` to reach again, and a refresh,
+#: a rescan, a search and a gaps list each reach it once per project — for an answer that will be
+#: the same until dpm, Node or the database changes. The database and the executable are stat-ed at
+#: every read, so a change to either is tried at once; a Node upgrade is neither, and is what the
+#: limit is for. :data:`NO_DATABASE` is checked without a spawn and :data:`SURFACE_MISMATCH` is
+#: remembered per executable already (see :meth:`ServerPool._refuse_a_known_mismatch`).
+BACKED_OFF = frozenset({SERVER_FAILED, NODE_TOO_OLD, SCHEMA_AHEAD})
+BACKOFF = 5.0
+BACKOFF_LIMIT = 300.0
+
 
 def state_of(diagnostic: str) -> str | None:
     """The FR11 state one line of a server's stderr names, or ``None`` for an ordinary diagnostic.
@@ -184,20 +258,43 @@ class Framer:
 
     The buffer carries **bytes**, and each completed line is decoded on its own, so a multi-byte
     character split across the boundary is reassembled rather than half-decoded.
+
+    **Each byte is looked at once.** A reply with its sections' bodies can run to megabytes on one
+    line, arriving in 64 KiB reads, and a carry that was re-joined and re-split on every read copied
+    the whole of it each time — quadratic in the size of the one reply it was waiting for. The
+    buffer is appended to in place instead, and :attr:`_scanned` remembers how much of it is known
+    to hold no newline, so each read searches only the bytes it brought. A completed line is sliced
+    out once, for the parser, and the bytes before it are dropped from the front in one move.
     """
 
     def __init__(self) -> None:
-        self._carry = b""
+        self._buffer = bytearray()
+        # How many bytes at the front of the buffer have already been searched for a newline.
+        self._scanned = 0
 
     def feed(self, chunk: bytes) -> list[dict]:
         """Every message completed by ``chunk``, in order. The remainder is kept for the next one."""
-        self._carry += chunk
-        *complete, self._carry = self._carry.split(b"\n")
+        self._buffer += chunk
+        messages = []
+        start = 0
+
+        while (end := self._buffer.find(b"\n", max(start, self._scanned))) >= 0:
+            line = self._buffer[start:end]
+
+            if line.strip():
+                messages.append(self._parse(line))
+
+            start = end + 1
+
+        if start:
+            del self._buffer[:start]
 
-        return [self._parse(line) for line in complete if line.strip()]
+        self._scanned = len(self._buffer)
+
+        return messages
 
     @staticmethod
-    def _parse(line: bytes) -> dict:
+    def _parse(line: bytes | bytearray) -> dict:
         """One line of the protocol channel, or a refusal naming what arrived instead.
 
         Unparseable bytes on stdout are not noise to be skipped: stdout is the protocol channel and
@@ -206,9 +303,20 @@ class Framer:
         reply that has already been ruined.
         """
         try:
-            return json.loads(line)
+            message = json.loads(line)
         except json.JSONDecodeError as broken:
-            raise ValueError(f"not JSON-RPC on the server's stdout: {line!r}") from broken
+            raise ValueError(f"not JSON-RPC on the server's stdout: {bytes(line)!r}") from broken
+
+        # Valid JSON is not yet a message. JSON-RPC's is an object whose id, when it has one, is a
+        # string, a number or null — and the reader looks that id up, so anything else would fail
+        # there instead, as an error about a dictionary rather than about the server.
+        if not isinstance(message, dict):
+            raise ValueError(f"not a JSON-RPC message on the server's stdout: {bytes(line)!r}")
+
+        if not isinstance(message.get("id"), str | int | float | None):
+            raise ValueError(f"not a JSON-RPC id on the server's stdout: {bytes(line)!r}")
+
+        return message
 
 
 class ServerFailed(RuntimeError):
@@ -220,6 +328,43 @@ class ServerFailed(RuntimeError):
         self.data = data
 
 
+#: What each line of a recording is: a message the board sent, one a server sent back, or a line a
+#: server wrote on stderr (see :class:`Recorder`).
+SENT = "sent"
+RECEIVED = "received"
+STDERR = "stderr"
+
+
+class Recorder:
+    """Every message between the board and its servers, with when it crossed, as JSON lines.
+
+    What a replay needs is the whole conversation and its timing, so each line is one message —
+    in either direction, or a line of stderr, whose named states (FR11) are part of what a project
+    answered — stamped with its project and the seconds since the recording began. One recorder for
+    a pool, so a session over fifty projects is one file on one clock, and the replayed latency of
+    a reply is its distance from the request it answers.
+
+    **Written to a stream the caller opened.** The board opens two files, its registry and its
+    cache (see ``test_isolation``), and a recording is a developer's artefact rather than a third:
+    ``tests/support/record_session.py`` is what opens one around a real session, and the stand-in
+    that plays one back is ``tests/support/replay_server.py``.
+    """
+
+    def __init__(self, stream: TextIO, clock: Callable[[], float] = time.monotonic) -> None:
+        self._stream = stream
+        self._clock = clock
+        self._began = clock()
+
+    def __call__(self, project: Path, direction: str, message: dict) -> None:
+        line = {
+            "at": round(self._clock() - self._began, 6),
+            "project": str(project),
+            "direction": direction,
+            "message": message,
+        }
+        self._stream.write(json.dumps(line) + "\n")
+
+
 class MCPClient:
     """One conversation with one spawned ``bin/dpm-mcp.js``, over its stdio pipes (FR2).
 
@@ -241,11 +386,17 @@ class MCPClient:
         env: dict[str, str] | None = None,
         node: str = "node",
         on_diagnostic: Callable[[str], None] | None = None,
+        metrics: Metrics | None = None,
+        record: Recorder | None = None,
     ) -> None:
         self.server = server
         self.cwd = cwd
         self.env = env
         self.node = node
+        #: Where the spawn, the handshake and every request's round trip are timed, by project.
+        self.metrics = metrics if metrics is not None else METRICS
+        #: Where every message in and out goes as well, when this conversation is being recorded.
+        self.record = record
         self.protocol: str | None = None
         self.server_info: dict | None = None
         #: The last few lines the server wrote to stderr — surfaced, never parsed.
@@ -261,10 +412,17 @@ class MCPClient:
         self._process: asyncio.subprocess.Process | None = None
         self._draining: asyncio.Task | None = None
         self._framer = Framer()
-        self._unmatched: list[dict] = []
+        #: Messages that arrived carrying no id anything is waiting on — the last few of them.
+        self._unmatched: deque[dict] = deque(maxlen=UNMATCHED_KEPT)
+        #: Requests withdrawn while the server was still working on them, whose replies are dropped
+        #: when they arrive — see :meth:`_withdraw`.
+        self._withdrawn: set[int] = set()
+        #: One future per request in flight, keyed by its JSON-RPC id — see :meth:`_read`.
+        self._awaiting: dict[int, asyncio.Future] = {}
         self._next_id = 0
-        #: Held by whichever request is reading stdout — see :meth:`_receive`.
-        self._reading = asyncio.Lock()
+        self._reading: asyncio.Task | None = None
+        #: Why stdout stopped, once it has: every later request fails with this rather than waiting.
+        self._stopped: Exception | None = None
 
     @property
     def pid(self) -> int | None:
@@ -278,30 +436,33 @@ class MCPClient:
 
     async def start(self) -> MCPClient:
         """Spawn the server and complete the handshake; returns self, so a caller can chain."""
-        self._process = await asyncio.create_subprocess_exec(
-            self.node,
-            str(self.server),
-            cwd=str(self.cwd),
-            env=self.env,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        with self.metrics.timed(SPAWN, project=str(self.cwd)):
+            self._process = await asyncio.create_subprocess_exec(
+                self.node,
+                str(self.server),
+                cwd=str(self.cwd),
+                env=self.env,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
 
         # Started before the handshake, not after. A pipe nobody reads fills, and a server blocked
         # writing to stderr stops writing to stdout as well — so a server that complains loudly
         # enough during startup would hang the board before it ever answered `initialize`, with no
         # error anywhere and nothing to look at but a spinner.
         self._draining = asyncio.create_task(self._drain(self._process.stderr))
-
-        handshake = await self._request(
-            "initialize",
-            {
-                "protocolVersion": PROTOCOL_VERSION,
-                "capabilities": {},
-                "clientInfo": CLIENT_INFO,
-            },
-        )
+        self._reading = asyncio.create_task(self._read(self._process.stdout))
+
+        with self.metrics.timed(HANDSHAKE, project=str(self.cwd)):
+            handshake = await self._request(
+                "initialize",
+                {
+                    "protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": CLIENT_INFO,
+                },
+            )
 
         self.protocol = handshake.get("protocolVersion")
         self.server_info = handshake.get("serverInfo")
@@ -321,7 +482,11 @@ class MCPClient:
         for the tests, which have to be able to ask for a tool the board would never declare.
         """
         name = tool.name if isinstance(tool, Call) else tool
-        result = await self._request("tools/call", {"name": name, "arguments": arguments or {}})
+
+        with self.metrics.timed(CALL, tool=name, project=str(self.cwd)):
+            result = await self._request(
+                "tools/call", {"name": name, "arguments": arguments or {}}
+            )
 
         return self._unwrap(result)
 
@@ -342,7 +507,8 @@ class MCPClient:
 
     async def advertised(self) -> list[dict]:
         """The server's own ``tools/list``, for reconciling the declared surface against."""
-        listing = await self._request("tools/list", {})
+        with self.metrics.timed(TOOLS_LIST, project=str(self.cwd)):
+            listing = await self._request("tools/list", {})
 
         return listing.get("tools", [])
 
@@ -367,15 +533,22 @@ class MCPClient:
                 process.kill()
                 await process.wait()
 
-        if self._draining is not None:
-            draining, self._draining = self._draining, None
-            draining.cancel()
+        for attribute in ("_reading", "_draining"):
+            task = getattr(self, attribute)
+
+            if task is None:
+                continue
 
-            # Awaited after cancelling, so a drain that is mid-read is finished with rather than
-            # left as a pending task for the loop to complain about at shutdown.
+            setattr(self, attribute, None)
+            task.cancel()
+
+            # Awaited after cancelling, so a task that is mid-read is finished with rather than
+            # left as a pending task for the loop to complain about at shutdown. One that had
+            # already died has said why to everything that was waiting on it, and closing is not
+            # the place to raise it again.
             try:
-                await draining
-            except asyncio.CancelledError:
+                await task
+            except (asyncio.CancelledError, Exception):
                 pass
 
     async def _drain(self, stream: asyncio.StreamReader) -> None:
@@ -413,6 +586,9 @@ class MCPClient:
         if not text:
             return
 
+        if self.record is not None:
+            self.record(self.cwd, STDERR, {"line": text})
+
         self.diagnostics.append(text)
 
         if self.named_state is None:
@@ -440,13 +616,39 @@ class MCPClient:
         return None
 
     async def _request(self, method: str, params: dict) -> dict:
-        """Send a request and wait for the reply carrying its id."""
+        """Send a request and wait for the reply carrying its id.
+
+        **Pipelined: nothing here waits for anyone else's reply.** The future is registered before
+        the line is written, because the reader runs on its own and a fast server can answer before
+        ``drain`` returns — a reply routed to an id nobody had claimed yet would land in
+        ``_unmatched`` and leave this waiting on a pipe that has already said everything. A caller
+        cancelled while it waits takes its entry with it, and withdraws the request (see
+        :meth:`_withdraw`): the reply that arrives afterwards is dropped rather than resolving a
+        future nobody holds, or being held as unsolicited for the rest of the session.
+        """
         self._next_id += 1
         identifier = self._next_id
+        answer = asyncio.get_running_loop().create_future()
+        self._awaiting[identifier] = answer
+        sent = False
 
-        await self._send({"jsonrpc": "2.0", "id": identifier, "method": method, "params": params})
+        try:
+            if self._stopped is not None:
+                raise self._refusal(identifier)
+
+            await self._send(
+                {"jsonrpc": "2.0", "id": identifier, "method": method, "params": params}
+            )
+            sent = True
+            reply = await answer
+        except asyncio.CancelledError:
+            # Cancelled with this task if it was still waiting; a reply is one it holds a result for.
+            if sent and (answer.cancelled() or not answer.done()):
+                self._withdraw(identifier)
 
-        reply = await self._receive(identifier)
+            raise
+        finally:
+            self._awaiting.pop(identifier, None)
 
         if "error" in reply:
             error = reply["error"]
@@ -471,49 +673,120 @@ class MCPClient:
         """Send a notification — no id, so no reply is expected and none is waited for."""
         await self._send({"jsonrpc": "2.0", "method": method, "params": params or {}})
 
+    def _withdraw(self, identifier: int) -> None:
+        """Drop ``identifier``'s reply when it comes, and send :data:`CANCELLED` for it.
+
+        **The reply is what this is for.** dpm's server finishes a request it has read, so a
+        preview abandoned because the cursor moved on is still answered — often with a whole
+        document — and without this every one of them was kept among the unsolicited messages
+        for as long as the server ran.
+
+        The notification is not awaited, because it is sent from a task that is being cancelled
+        and has nothing left to wait with; a line this short fits the pipe's buffer. Nothing is
+        sent to a server already stopping — its requests are over either way.
+        """
+        stdin = self._process.stdin if self._process is not None else None
+
+        if self._stopped is not None or stdin is None or stdin.is_closing():
+            return
+
+        self._withdrawn.add(identifier)
+
+        message = {
+            "jsonrpc": "2.0",
+            "method": CANCELLED,
+            "params": {"requestId": identifier, "reason": "no longer wanted"},
+        }
+
+        if self.record is not None:
+            self.record(self.cwd, SENT, message)
+
+        stdin.write(json.dumps(message).encode() + b"\n")
+
     async def _send(self, message: dict) -> None:
         if self._process is None:
             raise ServerFailed(f"the server at {self.server} was not started")
 
+        if self.record is not None:
+            self.record(self.cwd, SENT, message)
+
         self._process.stdin.write(json.dumps(message).encode() + b"\n")
         await self._process.stdin.drain()
 
-    async def _receive(self, identifier: int) -> dict:
-        """Read until the reply to ``identifier`` arrives, keeping anything else that turns up.
+    async def _read(self, stream: asyncio.StreamReader) -> None:
+        """Read stdout for the whole session, handing each reply to the request carrying its id.
 
         Replies are matched by id rather than taken in order because the protocol permits a server
-        to answer out of order and to interleave notifications of its own. Nothing unmatched is
-        discarded: a message this board did not ask for is still evidence about what the server is
-        doing, and Story 3's transcript is only complete if it holds all of it.
-
-        **One reader at a time, because a pipe has one.** Two requests can be in flight together —
-        the browser builds an epic's preview and a story's in separate workers over one project's
-        server — and ``StreamReader.read()`` refuses a second waiter outright. So the id matching
-        above is not enough on its own: the coroutine holding the lock reads *everyone's* replies
-        into ``_unmatched``, and the ones waiting find theirs there when their turn comes. It is
-        deadlock-free because the holder only keeps reading until its own reply arrives, and a
-        request that already has one never takes the lock at all.
+        to answer out of order and to interleave notifications of its own. A message this board did
+        not ask for is still evidence about what the server is doing, so the last
+        :data:`UNMATCHED_KEPT` are kept — and every one is recorded, which is where Story 3's
+        transcript gets all of it. The reply to a withdrawn request is neither: it is the answer
+        the board said it no longer wanted, and is dropped.
+
+        **One reader for the life of the process, because a pipe has one.** Two requests can be in
+        flight together — the browser builds an epic's preview and a story's in separate workers
+        over one project's server — and ``StreamReader.read()`` refuses a second waiter outright.
+        The first version of this took turns: whichever request held a lock read *everyone's*
+        replies into a list, and the rest scanned it when their turn came, so a burst of N calls
+        paid N² list scans and every request serialised behind whichever reply happened to be
+        slowest. A task that owns the stream and resolves one future per id makes each reply a
+        dictionary lookup, and lets a caller write its request without waiting for anybody else's.
+
+        The end of the stream fails whatever is still waiting rather than leaving it to hang, and
+        stays failed: a request sent afterwards is refused at once with the same reason.
         """
-        while True:
-            for position, message in enumerate(self._unmatched):
-                if message.get("id") == identifier:
-                    return self._unmatched.pop(position)
-
-            async with self._reading:
-                # Whoever held the lock may have read this reply while we waited for it, in which
-                # case reading again would block on a server that has already answered.
-                if any(message.get("id") == identifier for message in self._unmatched):
-                    continue
-
-                chunk = await self._process.stdout.read(65536)
+        try:
+            while True:
+                chunk = await stream.read(65536)
 
                 if not chunk:
-                    raise ServerFailed(
-                        f"the server at {self.server} closed its stdout before "
-                        f"answering {identifier}"
-                    )
+                    break
+
+                for message in self._framer.feed(chunk):
+                    if self.record is not None:
+                        self.record(self.cwd, RECEIVED, message)
+
+                    identifier = message.get("id")
+
+                    if identifier in self._withdrawn:
+                        self._withdrawn.discard(identifier)
+                        continue
+
+                    waiting = self._awaiting.get(identifier)
+
+                    if waiting is None or waiting.done():
+                        self._unmatched.append(message)
+                    else:
+                        waiting.set_result(message)
+        except ValueError as broken:
+            # Not JSON-RPC on the protocol channel (see :meth:`Framer._parse`). The refusal goes to
+            # every caller rather than to the one whose read happened to see it, because the
+            # stream is ruined for all of them.
+            self._stop(broken)
+        except Exception as broken:
+            # Anything else that ends the reader ends it for every caller too. Left to escape, it
+            # would finish this task with nobody to resolve the futures, and each pending call
+            # would wait on a pipe no one was reading any more.
+            self._stop(broken)
+        else:
+            self._stop(ServerFailed(f"the server at {self.server} closed its stdout"))
+
+    def _stop(self, reason: Exception) -> None:
+        """Fail every request still waiting, and every one sent after, with ``reason``."""
+        self._stopped = reason
+
+        for identifier, waiting in list(self._awaiting.items()):
+            if not waiting.done():
+                waiting.set_exception(self._refusal(identifier))
+
+    def _refusal(self, identifier: int) -> Exception:
+        """What a request gets once stdout has stopped: the stream's own reason, naming its id."""
+        if isinstance(self._stopped, ServerFailed):
+            return ServerFailed(
+                f"the server at {self.server} closed its stdout before answering {identifier}"
+            )
 
-                self._unmatched.extend(self._framer.feed(chunk))
+        return self._stopped
 
 
 def _dpm_root() -> Path:
@@ -691,6 +964,38 @@ class Unreadable(RuntimeError):
         self.detail = detail
 
 
+class Refused(Unreadable):
+    """One call refused by a server that is otherwise well — an error reply, not a failure.
+
+    ``read_epic`` for an id that is not there is answered "Invalid params: no epic 99". That is the
+    caller's to render, like any other state; it says nothing about the project, so the pool does
+    not back off from it (see :data:`BACKED_OFF`) and the next read is sent as usual.
+    """
+
+
+@dataclass
+class Failing:
+    """A project whose server failed with one of :data:`BACKED_OFF`'s states, and when to retry it.
+
+    Held against the database's stamp and the executable's identity as they were when it failed: a
+    change to either is a different question, and is asked at once whatever the schedule says.
+    """
+
+    state: Unreadable
+    stamp: Stamp | None
+    identity: Identity | None
+    failures: int
+    until: float
+
+
+@dataclass
+class Flight:
+    """One read on the wire, and how many callers are waiting for its answer."""
+
+    task: asyncio.Future
+    waiting: int = 0
+
+
 class ServerPool:
     """One long-lived server per project, spawned on first read and reaped on exit (AD4, FR3).
 
@@ -713,6 +1018,13 @@ class ServerPool:
         node: str = "node",
         surface: dict[str, Call] | None = None,
         cache: Cache | None = None,
+        width: int = READ_WIDTH,
+        spawns: int = SPAWN_WIDTH,
+        idle: float | None = IDLE,
+        max_live: int | None = MAX_LIVE,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: Metrics | None = None,
+        record: Recorder | None = None,
     ) -> None:
         self.server = server if server is not None else server_path()
         self.node = node
@@ -720,20 +1032,69 @@ class ServerPool:
         #: :meth:`client`, which is the whole point of it: a hit answers without spawning anything,
         #: and a cold board over a dozen projects starts one server rather than twelve.
         self.cache = cache
-        #: The schema version the servers in this pool write, learned from the first handshake and
-        #: the same for every project — it is a property of the executable, not of a database.
-        #: ``None`` until one server has started, which is what makes an entry unservable until
-        #: then rather than servable against a guess (AD6).
-        self.schema: int | None = None
+        #: The executable's path, mtime and size — what the cache files everything it learned from
+        #: a handshake and a tool list under (see :mod:`cache`).
+        self.identity = identity_of(self.server)
+        #: The schema version the servers in this pool write, learned from a handshake and the same
+        #: for every project — it is a property of the executable, not of a database. Taken from
+        #: the cache when this same executable reported one in an earlier session, which is what
+        #: lets a warm start serve entries with no server running; otherwise ``None`` until one
+        #: server has started, which makes an entry unservable until then rather than servable
+        #: against a guess (AD6).
+        self.schema: int | None = cache.schema_for(self.identity) if cache is not None else None
         # The declared surface as it stands when the pool is built, not read live on every spawn:
         # a test needs to substitute one, and every server in a pool should be held to the same
         # contract even if something imports a new call site halfway through a session.
         self.surface = dict(SURFACE if surface is None else surface)
+        # What each executable advertised, by identity, for the session — and the lock that makes
+        # the first spawn ask while the others starting beside it wait for its answer. See
+        # :meth:`_advertised`.
+        self._listings: dict[Identity, list[dict]] = {}
+        self._listing = asyncio.Lock()
         self._env = env if env is not None else read_only_environment()
         self._clients: dict[Path, MCPClient] = {}
         # A lock per root, created on demand. `defaultdict` is safe here because building a Lock
         # does not await, so no two coroutines can arrive at the same key and get different ones.
         self._spawning: dict[Path, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # And one bound across every root on how many of those spawns run together — see
+        # :data:`SPAWN_WIDTH`.
+        self._starting = asyncio.Semaphore(spawns)
+        # The same on-demand construction for the read cap, keyed on the resolved root the client
+        # was spawned at — see :data:`READ_WIDTH`.
+        self._lanes: dict[Path, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(width)
+        )
+        # Re-reads owed for entries served stale, by root and then by entry, each run when the
+        # caller asks for it — see :meth:`_revalidate`. Keyed on the root as the caller passed it,
+        # which is how the cache keys its entries too.
+        self._revalidations: dict[Path, dict[str, Callable[[], Awaitable[bool]]]] = defaultdict(
+            dict
+        )
+        # Reads on the wire, by :func:`cache.entry_key`, each with the callers waiting on it — see
+        # :meth:`_single_flight`.
+        self._flights: dict[str, Flight] = {}
+        #: ``tools/call`` requests this session did not send, by tool, because an identical read
+        #: was already on the wire and the caller was given its answer instead.
+        self.saved: Counter[str] = Counter()
+        #: Seconds without a read before a server is reaped, or ``None`` to keep every server for the
+        #: session; and how many may run at once, or ``None`` for no cap. See :data:`IDLE`.
+        self.idle = idle
+        self.max_live = max_live
+        self._clock = clock
+        # When each live server last finished a read, and how many reads are between asking for it
+        # and being answered — a server with any is never reaped, whatever its timestamp says.
+        self._used: dict[Path, float] = {}
+        self._busy: Counter[Path] = Counter()
+        self._reaper: asyncio.Task | None = None
+        #: Servers reaped this session, by why: ``"idle"`` or ``"evicted"`` to stay under the cap.
+        self.reaped: Counter[str] = Counter()
+        # Projects backing off after a failure, by resolved root — see :data:`BACKED_OFF`.
+        self._failing: dict[Path, Failing] = {}
+        #: Where this pool's servers time their phases and its reads count their cache outcomes —
+        #: the process's registry unless a caller wants one of its own (see :mod:`metrics`).
+        self.metrics = metrics if metrics is not None else METRICS
+        #: Every server's conversation, recorded into one file for replaying later, or ``None``.
+        self.record = record
 
     async def client(self, root: Path) -> MCPClient:
         """The server for ``root``, spawning it the first time and reusing it after.
@@ -753,13 +1114,22 @@ class ServerPool:
         async with self._spawning[key]:
             if key not in self._clients:
                 self._refuse_without_a_database(key)
+                self._refuse_a_known_mismatch(key)
 
-                client = MCPClient(self.server, cwd=key, env=self._env, node=self.node)
+                client = MCPClient(
+                    self.server,
+                    cwd=key,
+                    env=self._env,
+                    node=self.node,
+                    metrics=self.metrics,
+                    record=self.record,
+                )
 
                 try:
-                    await client.start()
-                    self._learn_schema(client)
-                    await self._reconcile_or_refuse(client, key)
+                    async with self._starting:
+                        await client.start()
+                        self._learn_schema(client)
+                        await self._reconcile_or_refuse(client, key)
                 except ServerFailed as refusal:
                     # A server that never spoke protocol, or stopped between the handshake and its
                     # tool list. Which failure it was is on its stderr and nowhere else — below
@@ -775,12 +1145,139 @@ class ServerPool:
 
                     raise self._named(client, refusal) from refusal
 
+                await self._make_room()
                 self._clients[key] = client
+                self._used[key] = self._clock()
+
+                if self.idle is not None and self._reaper is None:
+                    self._reaper = asyncio.create_task(self._reap_forever())
 
         return self._clients[key]
 
+    async def reap_idle(self) -> int:
+        """Close every server that has gone :attr:`idle` seconds without a read; say how many.
+
+        The next read of a reaped project spawns it again through :meth:`client`, exactly as its
+        first read did, so nothing above the pool can tell a reaped server from one never started.
+        """
+        if self.idle is None:
+            return 0
+
+        now = self._clock()
+        idle = [key for key in self._clients if now - self._used.get(key, now) >= self.idle]
+
+        return await self._retire(idle, "idle")
+
+    async def _make_room(self) -> None:
+        """Reap the least recently read servers until one more fits under :attr:`max_live`."""
+        if self.max_live is None:
+            return
+
+        by_use = sorted(self._clients, key=lambda key: self._used.get(key, 0.0))
+        excess = len(self._clients) + 1 - self.max_live
+
+        await self._retire(by_use[: max(excess, 0)], "evicted")
+
+    async def _retire(self, keys: list[Path], reason: str) -> int:
+        """Take the servers at ``keys`` out of the pool and close them, skipping any that are busy.
+
+        Out of the pool before any await, so a read arriving while one is closing spawns a new
+        server rather than being handed the one on its way out.
+        """
+        retired = [
+            self._clients.pop(key) for key in keys if key in self._clients and not self._busy[key]
+        ]
+
+        for client in retired:
+            self._used.pop(client.cwd, None)
+            await client.close()
+
+        if retired:
+            self.reaped[reason] += len(retired)
+
+        return len(retired)
+
+    async def _reap_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle / 2)
+            await self.reap_idle()
+
+    def unreadable(self, root: Path) -> Unreadable | None:
+        """The state ``root`` failed with, while it is backing off from it; ``None`` otherwise.
+
+        What a fan-out asks before reading a project at all, and what a read raises instead of
+        spawning: the same state and detail the failure had, so a row refused from memory reads
+        exactly as it did when the server said it. ``None`` once the retry is due, or as soon as the
+        database or the executable is not what it was when the project failed.
+        """
+        key = root.resolve()
+        failing = self._failing.get(key)
+
+        if failing is None or self._clock() >= failing.until:
+            return None
+
+        if (failing.stamp, failing.identity) != (self._failure_stamp(key), identity_of(self.server)):
+            del self._failing[key]
+
+            return None
+
+        return failing.state
+
+    def _back_off(self, key: Path, state: Unreadable) -> None:
+        """Remember a failure in one of :data:`BACKED_OFF`'s states, doubling the wait each time."""
+        if state.state not in BACKED_OFF:
+            return
+
+        previous = self._failing.get(key)
+        failures = previous.failures + 1 if previous is not None else 1
+        self._failing[key] = Failing(
+            state=state,
+            stamp=self._failure_stamp(key),
+            identity=identity_of(self.server),
+            failures=failures,
+            until=self._clock() + min(BACKOFF * 2 ** (failures - 1), BACKOFF_LIMIT),
+        )
+
+    @staticmethod
+    def _failure_stamp(key: Path) -> Stamp | None:
+        # The database alone: the schema in a stamp is the executable's, which the identity beside
+        # it already covers — and a server that failed at its handshake never reported one.
+        return stamp_of(key, 0)
+
+    def running(self, root: Path) -> MCPClient | None:
+        """``root``'s server if one is running, without starting one — for a report about it."""
+        return self._clients.get(root.resolve())
+
+    def in_flight(self, root: Path) -> int:
+        """Reads of ``root`` between asking for its server and having the answer, the spawn included.
+
+        What a row still saying "reading…" is waiting on: none is a survey that has not been given
+        a slot yet (see :data:`board.SURVEY_WIDTH`), and some with no server running is a spawn or a
+        handshake that has not come back.
+        """
+        return self._busy[root.resolve()]
+
+    async def memory(self) -> dict[Path, int | None]:
+        """Each live server's resident set size in bytes, by project root; ``None`` if unreadable.
+
+        Read through ``ps`` rather than from ``/proc/<pid>/status`` directly: the figure is the same
+        one, but this module opens no files (see ``test_isolation``), and ``ps`` reports it on the
+        systems without a ``/proc`` as well. One ``ps`` for all of them, however many are live:
+        the diagnostics screen asks again on every refresh.
+        """
+        clients = list(self._clients.items())
+        sizes = await rss_of(client.pid for _, client in clients)
+
+        return {key: sizes.get(client.pid) for key, client in clients}
+
     async def read(
-        self, root: Path, tool: str, arguments: dict | None = None, *, fresh: bool = False
+        self,
+        root: Path,
+        tool: str,
+        arguments: dict | None = None,
+        *,
+        fresh: bool = False,
+        stale: bool = False,
     ) -> Any:
         """One read of one project: the pool's whole interface for everything above it.
 
@@ -793,25 +1290,117 @@ class ServerPool:
         ``fresh`` bypasses the cache for this read and refreshes what it holds (FR13). It does not
         empty the cache — the entry is replaced by what the server just said, which is what a user
         pressing refresh is asking for.
+
+        ``stale`` accepts an entry past its window whose stamp still matches, and owes a re-read of
+        it that :meth:`settled` asks (see :meth:`_revalidate`). The answer is the one a user saw
+        last time, on a database that has not changed since as far as a ``stat`` can tell — which
+        is worth painting now rather than after a spawn — and :meth:`revalidating` is how the
+        caller says so.
         """
         name = tool.name if isinstance(tool, Call) else tool
         stamp = self._stamp(root)
 
         if self.cache is not None and not fresh:
-            cached = self.cache.get(root, name, arguments, stamp)
+            cached, expired = self.cache.lookup(root, name, arguments, stamp)
+            outcome = MISSED if cached is MISS else STALE if expired else HIT
+            # Under the root as its server knows it, resolved, so that a project's cache outcomes
+            # and its server's timings are one project in a report and not two.
+            self.metrics.count(CACHE, outcome, tool=name, project=str(root.resolve()))
 
-            if cached is not MISS:
+            if cached is not MISS and not expired:
                 return cached
 
-        client = await self.client(root)
+            if cached is not MISS and stale:
+                self._revalidate(root, tool, arguments, cached)
+
+                return cached
+
+        return await self._single_flight(
+            entry_key(root, name, arguments), name, lambda: self._ask(root, tool, arguments)
+        )
+
+    async def _single_flight(
+        self, key: str, name: str, ask: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """One ``tools/call`` for every identical read that arrives while it is in flight.
+
+        The cursor outruns the server: a preview worker per highlighted row, a survey, a search and
+        a revalidation can all want the same section of the same project inside one round trip, and
+        every one of them sent separately is a request the server answers with what it just said.
+        Keyed exactly as the cache is — root as the caller passed it, tool, arguments — so that two
+        reads share a flight precisely when they would have shared an entry.
+
+        **A caller that leaves takes only itself.** Each waits through :func:`asyncio.shield`, so a
+        preview cancelled because the cursor moved does not cancel the read a survey is also waiting
+        on; the request is cancelled only when the last caller waiting on it has gone, rather than
+        being left to answer nobody.
+
+        **Unregistered as it is cancelled, not when the cancellation lands.** The task finishes on a
+        later turn of the loop, and a read arriving in between would join a flight nobody is
+        waiting on any more and be handed its `CancelledError`; so the key goes with the last
+        caller, and the done-callback removes only the flight it belongs to, never a newer one.
+        """
+        flight = self._flights.get(key)
+
+        if flight is None:
+            flight = self._flights[key] = Flight(asyncio.ensure_future(ask()))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        else:
+            self.saved[name] += 1
+            self.metrics.count(SHARED, "saved", tool=name)
+
+        flight.waiting += 1
 
         try:
-            answer = await client.call(tool, arguments)
-        except ServerFailed as refusal:
-            raise self._named(client, refusal) from refusal
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiting -= 1
+
+            if not flight.waiting and not flight.task.done():
+                self._land(key, flight)
+                flight.task.cancel()
+
+    def _land(self, key: str, flight: Flight) -> None:
+        """Take ``flight`` out of :attr:`_flights`, if it is still the one registered there."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def _ask(self, root: Path, tool: str | Call, arguments: dict | None) -> Any:
+        """The read itself: the server for ``root``, one call on it, and the answer cached.
 
-        if client.named_state is not None:
-            raise self._named(client, None)
+        Counted busy from before the server is asked for until the answer is in, so neither the
+        reaper nor the cap can close a server between handing it out and the call reaching it.
+        """
+        name = tool.name if isinstance(tool, Call) else tool
+        key = root.resolve()
+        known = self.unreadable(key)
+
+        if known is not None:
+            # A new one each time: the remembered one, raised again, would carry every traceback
+            # it had been raised through, for as long as the project backs off.
+            raise Unreadable(known.state, known.detail)
+
+        self._busy[key] += 1
+
+        try:
+            with self.metrics.timed(READ, tool=name, project=str(key)):
+                answer, client = await self._asked(root, tool, arguments)
+
+            if client.named_state is not None:
+                raise self._named(client, None)
+        except Refused:
+            # The server is well and said no to this one call; the next read is asked as usual.
+            raise
+        except Unreadable as state:
+            self._back_off(key, state)
+            raise
+        finally:
+            self._busy[key] -= 1
+
+            if key in self._clients:
+                self._used[key] = self._clock()
+
+        self._failing.pop(key, None)
 
         if self.cache is not None:
             # Stamped *after* the read, and with the schema this pool has now certainly learned:
@@ -821,6 +1410,93 @@ class ServerPool:
 
         return answer
 
+    async def _asked(
+        self, root: Path, tool: str | Call, arguments: dict | None
+    ) -> tuple[Any, MCPClient]:
+        """The server for ``root`` and one call on it, in its lane — :meth:`_ask`'s timed part."""
+        client = await self.client(root)
+
+        try:
+            # Only the call is inside the lane. A cache hit never reaches it, and neither does the
+            # spawn, which has its own lock — a read waiting for a lane behind a handshake would be
+            # counted against a cap that is about reads.
+            async with self._lanes[client.cwd]:
+                return await client.call(tool, arguments), client
+        except ServerFailed as refusal:
+            state = self._named(client, refusal)
+
+            # An error reply, from a server whose stderr named nothing: it answered, and the
+            # answer was no. Only a server that stopped, or named a state, is failing.
+            if refusal.code is not None and client.named_state is None:
+                raise Refused(state.state, state.detail) from refusal
+
+            raise state from refusal
+
+    def _revalidate(self, root: Path, tool: str | Call, arguments: dict | None, served: Any) -> None:
+        """Owe a re-read of an answer that was just served stale, asked when :meth:`settled` is.
+
+        One per entry, however many reads served it before it was asked: a survey and a preview
+        that both hit one expired entry are one question for the server. Its result is whether the
+        answer is now any different from the one served — or the failure, which is just as much a
+        change: a project that became unreadable behind a stale row has to repaint.
+
+        **Held rather than started.** A re-read of a project with no server running is a spawn, and
+        past the window every project on the board has one owed at once. Started here, they went
+        out the moment the rows painted, ahead of any cold project still waiting for its first
+        read; held, the caller decides when each project's are asked — the board, in its survey
+        gate behind the rows a user is looking at.
+        """
+        name = tool.name if isinstance(tool, Call) else tool
+        pending = self._revalidations[root]
+        key = entry_key(root, name, arguments)
+
+        if key in pending:
+            return
+
+        async def revalidate() -> bool:
+            try:
+                return await self.read(root, tool, arguments, fresh=True) != served
+            except Exception:  # noqa: BLE001 — re-read by the caller, which names the state
+                return True
+
+        pending[key] = revalidate
+
+    def expected_rows(
+        self, root: Path, tool: str | Call, arguments: dict | None = None
+    ) -> int | None:
+        """How many rows a whole read of ``tool`` came to last time, or ``None`` if nobody knows.
+
+        Remembered by the cache, so a pool without one knows nothing and pages as it always did.
+        """
+        name = tool.name if isinstance(tool, Call) else tool
+
+        return self.cache.rows_for(root, name, arguments) if self.cache is not None else None
+
+    def counted(
+        self, root: Path, tool: str | Call, arguments: dict | None, rows: int
+    ) -> None:
+        """Remember how many rows a whole read of ``tool`` came to, for :meth:`expected_rows`."""
+        if self.cache is not None:
+            self.cache.count(root, tool.name if isinstance(tool, Call) else tool, arguments, rows)
+
+    def revalidating(self, root: Path) -> bool:
+        """Whether any answer served for ``root`` is still owed a re-read."""
+        return bool(self._revalidations.get(root))
+
+    async def settled(self, root: Path) -> bool:
+        """Ask ``root``'s owed re-reads, and say whether any of them changed an answer.
+
+        Forgotten once asked, so the next stale read of the same entry — a session later, or a
+        window later — is revalidated again rather than found already done. Together, because they
+        are one project's reads on one server, which the lanes cap (see :data:`READ_WIDTH`).
+        """
+        pending = self._revalidations.pop(root, {})
+
+        if not pending:
+            return False
+
+        return any(await asyncio.gather(*(revalidate() for revalidate in pending.values())))
+
     def _stamp(self, root: Path) -> Stamp | None:
         """What a cached answer for ``root`` would be true of, as things stand (AD6)."""
         return stamp_of(root, self.schema)
@@ -837,6 +1513,9 @@ class ServerPool:
         if isinstance(reported, int):
             self.schema = reported
 
+            if self.cache is not None:
+                self.cache.learn(self.identity, schema=reported)
+
     @staticmethod
     def _named(client: MCPClient, refusal: ServerFailed | None) -> Unreadable:
         """The state a client is in, from what its stderr named or from the refusal itself.
@@ -857,6 +1536,15 @@ class ServerPool:
 
     async def close(self) -> None:
         """Reap every server. Failures are collected, not raised, so one bad exit reaps the rest."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+
+        # Re-reads still owed are dropped: each is a read on a server about to be closed, and one
+        # asked on the way out would respawn it.
+        self._revalidations.clear()
+
         clients, self._clients = list(self._clients.values()), {}
 
         for client in clients:
@@ -880,18 +1568,85 @@ class ServerPool:
         running would hold a database open for the rest of the session on behalf of a project that
         renders an error.
         """
-        complaints = reconcile(self.surface, await client.advertised())
+        complaints = reconcile(self.surface, await self._advertised(client))
 
         if not complaints:
             return
 
         await client.close()
 
-        raise Unreadable(
+        raise self._mismatch(root, complaints)
+
+    def _refuse_a_known_mismatch(self, root: Path) -> None:
+        """Refuse ``root`` before spawning, when this executable is already known not to serve us.
+
+        Every server in a pool is the same executable, so a verdict reached for one project is the
+        verdict for all of them: spawning the next one only to ask it the question its twin already
+        answered would be a process, a handshake and a ``tools/list`` to arrive at the same state.
+        Still :data:`SURFACE_MISMATCH`, with the same complaints — what the row says does not depend
+        on which project happened to be asked first.
+        """
+        identity = identity_of(self.server)
+        listing = self._remembered(identity) if identity is not None else None
+
+        if listing is None:
+            return
+
+        complaints = reconcile(self.surface, listing)
+
+        if complaints:
+            raise self._mismatch(root, complaints)
+
+    @staticmethod
+    def _mismatch(root: Path, complaints: list[str]) -> Unreadable:
+        return Unreadable(
             SURFACE_MISMATCH,
             f"the server at {root} does not serve what this board calls: " + "; ".join(complaints),
         )
 
+    async def _advertised(self, client: MCPClient) -> list[dict]:
+        """What this executable serves: remembered from an earlier ask, or asked now and remembered.
+
+        The listing is a property of the executable, like the schema, so it is filed under the
+        executable's identity — path, mtime and size — and asked for once per identity rather than
+        once per project: in memory for the session, and in the cache for the sessions after it.
+        The identity is taken again at each spawn rather than once for the pool, so a plugin updated
+        underneath a running board is a different executable and is asked again.
+
+        **Once, not once each** (NFR3). A cold board over forty projects starts forty servers at
+        the same moment, and all forty would find nothing remembered and ask. The lock makes the
+        first ask and the rest wait for its answer; a first that fails — its server died before it
+        listed — leaves nothing remembered, and the next in line asks instead.
+        """
+        identity = identity_of(self.server)
+
+        if identity is None:
+            return await client.advertised()
+
+        async with self._listing:
+            remembered = self._remembered(identity)
+
+            if remembered is not None:
+                return remembered
+
+            advertised = await client.advertised()
+            self._listings[identity] = advertised
+
+            if self.cache is not None:
+                self.cache.learn(identity, tools=advertised)
+
+        return advertised
+
+    def _remembered(self, identity: Identity) -> list[dict] | None:
+        """What ``identity`` advertised this session, or in an earlier one the cache kept."""
+        if identity not in self._listings and self.cache is not None:
+            persisted = self.cache.tools_for(identity)
+
+            if persisted is not None:
+                self._listings[identity] = persisted
+
+        return self._listings.get(identity)
+
     @staticmethod
     def _refuse_without_a_database(root: Path) -> None:
         """FR3's guard: no database, no process.
@@ -911,6 +1666,37 @@ class ServerPool:
         await self.close()
 
 
+async def rss_of(pids: Iterable[int | None]) -> dict[int, int]:
+    """The resident set size in bytes of each of ``pids`` that can be read, from one ``ps``.
+
+    A pid that is ``None``, or names no process by the time ``ps`` looks, is left out.
+    """
+    wanted = sorted({pid for pid in pids if pid is not None})
+
+    if not wanted:
+        return {}
+
+    try:
+        ps = await asyncio.create_subprocess_exec(
+            "ps", "-o", "pid=,rss=", "-p", ",".join(map(str, wanted)),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        out, _ = await ps.communicate()
+    except OSError:
+        return {}
+
+    sizes = {}
+
+    for line in out.decode().splitlines():
+        fields = line.split()
+
+        if len(fields) == 2 and all(field.isdigit() for field in fields):
+            sizes[int(fields[0])] = int(fields[1]) * 1024
+
+    return sizes
+
+
 def read_only_environment(base: dict[str, str] | None = None) -> dict[str, str]:
     """The environment every board-spawned server gets (FR3, ENVX3).
 
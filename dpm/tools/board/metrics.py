@@ -0,0 +1,255 @@
+"""Where the board's time goes: timings and counts by phase, by tool and by project (NFR3).
+
+A slow board has half a dozen places its time can be — a spawn, a handshake, the ``tools/list`` the
+surface is reconciled against, each ``tools/call``, the cache, and the markdown raster — and
+nothing on screen says which. This is the in-process registry they all record into: one
+:class:`Histogram` per phase, tool and project, and a count per event, summed at
+:meth:`Metrics.snapshot` into the two views the question is asked in — *which tool* and *which
+project*.
+
+**In process, and nothing else.** No exporter, no socket and no file: a snapshot is a dict, and
+what prints it is ``board.py stats`` or the board's exit when :data:`ON_EXIT` is set, both to a
+stream the caller already holds (see :mod:`board`). The board writes two files and this is not a
+reason for a third.
+
+**Cheap enough to leave on.** A record is a lock, a dict lookup and a bucket increment, against a
+``tools/call`` that costs a round trip through a pipe. Buckets rather than samples, so a session
+that runs for a week holds the same few kilobytes it held after a minute.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+#: The phases a read can spend its time in, in the order a cold read passes through them.
+SPAWN = "spawn"
+HANDSHAKE = "handshake"
+TOOLS_LIST = "tools/list"
+CALL = "tools/call"
+#: A read as its caller waited for it, uncached: the server, its lane and the call together.
+READ = "read"
+#: A project's row, from the survey asking for it to the survey having it — the first sample for a
+#: project is its time to first row.
+SURVEY = "survey"
+RASTER = "raster"
+
+#: What is counted rather than timed: the cache's three outcomes, by their names in :mod:`cache`,
+#: reads that joined one already in flight rather than sending their own, and whether a preview
+#: found its raster already made (a hit or a miss, by the same names).
+CACHE = "cache"
+SHARED = "shared"
+RASTERS = "rasters"
+
+#: Set in the environment, and the board writes a snapshot to stderr as it exits.
+ON_EXIT = "DPM_BOARD_METRICS"
+
+#: Bucket upper bounds, in seconds: doubling from a quarter of a millisecond to about sixteen
+#: seconds, which is a quantile to within a factor of two at any scale a board has.
+BOUNDS = tuple(0.00025 * 2**n for n in range(17))
+
+
+@dataclass
+class Histogram:
+    """How long something took, by count per bucket — quantiles to within a bucket's width."""
+
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(BOUNDS) + 1))
+    count: int = 0
+    total: float = 0.0
+    longest: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.buckets[bisect_left(BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.longest = max(self.longest, seconds)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        return Histogram(
+            [mine + theirs for mine, theirs in zip(self.buckets, other.buckets)],
+            self.count + other.count,
+            self.total + other.total,
+            max(self.longest, other.longest),
+        )
+
+    def quantile(self, q: float) -> float:
+        """The upper bound of the bucket the ``q``-th sample fell in; the longest past the last."""
+        wanted = q * self.count
+        seen = 0
+
+        for bound, count in zip(BOUNDS, self.buckets):
+            seen += count
+
+            if count and seen >= wanted:
+                return min(bound, self.longest)
+
+        return self.longest
+
+    def as_json(self) -> dict:
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else None,
+            "p50": round(self.quantile(0.5), 6),
+            "p90": round(self.quantile(0.9), 6),
+            "p99": round(self.quantile(0.99), 6),
+            "max": round(self.longest, 6),
+        }
+
+
+class Metrics:
+    """The registry: every timing and count, keyed by ``(phase, tool, project)``.
+
+    Either of ``tool`` and ``project`` may be ``None`` — a spawn has no tool and a raster has no
+    project — and is then left out of that view rather than filed under a name that is not one.
+    Locked, because a raster runs on a worker thread and records from there.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: defaultdict[tuple, Histogram] = defaultdict(Histogram)
+        self._counts: Counter[tuple] = Counter()
+        #: Each key's first and latest sample, numbered so the latest across several keys can be
+        #: told apart: a histogram knows how many and how long, and not in what order.
+        self._order = itertools.count()
+        self._first: dict[tuple, tuple[int, float]] = {}
+        self._latest: dict[tuple, tuple[int, float]] = {}
+
+    def record(
+        self, phase: str, seconds: float, *, tool: str | None = None, project: str | None = None
+    ) -> None:
+        key = phase, tool, project
+
+        with self._lock:
+            self._timings[key].add(seconds)
+            sample = next(self._order), seconds
+            self._first.setdefault(key, sample)
+            self._latest[key] = sample
+
+    @contextmanager
+    def timed(
+        self, phase: str, *, tool: str | None = None, project: str | None = None
+    ) -> Iterator[None]:
+        """Record how long the block took, whether it returned or raised: both were waited on."""
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started, tool=tool, project=project)
+
+    def count(
+        self, event: str, outcome: str, *, tool: str | None = None, project: str | None = None
+    ) -> None:
+        with self._lock:
+            self._counts[event, outcome, tool, project] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings.clear()
+            self._counts.clear()
+            self._first.clear()
+            self._latest.clear()
+
+    def timing(self, phase: str, *, tool: str | None = None, project: str | None = None) -> Histogram:
+        """One phase's samples, narrowed to a tool or a project if one is named."""
+        with self._lock:
+            found = Histogram()
+
+            for (named, by_tool, by_project), histogram in self._timings.items():
+                if named == phase and tool in (None, by_tool) and project in (None, by_project):
+                    found = found.merge(histogram)
+
+        return found
+
+    def first(
+        self, phase: str, *, tool: str | None = None, project: str | None = None
+    ) -> float | None:
+        """The earliest sample :meth:`timing` would merge, or ``None`` if there is none yet."""
+        return self._sample(self._first, min, phase, tool, project)
+
+    def latest(
+        self, phase: str, *, tool: str | None = None, project: str | None = None
+    ) -> float | None:
+        """The most recent sample :meth:`timing` would merge, or ``None`` if there is none yet."""
+        return self._sample(self._latest, max, phase, tool, project)
+
+    def _sample(self, samples: dict, pick, phase: str, tool, project) -> float | None:
+        with self._lock:
+            found = [
+                sample
+                for (named, by_tool, by_project), sample in samples.items()
+                if named == phase and tool in (None, by_tool) and project in (None, by_project)
+            ]
+
+        return pick(found)[1] if found else None
+
+    def counted(
+        self, event: str, *, tool: str | None = None, project: str | None = None
+    ) -> Counter[str]:
+        """One event's outcomes, narrowed as :meth:`timing` narrows."""
+        with self._lock:
+            found: Counter[str] = Counter()
+
+            for (named, outcome, by_tool, by_project), n in self._counts.items():
+                if named == event and tool in (None, by_tool) and project in (None, by_project):
+                    found[outcome] += n
+
+        return found
+
+    def snapshot(self) -> dict:
+        """Everything, as JSON: each phase whole, by tool and by project; each count the same way."""
+        with self._lock:
+            timings: dict[str, dict] = {}
+            counts: dict[str, dict] = {}
+
+            for (phase, tool, project), histogram in self._timings.items():
+                views = timings.setdefault(
+                    phase, {"all": Histogram(), "tools": {}, "projects": {}}
+                )
+                views["all"] = views["all"].merge(histogram)
+
+                for view, name in (("tools", tool), ("projects", project)):
+                    if name is not None:
+                        views[view][name] = views[view].get(name, Histogram()).merge(histogram)
+
+            for (event, outcome, tool, project), n in self._counts.items():
+                views = counts.setdefault(event, {"all": Counter(), "tools": {}, "projects": {}})
+                views["all"][outcome] += n
+
+                for view, name in (("tools", tool), ("projects", project)):
+                    if name is not None:
+                        views[view].setdefault(name, Counter())[outcome] += n
+
+        return {
+            "timings": {
+                phase: {
+                    "all": views["all"].as_json(),
+                    "tools": {name: h.as_json() for name, h in sorted(views["tools"].items())},
+                    "projects": {
+                        name: h.as_json() for name, h in sorted(views["projects"].items())
+                    },
+                }
+                for phase, views in timings.items()
+            },
+            "counts": {
+                event: {
+                    "all": dict(views["all"]),
+                    "tools": {name: dict(c) for name, c in sorted(views["tools"].items())},
+                    "projects": {name: dict(c) for name, c in sorted(views["projects"].items())},
+                }
+                for event, views in counts.items()
+            },
+        }
+
+
+#: The process's registry. One, because a board is one process and every pool, client and panel in
+#: it is answering the same question; a test that wants its own builds a :class:`Metrics` and hands
+#: it to the pool.
+METRICS = Metrics()
@@ -32,14 +32,27 @@ nothing anywhere saying so.
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from pathlib import Path
+from time import perf_counter
+from typing import Any
 
 from mcp_client import ServerPool, declare
 
 #: How many rows one request asks for. Not a bound on the answer — :func:`rows` follows ``more``.
 PAGE = 500
 
+#: The largest page :func:`rows` grows to for a list it saw run past :data:`PAGE` last time. Doubled
+#: up from :data:`PAGE` rather than set to the count itself, so a list that gains a story asks for
+#: the same pages — and finds the same cache entries — as it did before.
+MAX_PAGE = 4000
+
+#: How many pages :func:`rows` asks for at once after a full one, when it has no count to go by.
+#: The project's read lanes (:data:`mcp_client.READ_WIDTH`) are what bound it on the wire.
+AHEAD = 4
+
 # The board's read surface, declared where it is called (NFR5). One declaration per tool name,
 # here rather than in `board.py`, because `SURFACE` is keyed on the name: two `declare("list_epic",
 # …)` calls in two modules would leave whichever imported last, and the reconciliation would check
@@ -88,6 +101,19 @@ DOCUMENT_READS = {
     "retro": declare("read_retro", "id"),
 }
 
+#: How long each tool's answers are trusted before they are served stale, by tool name (FR13).
+#: Tools not named here take :data:`cache.WINDOW`.
+#:
+#: **Set by how often the answer changes, not by how expensive it is to get.** The epic list is the
+#: first thing a user edits and the thing the board is opened to read, so it goes stale soonest.
+#: The integrity sweep reports invariants that hold for weeks at a time — a violation is a bug in a
+#: write path rather than the ordinary course of work — and re-running thirteen sweeps and a
+#: foreign-key check every five minutes buys a badge that says the same thing it said an hour ago.
+WINDOWS = {
+    EPICS.name: 60.0,
+    INTEGRITY.name: 3600.0,
+}
+
 #: The states an epic row can be rendered in. Two of them — `BLOCKED` and `IN_PROGRESS` — are the
 #: board's, derived; the rest are the status column's own words.
 COMPLETE = "complete"
@@ -132,7 +158,13 @@ def derivation(rule: str):
 
 
 async def rows(
-    pool: ServerPool, root: Path, call, arguments: dict | None = None, *, fresh: bool = False
+    pool: ServerPool,
+    root: Path,
+    call,
+    arguments: dict | None = None,
+    *,
+    fresh: bool = False,
+    stale: bool = False,
 ) -> list[dict]:
     """Every row one list tool has, as rows.
 
@@ -142,28 +174,142 @@ async def rows(
     ``fresh`` is FR13's force-refresh, passed through to the pool: the answer is asked for again
     whatever the cache holds. It threads down from the action a user pressed rather than being
     decided here, because this function has no way of knowing whether the user has just written
-    something the stamp cannot see.
+    something the stamp cannot see. ``stale`` is the pool's too, threaded the same way: the survey
+    asks for it and a preview does not.
 
     **A truncated read is a wrong count, not a smaller project**, so this follows ``more`` rather
     than stopping at :data:`PAGE`. Every figure the board renders is a count of these rows, and a
     page boundary would take stories out of a denominator and epics off a candidate list with
     nothing anywhere saying so. `dpm:status` states the same rule for the same reason: raise the
     bound and read again rather than reporting the page.
+
+    **Later pages are asked for together, not one reply at a time.** Followed serially, a list of
+    5,000 stories was ten round trips end to end before the project's row could paint. dpm answers
+    ``more`` and never a total, so the total is guessed: from the count the last whole read came to
+    (:meth:`~mcp_client.ServerPool.expected_rows`), which sizes the pages — see :func:`page_for` —
+    and says how many to ask for at once; or, with no count to go by, from a full page, after which
+    :data:`AHEAD` pages go out together. The answer is the pages in offset order up to the first
+    without ``more``, so a guess that was too high costs an empty page and never a row, and one that
+    was too low costs another round.
     """
+    arguments = arguments or {}
+    expected = pool.expected_rows(root, call, arguments)
+    page = page_for(expected)
+    ahead = max(1, -(-expected // page)) if expected is not None else 1
     found: list[dict] = []
+    offset = 0
 
     while True:
-        answer = await pool.read(
-            root, call, {"limit": PAGE, "offset": len(found), **(arguments or {})}, fresh=fresh
+        planned = await execute(
+            {
+                str(n): pool.read(
+                    root,
+                    call,
+                    {"limit": page, "offset": offset + n * page, **arguments},
+                    fresh=fresh,
+                    stale=stale,
+                )
+                for n in range(ahead)
+            }
         )
-        found += answer["items"]
 
-        if not answer.get("more"):
-            return found
+        for answer in planned.values.values():
+            found += answer["items"]
+
+            if not answer.get("more"):
+                pool.counted(root, call, arguments, len(found))
+
+                return found
+
+        offset += ahead * page
+        ahead = AHEAD
+
+
+def page_for(expected: int | None) -> int:
+    """The page size for a list expected to hold ``expected`` rows: :data:`PAGE`, doubled to fit.
+
+    Doubled rather than matched so that the size — which is part of every page's cache key — only
+    moves when the list crosses a power of two, and capped at :data:`MAX_PAGE` so that no single
+    reply is the whole of a very large project.
+    """
+    page = PAGE
+
+    while expected is not None and page < expected and page < MAX_PAGE:
+        page *= 2
+
+    return page
+
+
+@dataclass(frozen=True)
+class Planned:
+    """What a read plan answered, by the name each read was given, and how long each one took.
+
+    ``critical_path`` is the longest single read, each timed from being asked for to being
+    answered — so a spawn, and a wait for a lane on the project's server (see
+    :data:`mcp_client.READ_WIDTH`), are inside it along with the call, because all of them happen
+    inside the pool. ``elapsed`` is the whole plan, and with every read started at once that is the
+    same longest read plus the plan's own scheduling: the two do not tell waiting from reading.
+    The pool's metrics do — :data:`metrics.CALL` is timed inside the lane, :data:`metrics.READ`
+    around it.
+    """
+
+    values: dict[str, Any]
+    timings: dict[str, float]
+    elapsed: float
+
+    @property
+    def critical_path(self) -> float:
+        return max(self.timings.values(), default=0.0)
+
+
+async def execute(plan: dict[str, Awaitable]) -> Planned:
+    """Run a plan's independent reads concurrently, and answer with all of them or with none.
+
+    **Concurrently, because a project's reads do not depend on each other.** The survey's eight go
+    to one server, and awaiting them one after another makes the project's row wait for the sum of
+    eight round trips where the longest of them would do. How many are actually on the server at
+    once is the pool's decision, not this one's: it caps reads per project, so a plan can name
+    everything it needs and the queue forms where the server is.
+
+    **One failure ends the plan**, and the rest are cancelled rather than left to finish. The
+    caller is about to render a state in place of the whole answer — an :class:`Unreadable` from
+    the first read to notice it — and reads still in flight would be spending a server's time on a
+    row that no longer wants them. The exception is the read's own, re-raised as it was: a
+    ``TaskGroup`` would wrap it in an ``ExceptionGroup``, and every caller here names states by
+    catching :class:`Unreadable` itself.
+    """
+    timings: dict[str, float] = {}
+    started = perf_counter()
+
+    async def timed(name: str, read: Awaitable) -> Any:
+        began = perf_counter()
+        answer = await read
+        timings[name] = perf_counter() - began
+
+        return answer
+
+    tasks = {name: asyncio.ensure_future(timed(name, read)) for name, read in plan.items()}
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    return Planned(
+        values={name: task.result() for name, task in tasks.items()},
+        timings=timings,
+        elapsed=perf_counter() - started,
+    )
 
 
 @derivation("readiness")
-async def ready_epic_ids(pool: ServerPool, root: Path, *, fresh: bool = False) -> set[str]:
+async def ready_epic_ids(
+    pool: ServerPool, root: Path, *, fresh: bool = False, stale: bool = False
+) -> set[str]:
     """The epics dpm says can be worked on now — its answer, not ours.
 
     ``ready`` is the whole of :func:`readyClause`: pending, unarchived, and nothing incomplete
@@ -171,11 +317,15 @@ async def ready_epic_ids(pool: ServerPool, root: Path, *, fresh: bool = False) -
     reconstruct the predicate from the rows, which is the one thing that would make this a second
     implementation of dpm's rule.
     """
-    return {row["id"] for row in await rows(pool, root, EPICS, {"ready": True}, fresh=fresh)}
+    ready = await rows(pool, root, EPICS, {"ready": True}, fresh=fresh, stale=stale)
+
+    return {row["id"] for row in ready}
 
 
 @derivation("readiness")
-async def ready_story_ids(pool: ServerPool, root: Path, *, fresh: bool = False) -> set[str]:
+async def ready_story_ids(
+    pool: ServerPool, root: Path, *, fresh: bool = False, stale: bool = False
+) -> set[str]:
     """The stories dpm says can be worked on now.
 
     A story's blockers are not all stories — ``dependency`` reaches a story from another story and
@@ -183,7 +333,9 @@ async def ready_story_ids(pool: ServerPool, root: Path, *, fresh: bool = False)
     derived: a board reading only story-to-story edges would report a story ready while an epic it
     names holds it up.
     """
-    return {row["id"] for row in await rows(pool, root, STORIES, {"ready": True}, fresh=fresh)}
+    ready = await rows(pool, root, STORIES, {"ready": True}, fresh=fresh, stale=stale)
+
+    return {row["id"] for row in ready}
 
 
 @dataclass(frozen=True)
@@ -212,7 +364,9 @@ def edge_target(edge: dict) -> str:
 
 
 @derivation("blocking")
-async def gating_kinds(pool: ServerPool, root: Path, *, fresh: bool = False) -> set[str]:
+async def gating_kinds(
+    pool: ServerPool, root: Path, *, fresh: bool = False, stale: bool = False
+) -> set[str]:
     """The edge kinds that hold work up, read from ``gates_work`` rather than named here.
 
     **A list of kind names in this file would be the hardcoded list dpm removed**, one layer up.
@@ -229,7 +383,9 @@ async def gating_kinds(pool: ServerPool, root: Path, *, fresh: bool = False) ->
     disagreement between the two answers about the same project, which is exactly what the
     contract exists to prevent.
     """
-    kinds = await rows(pool, root, DEPENDENCY_KINDS, {"include_retired": True}, fresh=fresh)
+    kinds = await rows(
+        pool, root, DEPENDENCY_KINDS, {"include_retired": True}, fresh=fresh, stale=stale
+    )
 
     return {row["kind"] for row in kinds if row["gates_work"]}
 
@@ -276,7 +432,9 @@ def violation_count(report: dict) -> int:
     return broken + len(report.get("orphans", ()))
 
 
-async def violations(pool: ServerPool, root: Path, *, fresh: bool = False) -> int:
+async def violations(
+    pool: ServerPool, root: Path, *, fresh: bool = False, stale: bool = False
+) -> int:
     """One project's integrity report, counted (FR17).
 
     **Undecorated, and that is a decision rather than an omission.** Every other read in this module
@@ -285,12 +443,14 @@ async def violations(pool: ServerPool, root: Path, *, fresh: bool = False) -> in
     one — and a rule nothing else conforms to would be a contract entry written for a single
     reader, which the reconciliation would then fail from the other side.
     """
-    return violation_count(await pool.read(root, INTEGRITY, {}, fresh=fresh))
+    return violation_count(await pool.read(root, INTEGRITY, {}, fresh=fresh, stale=stale))
 
 
-async def dependencies(pool: ServerPool, root: Path, *, fresh: bool = False) -> list[dict]:
+async def dependencies(
+    pool: ServerPool, root: Path, *, fresh: bool = False, stale: bool = False
+) -> list[dict]:
     """Every edge in the project, in one read, to be grouped by target in the caller."""
-    return await rows(pool, root, DEPENDENCIES, fresh=fresh)
+    return await rows(pool, root, DEPENDENCIES, fresh=fresh, stale=stale)
 
 
 @derivation("blocking")
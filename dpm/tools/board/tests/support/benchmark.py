@@ -0,0 +1,224 @@
+"""How the board scales with the registry and with a project: first paint to full board (NFR3).
+
+    uv run python tests/support/benchmark.py results.json
+    uv run python tests/support/benchmark.py results.json --projects 1,10,50 --stories 10,500,5000
+
+Each scenario is a registry of N synthetic projects of S stories apiece, served by the recording
+stand-in (``RECORDING_STORIES``, see :func:`recording_server.synthetic`) through a real pool with no
+cache, and a real :class:`board.BoardApp` driven headlessly through :mod:`pilot`. What it reports
+is what a user waits through, in order:
+
+``registry_paint``
+    the Projects column showing the registry, before any server has answered;
+``first_project``
+    the first project's row read;
+``all_projects``
+    every row read, which is the board complete;
+
+and what the board cost getting there: ``peak_servers`` and ``servers_peak_rss``, sampled through
+:meth:`mcp_client.ServerPool.memory` while it ran, and ``board_peak_rss``, the board process's own
+resident set sampled alongside them. Sampled rather than read off ``ru_maxrss``, which is the
+process's high water mark over its whole life: every scenario after the largest would report the
+largest's. Each scenario also carries :mod:`metrics`' per-phase summary, so a regression in the
+totals can be traced to the phase it came from.
+
+**Timed at the survey the app was handed, not by polling.** A pilot's first look is after the app
+has mounted and settled, by which point a small registry has been read entirely and every time
+would be the same. The app paints the registry before it starts a single survey, and paints a row
+in the same step that its survey returns, so the first survey's start and each survey's end are
+when those things reached the screen — the pilot then checks that they did.
+
+**The stand-in and not dpm**, because a benchmark that includes Node and SQLite is one whose
+numbers move with the machine. A real session is what :mod:`replay_server` is for; this is the
+board's own scaling, with everything under it held still.
+
+The results file is JSON — the commit it ran at, and a scenario per line of the matrix — so two
+runs on two commits are compared with a diff.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+SUPPORT = Path(__file__).resolve().parent
+
+# Run as a script, so the board and the rest of the support modules are put on the path by hand.
+sys.path[:0] = [str(SUPPORT.parent.parent), str(SUPPORT)]
+
+from pilot import board, lines, until  # noqa: E402 — after the path they need
+
+from board import survey_project  # noqa: E402
+from board_view import ProjectView  # noqa: E402
+from mcp_client import ServerPool, rss_of  # noqa: E402
+from metrics import METRICS  # noqa: E402
+
+STAND_IN = SUPPORT / "recording_server.py"
+
+#: The default matrix: registry sizes, and stories per project.
+PROJECTS = (1, 10, 50)
+STORIES = (10, 500, 5_000)
+
+#: Longest a scenario may take to read every project before it is reported as not finishing.
+TIMEOUT = 300.0
+
+#: Seconds between samples of the pool's servers and of the board.
+SAMPLE = 0.25
+
+
+@dataclass
+class Scenario:
+    """One line of the matrix, and what it measured. Times are seconds from the app starting, and
+    ``None`` for a board that did not finish within the timeout."""
+
+    projects: int
+    stories: int
+    registry_paint: float | None = None
+    first_project: float | None = None
+    all_projects: float | None = None
+    peak_servers: int = 0
+    servers_peak_rss: int = 0
+    board_peak_rss: int = 0
+    phases: dict = field(default_factory=dict)
+
+
+def stage(into: Path, projects: int) -> list[ProjectView]:
+    """``projects`` directories with the ``.dpm/dpm.db`` the pool looks for, as registry rows."""
+    views = []
+
+    for n in range(projects):
+        root = into / f"p{n:03d}"
+        (root / ".dpm").mkdir(parents=True)
+        (root / ".dpm" / "dpm.db").touch()
+        views.append(ProjectView(name=root.name, path=root, pending=True))
+
+    return views
+
+
+async def run_scenario(projects: int, stories: int, *, timeout: float = TIMEOUT) -> Scenario:
+    """Measure one board over ``projects`` synthetic projects of ``stories`` stories each."""
+    measured = Scenario(projects, stories)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        views = stage(Path(scratch), projects)
+        os.environ["RECORDING_TRANSCRIPT"] = str(Path(scratch) / "transcript.jsonl")
+        os.environ["RECORDING_STORIES"] = str(stories)
+        METRICS.clear()
+
+        async with ServerPool(STAND_IN, node=sys.executable) as pool:
+
+            async def sample_once() -> None:
+                memory = await pool.memory()
+                measured.peak_servers = max(measured.peak_servers, len(memory))
+                measured.servers_peak_rss = max(
+                    measured.servers_peak_rss, sum(rss or 0 for rss in memory.values())
+                )
+                own = await rss_of([os.getpid()])
+                measured.board_peak_rss = max(measured.board_peak_rss, own.get(os.getpid(), 0))
+
+            async def sample() -> None:
+                while True:
+                    await sample_once()
+                    await asyncio.sleep(SAMPLE)
+
+            asked: list[float] = []
+            answered: list[float] = []
+
+            async def survey(project: ProjectView, *, fresh: bool = False) -> ProjectView:
+                asked.append(time.perf_counter() - started)
+
+                try:
+                    return await survey_project(pool, project, fresh=fresh)
+                finally:
+                    answered.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            sampling = asyncio.create_task(sample())
+
+            try:
+                async with board(views, survey=survey) as (app, pilot):
+                    painted = await until(
+                        pilot,
+                        lambda: len(answered) == projects
+                        and not any(row.pending for row in app.selection.projects)
+                        and any(views[0].name in line for line in lines(app, "projects")),
+                        timeout=timeout,
+                    )
+                    # Once more with everything read, so a board too quick for the sampler to have
+                    # caught it running is not reported as having run no servers at all.
+                    await sample_once()
+            finally:
+                sampling.cancel()
+                await asyncio.gather(sampling, return_exceptions=True)
+
+    if painted:
+        measured.registry_paint = min(asked)
+        measured.first_project = min(answered)
+        measured.all_projects = max(answered)
+
+    measured.phases = {
+        phase: views["all"] for phase, views in METRICS.snapshot()["timings"].items()
+    }
+
+    return measured
+
+
+def commit() -> str | None:
+    """The commit the board was measured at, so two results files say what they are comparing."""
+    try:
+        found = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=SUPPORT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return found.stdout.strip()
+
+
+async def run(projects=PROJECTS, stories=STORIES, *, timeout: float = TIMEOUT) -> dict:
+    """Every scenario in the matrix, one after another — concurrently they would measure each other."""
+    scenarios = [
+        await run_scenario(n, s, timeout=timeout) for n in projects for s in stories
+    ]
+
+    return {"commit": commit(), "scenarios": [asdict(scenario) for scenario in scenarios]}
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out", type=Path, help="Where to write the results, as JSON.")
+    parser.add_argument("--projects", default=",".join(map(str, PROJECTS)))
+    parser.add_argument("--stories", default=",".join(map(str, STORIES)))
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(
+        run(
+            [int(n) for n in args.projects.split(",")],
+            [int(n) for n in args.stories.split(",")],
+            timeout=args.timeout,
+        )
+    )
+    args.out.write_text(json.dumps(results, indent=2) + "\n")
+
+    for scenario in results["scenarios"]:
+        print(
+            f"{scenario['projects']:>4} × {scenario['stories']:>5}  "
+            f"registry {scenario['registry_paint']}  first {scenario['first_project']}  "
+            f"all {scenario['all_projects']}  servers {scenario['peak_servers']}",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
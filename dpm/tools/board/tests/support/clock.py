@@ -0,0 +1,18 @@
+"""A clock a test moves by hand, for everything in the board that is handed one.
+
+The pool's reaper and back-off, and the cache's windows and last-use ledger, all read the time
+through a ``clock`` argument rather than off the system, so a test can make a server go idle, a
+window pass or days go by between sessions without anybody waiting for them.
+"""
+
+from __future__ import annotations
+
+
+class Clock:
+    """Stands still at ``now`` until a test assigns it a later one."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
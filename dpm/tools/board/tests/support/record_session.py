@@ -0,0 +1,38 @@
+"""Run the real board over the real registry, recording every server's conversation to a file.
+
+    uv run python tests/support/record_session.py session.jsonl
+
+The capture half of :mod:`replay_server`: browse as usual — survey, previews, a search — and quit,
+and ``session.jsonl`` holds everything the board sent and every server answered, on one clock. The
+pool has no cache, so every read the session made is on the wire and in the file. It
+lives here rather than behind a flag on ``board.py`` because the board writes two files and nothing
+else (see ``test_isolation``); this script is what opens the third, and it is not shipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Run as a script from anywhere, so the board's modules are put on the path by hand.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from board import _browse_with  # noqa: E402 — after the path it needs
+from mcp_client import Recorder, ServerPool  # noqa: E402
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 1:
+        print(__doc__.strip().splitlines()[2].strip(), file=sys.stderr)
+        return 2
+
+    with Path(argv[0]).open("w") as stream:
+        recorder = Recorder(stream)
+        asyncio.run(_browse_with(None, lambda: ServerPool(record=recorder)))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
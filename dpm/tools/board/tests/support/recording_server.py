@@ -12,7 +12,10 @@ Configured entirely by environment, because it is spawned by the client under te
 takes no arguments for the server: ``RECORDING_TRANSCRIPT`` is where to append, ``RECORDING_STDERR``
 is a line to emit on stderr before answering — the bait for FR2's stderr must-NOT — and
 ``RECORDING_SCHEMA`` is the schema version to report in the handshake, which is what the freshness
-cache stamps against.
+cache stamps against, ``RECORDING_STORIES`` makes the project one of that many stories (see
+:func:`synthetic`), ``RECORDING_CALL_DELAY`` holds each ``tools/call`` back, which is what
+leaves a read in flight long enough to be abandoned, and ``RECORDING_MISSING`` names ids a read
+refuses as dpm does a document that is not there.
 
 Its answers also carry the conditions it was launched under — cwd, argv, and every ``DPM_``
 variable in its environment — which is what lets FR3's read-only criterion be asserted from the
@@ -46,6 +49,20 @@ SCHEMA = os.environ.get("RECORDING_SCHEMA")
 #: cannot tell it from a real one.
 DELAY = float(os.environ.get("RECORDING_DELAY", "0"))
 
+#: Seconds to wait before answering each `tools/call` — a read slow enough to be cancelled mid-way.
+CALL_DELAY = float(os.environ.get("RECORDING_CALL_DELAY", "0"))
+
+#: Ids, comma-separated, that a ``tools/call`` naming one answers with dpm's error reply for a
+#: document that does not exist — a healthy server refusing one call, rather than failing.
+MISSING = {name for name in os.environ.get("RECORDING_MISSING", "").split(",") if name}
+
+#: How many stories the project answers with, or none at all when unset — see :func:`synthetic`.
+STORIES = int(os.environ.get("RECORDING_STORIES", "0"))
+
+#: Stories to an epic in a synthetic project, and the statuses they take in turn.
+EPIC_SIZE = 20
+STATUSES = ("complete", "in_progress", "pending", "pending")
+
 #: What this stand-in advertises when asked for `tools/list`, overridable by `RECORDING_TOOLS`.
 #:
 #: Deliberately a *copy* of the shape dpm serves rather than anything derived from the board, so it
@@ -124,11 +141,54 @@ def transcript_of(path: Path) -> list[dict]:
     return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
 
 
+def synthetic(stories: int) -> dict[str, list[dict]]:
+    """A project of ``stories`` stories, :data:`EPIC_SIZE` to an epic, for the list tools to page.
+
+    For the scalability benchmark (``benchmark.py``), which needs projects of a known size without
+    building a real database for each: the rows are the shape dpm's ``list_*`` tools return, so the
+    board derives states and counts from them exactly as it would from real ones.
+    """
+    epics = [
+        {
+            "id": f"E{n:04d}",
+            "title": f"Epic {n}",
+            "status": "in_progress",
+            "parent_id": None,
+        }
+        for n in range(-(-stories // EPIC_SIZE))
+    ]
+    rows = [
+        {
+            "id": f"S{n:05d}",
+            "title": f"Story {n}",
+            "status": STATUSES[n % len(STATUSES)],
+            "epic_id": epics[n // EPIC_SIZE]["id"],
+        }
+        for n in range(stories)
+    ]
+
+    return {"list_epic": epics, "list_story": rows}
+
+
+def page(items: list[dict], arguments: dict) -> dict:
+    """One page of ``items`` as dpm answers it: ``limit`` from ``offset``, and ``more`` past it."""
+    offset, limit = arguments.get("offset", 0), arguments.get("limit", len(items))
+
+    return {"items": items[offset : offset + limit], "more": len(items) > offset + limit}
+
+
 def reply(identifier: int, result: dict) -> None:
     sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": identifier, "result": result}) + "\n")
     sys.stdout.flush()
 
 
+def refuse(identifier: int, message: str) -> None:
+    """The error reply dpm sends for bad arguments: the category, and what was wrong in ``data``."""
+    error = {"code": -32602, "message": "Invalid params", "data": {"message": message}}
+    sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": identifier, "error": error}) + "\n")
+    sys.stdout.flush()
+
+
 def spawned_pids(path: Path) -> list[int]:
     """Every stand-in that ever started, by process id. Empty when none did."""
     if not path.exists():
@@ -148,6 +208,8 @@ def main() -> None:
         with open(register, "a") as pids:
             pids.write(f"{os.getpid()}\n")
 
+    lists = synthetic(STORIES) if STORIES else {}
+
     for line in sys.stdin:
         with open(destination, "a") as transcript:
             transcript.write(line)
@@ -189,17 +251,29 @@ def main() -> None:
                 {"tools": DEFAULT_TOOLS if override is None else json.loads(override)},
             )
         elif method == "tools/call":
+            if CALL_DELAY:
+                time.sleep(CALL_DELAY)
+
             # Reports its own launch conditions as data. FR3 asks that a spawned server be
             # read-only and rooted at the project, and the only witness that cannot be fooled by
             # the board's intentions is the process itself: this is its cwd, its argv, and the dpm
             # variables actually present in its environment.
+            tool = message["params"]["name"]
+            arguments = message["params"].get("arguments") or {}
+
+            if str(arguments.get("id")) in MISSING:
+                refuse(message["id"], f"no {tool.removeprefix('read_')} {arguments['id']}")
+                continue
+
+            # The shape dpm's `list_*` tools return, so a caller that reads the answer rather than
+            # merely receiving it has something to read. Nothing is ready in a synthetic project:
+            # readiness is dpm's derivation, and a stand-in that made one up would be a second.
+            listed = page([] if arguments.get("ready") else lists.get(tool, []), arguments)
             answer = {
                 "from": "stdout",
-                "tool": message["params"]["name"],
-                # The shape dpm's `list_*` tools return, so a caller that reads the answer rather
-                # than merely receiving it has something to read.
-                "items": [],
-                "returned": 0,
+                "tool": tool,
+                **listed,
+                "returned": len(listed["items"]),
                 "cwd": os.getcwd(),
                 "argv": sys.argv,
                 "dpm_environment": {
@@ -0,0 +1,168 @@
+"""A stand-in MCP server that answers from a recording, at the recorded pace or a scaled one (NFR3).
+
+A benchmark against the real server is a benchmark of whatever Node, the disk and the databases on
+the machine were doing that afternoon, and a change to the survey, a preview or the search cannot be
+told apart from that noise — or run at all on a machine without Node and the projects. This plays
+back a session a :class:`mcp_client.Recorder` captured instead: each request the board sends is
+matched against the ones recorded for its project, and answered with the reply it got then, after
+the delay it waited then.
+
+Configured by environment, as :mod:`recording_server` is and for its reason — the client under test
+takes no arguments for its server: ``REPLAY_RECORDING`` is the recording, ``REPLAY_SCALE`` multiplies
+every recorded delay (``0`` answers at once, ``1`` is the default and the recorded pace), and
+``REPLAY_PROJECTS`` is the file :func:`stage` writes, naming the recorded project each staged
+directory stands for.
+
+**Matched, not merely replayed in order.** The board's order of requests depends on its scheduling,
+which is exactly what a benchmark is changing; a replay that insisted on the recorded order would
+fail on every improvement. A request is matched by method and arguments, repeated ones are answered
+in their recorded order and then with the last of them, and one that was never recorded is a
+JSON-RPC error naming it — so a benchmark that asks for something new says so rather than measuring
+an empty answer. The handshake is matched by method alone, because what differs between a board
+then and a board now is its ``clientInfo`` and not what it is asking.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+#: The recording's line kinds, as :mod:`mcp_client` writes them. Copied rather than imported, so the
+#: stand-in runs from a recording without the board's modules on its path.
+SENT = "sent"
+RECEIVED = "received"
+STDERR = "stderr"
+
+#: The file :func:`stage` writes beside the directories it makes.
+PROJECTS = "replay-projects.json"
+
+#: JSON-RPC's code for a server-defined error, which a request missing from the recording is.
+NOT_RECORDED = -32000
+
+
+@dataclass
+class Answer:
+    """One recorded reply: how long after its request it came, and what stderr said after it."""
+
+    delay: float
+    reply: dict
+    stderr: list[str] = field(default_factory=list)
+
+
+def recording_of(path: Path) -> list[dict]:
+    """Every line of a recording, in order."""
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def match(message: dict) -> str:
+    """What a request is recognised by: its method, and its arguments for anything but the handshake."""
+    if message["method"] == "initialize":
+        return "initialize"
+
+    return json.dumps([message["method"], message.get("params")], sort_keys=True)
+
+
+def load(lines: list[dict], project: str) -> dict[str, deque[Answer]]:
+    """One project's recorded answers, by :func:`match`, each kind's in the order they were given.
+
+    Stderr goes with the reply before it, which is when the server wrote it: a diagnostic the real
+    server emits on its first ``tools/call`` arrives after that call's answer here too.
+    """
+    asked: dict[object, tuple[str, float]] = {}
+    answers: dict[str, deque[Answer]] = defaultdict(deque)
+    last: Answer | None = None
+
+    for line in lines:
+        if line["project"] != project:
+            continue
+
+        message = line["message"]
+
+        if line["direction"] == SENT and "id" in message:
+            asked[message["id"]] = match(message), line["at"]
+        elif line["direction"] == RECEIVED and message.get("id") in asked:
+            key, at = asked.pop(message["id"])
+            last = Answer(max(line["at"] - at, 0.0), message)
+            answers[key].append(last)
+        elif line["direction"] == STDERR and last is not None:
+            last.stderr.append(message["line"])
+
+    return answers
+
+
+def stage(recording: Path, into: Path) -> dict[str, Path]:
+    """A directory standing in for each recorded project, with the ``.dpm/dpm.db`` the pool looks for.
+
+    The database is empty — nothing reads it, the recording answers for it — and exists only because
+    the pool will not spawn a server at a root without one (FR11). Returns each recorded project's
+    stand-in, and writes the reverse of it to :data:`PROJECTS` for the servers to find theirs by.
+    """
+    projects = list(dict.fromkeys(line["project"] for line in recording_of(recording)))
+    staged: dict[str, Path] = {}
+
+    for n, project in enumerate(projects):
+        root = into / f"{n:03d}-{Path(project).name}"
+        (root / ".dpm").mkdir(parents=True, exist_ok=True)
+        (root / ".dpm" / "dpm.db").touch()
+        staged[project] = root
+
+    (into / PROJECTS).write_text(
+        json.dumps({str(root.resolve()): project for project, root in staged.items()})
+    )
+
+    return staged
+
+
+def main() -> None:
+    lines = recording_of(Path(os.environ["REPLAY_RECORDING"]))
+    scale = float(os.environ.get("REPLAY_SCALE", "1"))
+    here = str(Path.cwd().resolve())
+    projects = os.environ.get("REPLAY_PROJECTS")
+    project = json.loads(Path(projects).read_text()).get(here, here) if projects else here
+    answers = load(lines, project)
+    writing = threading.Lock()
+
+    def send(message: dict, stderr: list[str]) -> None:
+        with writing:
+            sys.stdout.write(json.dumps(message) + "\n")
+            sys.stdout.flush()
+
+            for line in stderr:
+                sys.stderr.write(line + "\n")
+
+            sys.stderr.flush()
+
+    for line in sys.stdin:
+        message = json.loads(line)
+
+        if "id" not in message:
+            continue
+
+        recorded = answers.get(match(message))
+
+        if not recorded:
+            error = {"code": NOT_RECORDED, "message": f"not in the recording: {match(message)}"}
+            send({"jsonrpc": "2.0", "id": message["id"], "error": error}, [])
+            continue
+
+        # Each answer once, in order, and then the last of them for as long as it is asked for.
+        answer = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        reply = {**answer.reply, "id": message["id"]}
+        # Stderr once, though: a server states a condition when it first meets it, not per reply.
+        stderr, answer.stderr = answer.stderr, []
+
+        # On a timer each rather than in turn, because the real server is pipelined: a slow reply
+        # recorded behind a fast one must not hold the fast one up when the two are replayed.
+        timer = threading.Timer(answer.delay * scale, send, (reply, stderr))
+        timer.daemon = True
+        timer.start()
+
+
+# Guarded, so a test can import `stage` and `load` without serving a protocol on its own stdin.
+if __name__ == "__main__":
+    main()
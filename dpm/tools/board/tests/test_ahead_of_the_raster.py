@@ -21,7 +21,7 @@ from time import perf_counter
 from conftest import stand_in_pool  # noqa: F401 — imported for its fixtures
 from pilot import board, preview, until
 
-from board import markdown_content, read_document_preview
+from board import RASTER_CACHE, markdown_content, read_document_preview
 from board_view import EpicView, ProjectView
 from mcp_client import ServerPool
 from status_model import EPICS, rows
@@ -166,6 +166,8 @@ async def test_the_largest_document_renders_inside_the_budget(fixture_project):
         times = []
 
         for _ in range(5):
+            # Emptied each run, so each run is a render rather than the one kept from the last.
+            RASTER_CACHE.clear()
             started = perf_counter()
             markdown_content(source, WIDTH)
             times.append(perf_counter() - started)
@@ -0,0 +1,156 @@
+"""A project whose server failed is left alone for a while, and tried at once when it changes (NFR3).
+
+A server that exits at its handshake costs a Node boot and a drain of its stderr to find out about,
+and a refresh, a rescan, a search and a gaps list each used to find out again — one failure paid for
+per project per action, for an answer that stays the same until something under it does. These pin
+the schedule that replaces that: the state is remembered and re-raised without a spawn, the wait
+doubles with each failure up to a limit, and a change to the database or to the executable is a new
+question asked straight away.
+
+**Spawns are counted by the server, not the pool**: the stub appends a line to a file each time it
+starts, which is the one count a pool that believed it had not spawned could not get wrong.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from clock import Clock
+from conftest import STAND_IN
+from recording_server import transcript_of
+
+from board import search_projects
+from board_view import ProjectView
+from cache import DATABASE
+from mcp_client import BACKOFF, BACKOFF_LIMIT, SERVER_FAILED, ServerPool, Unreadable
+from status_model import DOCUMENT_READS, EPICS
+
+
+def failing_server(tmp_path: Path) -> tuple[Path, Path]:
+    """A server that writes down that it started, then exits before the handshake; and its log."""
+    started = tmp_path / "started"
+    stub = tmp_path / "fails.py"
+    stub.write_text(
+        "import sys\n"
+        f"open({str(started)!r}, 'a').write('started\\n')\n"
+        "sys.stderr.write('stopped\\n')\n"
+        "sys.exit(1)\n"
+    )
+
+    return stub, started
+
+
+def starts(log: Path) -> int:
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+async def refusal(pool: ServerPool, root: Path) -> Unreadable:
+    with pytest.raises(Unreadable) as raised:
+        await pool.read(root, EPICS)
+
+    return raised.value
+
+
+async def test_a_failed_project_is_refused_from_memory_with_the_state_it_failed_in(
+    project, tmp_path
+):
+    root = project()
+    server, log = failing_server(tmp_path)
+
+    async with ServerPool(server, node=sys.executable, clock=Clock(), idle=None) as pool:
+        first = await refusal(pool, root)
+        again = await refusal(pool, root)
+        last = await refusal(pool, root)
+
+    assert first.state == SERVER_FAILED
+    assert (again.state, again.detail) == (first.state, first.detail)
+    assert again is not last, "the same exception was raised again, its traceback growing each time"
+    assert starts(log) == 1, "a server already known to fail was spawned to fail again"
+
+
+async def test_the_wait_doubles_with_each_failure_up_to_the_limit(project, tmp_path):
+    root = project()
+    server, log = failing_server(tmp_path)
+    clock = Clock()
+
+    async with ServerPool(server, node=sys.executable, clock=clock, idle=None) as pool:
+        await refusal(pool, root)
+
+        clock.now += BACKOFF
+        await refusal(pool, root)
+        assert starts(log) == 2, "the first retry was not made once the wait was over"
+
+        clock.now += BACKOFF
+        await refusal(pool, root)
+        assert starts(log) == 2, "the second wait was no longer than the first"
+
+        clock.now += BACKOFF
+        await refusal(pool, root)
+        assert starts(log) == 3
+
+        # However many failures there have been, the wait never exceeds the limit.
+        for _ in range(10):
+            clock.now += BACKOFF_LIMIT
+            await refusal(pool, root)
+
+        assert starts(log) == 13
+
+
+async def test_a_changed_database_or_executable_is_tried_again_at_once(project, tmp_path):
+    root = project()
+    server, log = failing_server(tmp_path)
+
+    async with ServerPool(server, node=sys.executable, clock=Clock(), idle=None) as pool:
+        await refusal(pool, root)
+
+        (root / DATABASE).write_bytes(b"written since")
+        await refusal(pool, root)
+        assert starts(log) == 2, "a database written since the failure was not asked about"
+
+        server.write_text(server.read_text() + "# upgraded\n")
+        await refusal(pool, root)
+        assert starts(log) == 3, "an executable replaced since the failure was not asked about"
+
+
+async def test_a_search_skips_a_project_backing_off_without_spawning_it(project, tmp_path):
+    root = project()
+    server, log = failing_server(tmp_path)
+    view = ProjectView(name=root.name, path=root)
+
+    async with ServerPool(server, node=sys.executable, clock=Clock(), idle=None) as pool:
+        await refusal(pool, root)
+
+        assert await search_projects(pool, [view], "anything") == []
+        assert pool.unreadable(root).state == SERVER_FAILED
+
+    assert starts(log) == 1
+
+
+async def test_a_tool_s_error_reply_is_the_caller_s_and_leaves_the_project_alone(
+    project, transcript, monkeypatch
+):
+    """"no epic 99" is an answer from a server that is well, not a server failing.
+
+    Backed off, it refused the project's next survey, preview and search unsent for as long as the
+    schedule said — over one preview of an epic that had just been deleted.
+    """
+    monkeypatch.setenv("RECORDING_MISSING", "99")
+    root = project()
+
+    async with ServerPool(STAND_IN, node=sys.executable, clock=Clock(), idle=None) as pool:
+        with pytest.raises(Unreadable) as raised:
+            await pool.read(root, DOCUMENT_READS["epic"], {"id": "99"})
+
+        assert raised.value.state == SERVER_FAILED
+        assert "no epic 99" in raised.value.detail, f"the server's reason was lost: {raised.value}"
+        assert pool.unreadable(root) is None, "a refused call backed the whole project off"
+
+        listed = await pool.read(root, EPICS)
+
+    assert listed["tool"] == EPICS.name
+    assert [message["params"]["name"] for message in transcript_of(transcript)[-2:]] == [
+        "read_epic",
+        "list_epic",
+    ], "the list after the refused read was never sent"
@@ -0,0 +1,69 @@
+"""The scalability benchmark measures a real board over synthetic projects (NFR3).
+
+The harness is run by hand and not by the suite, but a benchmark that has quietly stopped measuring
+— a stand-in that serves nothing, times that are all the same instant, a results file missing the
+commit — reports a regression as a win. These pin that each number comes from what it says it does.
+"""
+
+from __future__ import annotations
+
+import json
+
+from benchmark import main, run_scenario
+from conftest import stand_in_pool
+
+from board import survey_project
+from board_view import ProjectView
+from metrics import SPAWN
+
+#: Long enough for a handful of stand-ins on a loaded machine.
+TIMEOUT = 60.0
+
+#: Bytes touched before a scenario, far more than a board of three small projects holds.
+BALLAST = 512 * 2**20
+
+
+async def test_the_stand_in_serves_a_synthetic_project_of_the_size_asked_for(
+    project, transcript, monkeypatch
+):
+    monkeypatch.setenv("RECORDING_STORIES", "45")
+    root = project()
+
+    async with stand_in_pool() as pool:
+        view = await survey_project(pool, ProjectView(name="p", path=root, pending=True))
+
+    assert len(view.epics) == 3
+    assert sum(epic.progress.total for epic in view.epics) == 45
+
+
+async def test_a_scenario_times_the_board_in_the_order_a_user_waits_through_it(monkeypatch):
+    # Set first, so what the harness writes into the environment is put back afterwards.
+    monkeypatch.setenv("RECORDING_TRANSCRIPT", "")
+    monkeypatch.setenv("RECORDING_STORIES", "")
+
+    # Held and let go before the scenario, as a larger scenario earlier in the matrix would be: the
+    # process's high water mark, and none of the board's.
+    ballast = b"x" * BALLAST
+    del ballast
+
+    measured = await run_scenario(3, 10, timeout=TIMEOUT)
+
+    assert measured.all_projects is not None, "the board was not read within the timeout"
+    assert measured.registry_paint <= measured.first_project <= measured.all_projects
+    assert measured.peak_servers >= 1 and measured.servers_peak_rss > 0
+    assert 0 < measured.board_peak_rss < BALLAST, "the board was charged the process's lifetime peak"
+    assert measured.phases[SPAWN]["count"] == 3, "a server per project, each spawned once"
+
+
+def test_the_results_file_names_the_commit_and_every_scenario(tmp_path, monkeypatch):
+    monkeypatch.setenv("RECORDING_TRANSCRIPT", "")
+    monkeypatch.setenv("RECORDING_STORIES", "")
+    out = tmp_path / "results.json"
+
+    assert main([str(out), "--projects", "1,2", "--stories", "10", "--timeout", str(TIMEOUT)]) == 0
+
+    results = json.loads(out.read_text())
+
+    assert results["commit"]
+    assert [(s["projects"], s["stories"]) for s in results["scenarios"]] == [(1, 10), (2, 10)]
+    assert all(s["all_projects"] is not None for s in results["scenarios"])
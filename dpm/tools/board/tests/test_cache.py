@@ -20,8 +20,8 @@ from pilot import board, palette, until
 from recording_server import transcript_of
 from session import run as full_session
 
-from board import registry_views, survey_project
-from cache import MISS, WINDOW, Cache, Stamp, cache_path, stamp_of
+from board import read_view, registry_views, survey_project
+from cache import CACHE_DIR, MISS, WAL, WINDOW, Cache, Stamp, cache_path, stamp_of
 from mcp_client import ServerPool
 from registry import CONFIG_DIR, DATABASE, RegistryEntry
 
@@ -168,16 +168,49 @@ def test_an_entry_written_under_an_earlier_schema_is_not_served(tmp_path, projec
     assert cache.get(root, "list_epic", None, after) is MISS
 
 
-async def session(root: Path, path: Path, schema: int, monkeypatch) -> None:
-    """One board session over the cache at ``path``, against a server reporting ``schema``.
+def test_a_write_that_reached_only_the_log_is_a_change(tmp_path, project):
+    """WAL mode, as it runs between checkpoints: the log moves and the database does not.
 
-    Two reads, and the first is a warm-up rather than part of the claim: the cache is consulted
-    before the server is spawned, so the schema is unknown for the very first read of any session and
-    that read always goes out. It is the *second* read that can be served, which is what the test
-    below is about.
+    The database is left byte-for-byte as it was, so what expires the entry is the log alone — and
+    the shared-memory index, which every reader writes, is touched too and must expire nothing.
+    """
+    root = project()
+    cache = Cache(tmp_path / "cache")
+    (root / WAL).write_bytes(b"")
+    before = stamp_of(root, SCHEMA)
+    cache.put(root, "list_epic", None, before, {"items": []})
+
+    (root / DATABASE).with_name("dpm.db-shm").write_bytes(b"read marks")
+
+    assert cache.get(root, "list_epic", None, stamp_of(root, SCHEMA)) is not MISS, (
+        "a reader's index write expired the entry"
+    )
+
+    (root / WAL).write_bytes(b"a committed frame")
+    after = stamp_of(root, SCHEMA)
+
+    assert (after.mtime, after.size) == (before.mtime, before.size)
+    assert cache.get(root, "list_epic", None, after) is MISS, "a write to the log was served over"
+
+
+def test_a_stamp_written_before_the_log_was_stamped_still_reads_back():
+    """Entries a board wrote before the log was stamped stand for a database with no log."""
+    assert Stamp.from_json([1, 2, 3]) == Stamp(mtime=1, size=2, schema=3)
+    assert Stamp.from_json(Stamp(1, 2, 3, wal=(4, 5)).as_json()) == Stamp(1, 2, 3, wal=(4, 5))
+    assert Stamp.from_json([1, 2, 3, 4]) is None
+
+
+async def session(
+    root: Path, path: Path, schema: int, monkeypatch, server: Path = STAND_IN
+) -> None:
+    """One board session over the cache at ``path``, against ``server`` reporting ``schema``.
+
+    Two reads of two different tools, so the first session has something to persist for each. A
+    later session against the *same* executable already knows its schema from the file and can
+    serve both; one against a different executable — an upgraded plugin — cannot serve either.
     """
     monkeypatch.setenv("RECORDING_SCHEMA", str(schema))
-    pool = stand_in_pool(Cache(path))
+    pool = ServerPool(server, node=sys.executable, cache=Cache(path))
 
     try:
         await pool.read(root, "list_story")
@@ -192,15 +225,18 @@ async def test_a_pool_on_a_newer_schema_does_not_serve_the_old_ones_entries(
     """Criterion 2 [unit], as behaviour: the same cache file, three sessions, one upgrade.
 
     The pair above establishes what the stamp holds and what :class:`Cache` does with it. This is the
-    upgrade itself — the entries persist on disk, the server the board spawns reports a different
-    schema, and the answer comes off the wire again.
+    upgrade itself — the entries persist on disk, the board is pointed at a *different* executable
+    reporting a different schema, and the answers come off the wire again.
 
     **The middle session is the control and the test is worthless without it.** A second session on
-    the *same* schema is served from the file; that is what makes the third session's call evidence
-    about the schema rather than about a cache that never persisted anything.
+    the *same* executable is served entirely from the file; that is what makes the third session's
+    calls evidence about the upgrade rather than about a cache that never persisted anything.
     """
     root = project()
     path = tmp_path / "cache.json"
+    upgraded = tmp_path / "upgraded" / STAND_IN.name
+    upgraded.parent.mkdir()
+    upgraded.write_bytes(STAND_IN.read_bytes())
 
     await session(root, path, SCHEMA, monkeypatch)
 
@@ -209,17 +245,45 @@ async def test_a_pool_on_a_newer_schema_does_not_serve_the_old_ones_entries(
 
     await session(root, path, SCHEMA, monkeypatch)
 
-    assert calls(transcript) == ["list_story", "list_epic", "list_story"], (
-        "the same schema's own entry was not served back to it"
+    assert calls(transcript) == ["list_story", "list_epic"], (
+        "the same executable's own entries were not served back to it"
     )
 
-    await session(root, path, LATER, monkeypatch)
+    await session(root, path, LATER, monkeypatch, server=upgraded)
 
-    assert calls(transcript) == ["list_story", "list_epic", "list_story", "list_story", "list_epic"], (
+    assert calls(transcript) == ["list_story", "list_epic", "list_story", "list_epic"], (
         "the upgraded board was answered out of the previous schema's cache"
     )
 
 
+async def test_a_warm_start_paints_from_disk_without_spawning_a_server(
+    tmp_path, project, transcript, spawned, monkeypatch
+):
+    """A second session inside the window reads every project's survey with no process at all.
+
+    Counted from the stand-ins' own pid file rather than from the pool, because the claim is about
+    processes that did not start — and it holds only if the schema *and* the tool list came back
+    from disk, since either one missing is a handshake to go and get it.
+    """
+    monkeypatch.setenv("RECORDING_SCHEMA", str(SCHEMA))
+    roots = [project("one"), project("two")]
+    path = tmp_path / "cache.json"
+
+    async def survey() -> list:
+        async with stand_in_pool(Cache(path)) as pool:
+            return [await read_view(pool, root, root.name) for root in roots]
+
+    cold = await survey()
+    started = spawned()
+
+    assert len(started) == len(roots), f"the cold start spawned {len(started)} servers"
+
+    warm = await survey()
+
+    assert spawned() == started, "the warm start spawned a server to paint what was on disk"
+    assert warm == cold
+
+
 async def test_a_force_refresh_bypasses_the_cache_and_a_clear_removes_it(
     tmp_path, project, transcript, monkeypatch
 ):
@@ -360,5 +424,5 @@ async def test_the_cache_lands_beside_the_registry_and_nowhere_in_a_project(
     # session — and the session runs the clear, which would take a misplaced cache away with it. The
     # path the cache is *still pointing at* after a full run is the durable form of the claim.
     assert not any("cache" in name for name in files_under(root))
-    assert cache.path == sandbox.config / CONFIG_DIR / "cache.json" == cache_path()
+    assert cache.path == sandbox.config / CONFIG_DIR / CACHE_DIR == cache_path()
     assert root not in cache.path.parents
@@ -0,0 +1,140 @@
+"""The cache is bounded: budgets, eviction by last use, and pruning to the registry (FR13).
+
+Nothing used to forget but a clear, so every preview ever highlighted and every project ever
+unregistered stayed on disk for good. These pin what replaced that — a store held under its byte
+and entry budgets by evicting what was least recently *served*, not least recently written; the
+shards of unregistered projects going at the next save; and a ``cache stats`` report that reads the
+store without changing it.
+
+**Read off the directory**, as the store's other tests are: an evicted entry is one a fresh cache
+over the same path cannot serve, not one the cache says it dropped.
+"""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from clock import Clock
+
+from board import run_cli
+from cache import LOW_WATER, MISS, TOUCH, Cache, Stamp, cache_path, shard_name
+from registry import add_project
+
+#: The stamp every entry here is written against. Nothing reads a database, so any stamp will do.
+STAMP = Stamp(mtime=1, size=1, schema=1)
+
+ALPHA = Path("/projects/alpha")
+BETA = Path("/projects/beta")
+
+
+def served(path: Path, root: Path, story: int) -> bool:
+    """Whether a fresh cache over ``path`` still holds the entry, however long ago it was written."""
+    value, _ = Cache(path).lookup(root, "list_task", {"story": story}, STAMP)
+
+    return value is not MISS
+
+
+def test_over_its_entry_budget_the_store_evicts_what_was_served_longest_ago(tmp_path):
+    path = tmp_path / "store"
+    clock = Clock()
+    cache = Cache(path, clock=clock, max_entries=10)
+
+    for story in range(10):
+        clock.now += TOUCH * 2
+        cache.put(ALPHA, "list_task", {"story": story}, STAMP, {"story": story})
+
+    # The oldest write, served last: least recently *used* is what goes, so it has to survive.
+    clock.now += TOUCH * 2
+    cache.get(ALPHA, "list_task", {"story": 0}, STAMP)
+    clock.now += TOUCH * 2
+    cache.put(ALPHA, "list_task", {"story": 10}, STAMP, {"story": 10})
+    cache.save()
+
+    kept = [story for story in range(11) if served(path, ALPHA, story)]
+
+    assert len(kept) <= 10 * LOW_WATER, f"compaction left {len(kept)} of a 10-entry budget"
+    assert 0 in kept, "the entry served most recently was evicted for having been written first"
+    assert 10 in kept, "the newest entry was evicted"
+    assert kept == [0, *range(11 - len(kept) + 1, 11)], f"not oldest-first: kept {kept}"
+
+
+def test_over_its_byte_budget_the_store_compacts_under_it(tmp_path):
+    path = tmp_path / "store"
+    clock = Clock()
+    cache = Cache(path, clock=clock, max_bytes=20_000)
+
+    for story in range(40):
+        clock.now += 1
+        cache.put(BETA, "list_task", {"story": story}, STAMP, {"body": "x" * 1000})
+
+    cache.save()
+    held = sum(file.stat().st_size for file in path.glob("*.json"))
+
+    assert held <= 20_000, f"{held} bytes on disk against a budget of 20000"
+    assert served(path, BETA, 39) and not served(path, BETA, 0)
+
+
+def test_a_served_entry_is_written_back_only_once_its_last_hit_is_old(tmp_path):
+    """A session that only read a project leaves its shard alone — unless the hit is news."""
+    path = tmp_path / "store"
+    clock = Clock()
+    writer = Cache(path, clock=clock)
+    writer.put(ALPHA, "list_epic", None, STAMP, {"rows": []})
+    writer.save()
+    shard = path / shard_name(ALPHA)
+
+    def read_once() -> int:
+        before = shard.stat().st_mtime_ns
+        cache = Cache(path, clock=clock)
+        cache.get(ALPHA, "list_epic", None, STAMP)
+        cache.save()
+
+        return shard.stat().st_mtime_ns - before
+
+    clock.now += 1
+    assert read_once() == 0, "a hit seconds after the last one rewrote the shard"
+
+    clock.now += TOUCH * 2
+    assert read_once() != 0, "a hit hours after the last one was never recorded"
+
+
+def test_an_unregistered_project_is_dropped_at_the_next_save(tmp_path):
+    path = tmp_path / "store"
+    registered = [ALPHA, BETA]
+    cache = Cache(path, registered=lambda: registered)
+
+    for root in (ALPHA, BETA):
+        cache.put(root, "list_epic", None, STAMP, {"rows": []})
+
+    cache.save()
+    registered.remove(BETA)
+    Cache(path, registered=lambda: registered).save()
+
+    assert (path / shard_name(ALPHA)).exists()
+    assert not (path / shard_name(BETA)).exists(), "the unregistered project's shard survived"
+    assert Cache(path).stats().projects.keys() == {str(ALPHA)}
+
+
+def test_cache_stats_reports_the_hit_ratio_and_sizes_without_writing(sandbox, monkeypatch):
+    for name, value in sandbox.env().items():
+        monkeypatch.setenv(name, value)
+
+    add_project(str(sandbox.cwd))
+    session = Cache()
+    session.put(sandbox.cwd, "list_epic", None, STAMP, {"rows": ["epic"] * 50})
+    session.put(sandbox.cwd, "list_story", None, STAMP, {"rows": []})
+    session.get(sandbox.cwd, "list_epic", None, STAMP)
+    session.get(sandbox.cwd, "list_task", None, STAMP)
+    session.save()
+    before = {file: file.stat().st_mtime_ns for file in cache_path().iterdir()}
+
+    out = io.StringIO()
+    code = run_cli(["cache", "stats"], out=out)
+    report = out.getvalue()
+
+    assert code == 0
+    assert report.startswith("hit ratio  50.0%"), report
+    assert str(sandbox.cwd) in report
+    assert report.index("list_epic") < report.index("list_story"), "not largest first"
+    assert {file: file.stat().st_mtime_ns for file in cache_path().iterdir()} == before
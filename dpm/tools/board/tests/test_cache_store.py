@@ -0,0 +1,181 @@
+"""The cache on disk: a shard per project, read when asked for and written when changed (FR13, NFR3).
+
+The store used to be one file, loaded whole before the first row could paint and rewritten whole at
+exit. Both costs grew with everything the board had ever cached, which is the shape that only shows
+up on the registries people actually have. These pin the replacement's two costs as flat in the size
+of the store — what a session pays to read one project and to save one changed answer — and the
+durability it keeps while getting there.
+
+**Timed as a benchmark, asserted as a shape.** The fastest of several runs at each store size is
+kept, and what is asserted is the ratio between the largest store and the smallest rather than any
+absolute time, which belongs to the machine running the suite. The times are in the failure message
+so a regression reports its own numbers.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from time import perf_counter
+
+from cache import (
+    ENTRIES,
+    LEDGER_FILE,
+    LEGACY_FILE,
+    MISS,
+    ROOT,
+    SERVERS_FILE,
+    Cache,
+    Identity,
+    Stamp,
+    shard_name,
+)
+
+#: Store sizes, in projects. The largest is past any registry the board has been used against.
+SIZES = (10, 100, 1000)
+
+#: Entries per project — about what a survey and a handful of previews leave behind.
+PER_PROJECT = 20
+
+#: How many times each cost is timed; the fastest run is the one kept, as everywhere in this suite.
+RUNS = 5
+
+#: How much dearer an operation may be against the largest store than the smallest. Flat is 1; what
+#: this must rule out is a cost proportional to the store — a hundred times the projects costing a
+#: hundred times the time — not the noise of a filesystem under a test runner.
+FLAT = 5.0
+
+#: The stamp every entry here is written against. Nothing reads a database, so any stamp will do.
+STAMP = Stamp(mtime=1, size=1, schema=1)
+
+
+def root_of(n: int) -> Path:
+    return Path(f"/projects/p{n:05d}")
+
+
+def filled(path: Path, projects: int) -> Cache:
+    """A store of ``projects`` projects, each with :data:`PER_PROJECT` entries, saved to ``path``."""
+    cache = Cache(path)
+
+    for n in range(projects):
+        for entry in range(PER_PROJECT):
+            cache.put(root_of(n), "list_task", {"story": entry}, STAMP, {"rows": [entry] * 10})
+
+    cache.save()
+
+    return cache
+
+
+def fastest(operation) -> float:
+    best = float("inf")
+
+    for _ in range(RUNS):
+        started = perf_counter()
+        operation()
+        best = min(best, perf_counter() - started)
+
+    return best
+
+
+def written(path: Path) -> dict[str, int]:
+    return {child.name: child.stat().st_mtime_ns for child in path.iterdir()}
+
+
+def test_reading_one_project_and_saving_one_answer_cost_the_same_at_any_store_size(tmp_path):
+    loads: dict[int, float] = {}
+    saves: dict[int, float] = {}
+
+    for size in SIZES:
+        path = tmp_path / f"store-{size}"
+        filled(path, size)
+
+        loads[size] = fastest(
+            lambda: Cache(path).get(root_of(size // 2), "list_task", {"story": 0}, STAMP)
+        )
+
+        def one_change() -> None:
+            cache = Cache(path)
+            cache.put(root_of(0), "list_epic", None, STAMP, {"rows": []})
+            cache.save()
+
+        saves[size] = fastest(one_change)
+
+    report = "; ".join(
+        f"{size} projects: load {loads[size] * 1000:.2f} ms, save {saves[size] * 1000:.2f} ms"
+        for size in SIZES
+    )
+
+    assert loads[SIZES[-1]] <= loads[SIZES[0]] * FLAT, f"loading grew with the store — {report}"
+    assert saves[SIZES[-1]] <= saves[SIZES[0]] * FLAT, f"saving grew with the store — {report}"
+
+
+def test_a_session_that_changed_one_project_rewrites_one_shard(tmp_path):
+    """The incremental write, read off the directory rather than off the cache's bookkeeping."""
+    path = tmp_path / "store"
+    filled(path, 50)
+    before = written(path)
+
+    cache = Cache(path)
+    cache.get(root_of(3), "list_task", {"story": 0}, STAMP)
+    cache.put(root_of(7), "list_epic", None, STAMP, {"rows": []})
+    cache.save()
+
+    after = written(path)
+    # The ledger is rewritten by any session that looked something up — its totals and hit counts
+    # are one small file whatever the store holds, so it is not what this is about.
+    changed = {name for name in after if after[name] != before.get(name)} - {LEDGER_FILE}
+
+    assert changed == {shard_name(root_of(7))}, f"rewritten for a one-entry change: {changed}"
+
+
+def test_each_shard_names_its_project_and_no_staging_file_is_left_behind(tmp_path):
+    path = tmp_path / "store"
+    cache = filled(path, 3)
+    cache.learn(Identity("/bin/dpm-mcp.js", 1, 1), schema=1)
+    cache.put(root_of(0), "list_epic", None, STAMP, {"rows": []})
+    cache.save()
+
+    shards = sorted(
+        child for child in path.iterdir() if child.name not in (SERVERS_FILE, LEDGER_FILE)
+    )
+
+    assert sorted(json.loads(shard.read_text())[ROOT] for shard in shards) == [
+        str(root_of(n)) for n in range(3)
+    ]
+    assert all(len(json.loads(shard.read_text())[ENTRIES]) >= PER_PROJECT for shard in shards)
+    assert (path / SERVERS_FILE).exists()
+    assert not list(path.glob("*.tmp")), "a staged write was left beside the shard it replaced"
+
+
+def test_a_shard_for_another_root_is_not_served(tmp_path):
+    """A file moved by hand under the wrong name is a miss, never the other project's answers."""
+    path = tmp_path / "store"
+    filled(path, 2)
+    (path / shard_name(root_of(0))).replace(path / shard_name(root_of(1)))
+
+    assert Cache(path).get(root_of(1), "list_task", {"story": 0}, STAMP) is MISS
+
+
+def test_stats_remove_nothing_and_a_compaction_removes_a_shard_under_the_wrong_name(tmp_path):
+    path = tmp_path / "store"
+    filled(path, 2)
+    misplaced = path / f"{'0' * 32}.json"
+    (path / shard_name(root_of(0))).replace(misplaced)
+
+    Cache(path).stats()
+
+    assert misplaced.exists(), "reading the store's stats removed a file from it"
+
+    Cache(path, max_entries=1).save()
+
+    assert not misplaced.exists(), "a shard nothing will ever serve outlived a compaction"
+
+
+def test_the_file_the_store_used_to_be_is_removed_at_the_first_save(tmp_path):
+    path = tmp_path / "cache"
+    legacy = tmp_path / LEGACY_FILE
+    legacy.write_text('{"entries": {}}\n')
+
+    Cache(path).save()
+
+    assert not legacy.exists(), "the old single-file cache was left behind"
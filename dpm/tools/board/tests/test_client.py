@@ -119,9 +119,9 @@ async def test_two_reads_in_flight_at_once_each_get_their_own_answer(fixture_pro
     """One client, two overlapping calls — which is what the browser does, not a contrived case.
 
     A highlighted epic's preview and a highlighted story's are built in separate workers over the
-    same project's server, so two coroutines reach ``_receive`` together. ``StreamReader.read()``
+    same project's server, so two coroutines wait on one stdout together. ``StreamReader.read()``
     refuses a second waiter with a ``RuntimeError``, and the id matching alone does not save it:
-    the reply the second call is waiting for is on a pipe it is not allowed to read.
+    the reply the second call is waiting for is on a pipe only one reader may hold.
 
     Both halves are asserted. That neither raised is the regression; that each got *its own*
     answer is the part a lock could pass while handing both coroutines the same reply.
@@ -44,6 +44,7 @@ from mcp_client import (
     ServerPool,
     server_path,
 )
+from metrics import Metrics
 from registry import RegistryEntry, add_project
 from status_model import RETIRED
 
@@ -107,10 +108,18 @@ class Unanticipated:
 
     def __init__(self, failure: BaseException) -> None:
         self._failure = failure
+        # Where a survey of it is timed, as it is on every pool.
+        self.metrics = Metrics()
 
     async def read(self, *_arguments, **_keywords):
         raise self._failure
 
+    def expected_rows(self, *_arguments) -> None:
+        return None
+
+    def counted(self, *_arguments) -> None:
+        return None
+
     async def __aenter__(self) -> "Unanticipated":
         return self
 
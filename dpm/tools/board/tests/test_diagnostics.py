@@ -0,0 +1,120 @@
+"""`Ctrl+D` says why a project is still "reading…", without leaving the board (NFR3).
+
+A row that stayed on "reading…" said nothing else: the server might not have started, might have
+started and not answered, or the survey might still be queued behind others — and the only way to
+tell them apart was a second terminal and ``ps``. These pin the screen that answers it: the key opens
+it, it keeps re-reading while it is up, and what it shows about a real pool is the pool's own
+account — the pid the server really has, and timings from the registry ``stats`` prints rather than
+a timer of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+from conftest import STAND_IN
+from pilot import board, lines, until
+
+from board import DiagnosticsScreen, diagnose_projects, survey_project
+from board_view import Diagnosis, Diagnostics, ProjectView
+from mcp_client import ServerPool
+from metrics import READ, SURVEY, Metrics
+
+#: How long a key's effect is given to land.
+SETTLE = 5.0
+
+
+async def test_ctrl_d_opens_the_diagnostics_and_paints_what_the_pool_reported():
+    reported = Diagnostics(
+        projects=(
+            Diagnosis(name="alpha", pending=False, pid=4242, rss=48 * 2**20, first_row=0.25),
+            Diagnosis(name="beta", pending=True, in_flight=2, said="warming the index"),
+        ),
+        rasters=3,
+        raster_p90=0.012,
+        raster_last=0.004,
+    )
+
+    async def diagnose(projects):
+        return reported
+
+    rows = [ProjectView(name=name, path=Path(f"/{name}")) for name in ("alpha", "beta")]
+
+    async with board(rows, diagnose=diagnose, size=(140, 40)) as (app, pilot):
+        await pilot.press("ctrl+d")
+
+        assert await until(
+            pilot,
+            lambda: isinstance(app.screen, DiagnosticsScreen) and app.screen.diagnostics is not None,
+            timeout=SETTLE,
+        ), "`ctrl+d` did not open the diagnostics"
+        await pilot.pause()
+
+        # Words rather than lines: the state column wraps, and where it wraps is the layout's.
+        table = " ".join(" ".join(lines(app, "diagnostics-table")).split())
+        raster = lines(app, "diagnostics-raster")
+
+    assert "4242" in table and "48.0 MiB" in table and "250ms" in table
+    assert "starting its server: warming the index" in table
+    assert raster == ["preview raster: 3 × p90 12ms, last 4ms"]
+
+
+async def test_the_screen_keeps_re_reading_while_it_is_up():
+    asked = []
+
+    async def diagnose(projects):
+        asked.append(len(projects))
+
+        return Diagnostics()
+
+    async with board([ProjectView(name="alpha", path=Path("/alpha"))], diagnose=diagnose) as (
+        app,
+        pilot,
+    ):
+        await pilot.press("ctrl+d")
+
+        assert await until(
+            pilot, lambda: len(asked) >= 3, timeout=DiagnosticsScreen.EVERY * 3 + SETTLE
+        ), f"asked {len(asked)} times"
+
+        await pilot.press("escape")
+        assert await until(pilot, lambda: not isinstance(app.screen, DiagnosticsScreen))
+        before = len(asked)
+        await asyncio.sleep(DiagnosticsScreen.EVERY * 1.5)
+
+    assert len(asked) == before, "the diagnostics went on reading after the screen closed"
+
+
+def test_a_pending_row_names_what_it_is_waiting_on():
+    assert Diagnosis(name="p", pending=True).waiting_on == "queued"
+    assert Diagnosis(name="p", pending=True, in_flight=1).waiting_on == "starting its server"
+    assert Diagnosis(name="p", pending=True, in_flight=3, pid=7).waiting_on == "waiting on 3 reads"
+    assert Diagnosis(name="p", pending=False, pid=7).waiting_on == "read"
+
+
+async def test_what_is_shown_about_a_real_pool_is_the_pools_own_account(project, transcript):
+    read, unread = project("read"), project("unread")
+    views = [
+        ProjectView(name="read", path=read, pending=True),
+        ProjectView(name="unread", path=unread, pending=True),
+    ]
+
+    # A registry of the pool's own, so a figure read from the process's instead is one that is
+    # missing rather than one that happens to agree.
+    figures = Metrics()
+
+    async with ServerPool(STAND_IN, node=sys.executable, metrics=figures) as pool:
+        surveyed = await survey_project(pool, views[0])
+        found = await diagnose_projects(pool, [surveyed, views[1]])
+        pid = pool.running(read).pid
+
+    shown, untouched = found.projects
+
+    assert shown.pid == pid and shown.in_flight == 0 and not shown.pending
+    assert shown.first_row == figures.first(SURVEY, project=str(read.resolve()))
+    assert shown.last_read == figures.latest(READ, project=str(read.resolve()))
+    assert shown.first_row is not None and shown.last_read is not None
+    assert (untouched.pid, untouched.first_row, untouched.last_read) == (None, None, None)
+    assert untouched.waiting_on == "queued"
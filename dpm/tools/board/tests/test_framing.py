@@ -12,11 +12,13 @@ newline and then parses everything it has passes the first case and silently man
 
 from __future__ import annotations
 
+import asyncio
 import json
+from pathlib import Path
 
 import pytest
 
-from mcp_client import Framer
+from mcp_client import Framer, MCPClient
 
 
 def encode(*messages: dict) -> bytes:
@@ -104,3 +106,40 @@ def test_a_line_that_is_not_json_is_refused_by_its_own_content():
     assert "Debugger listening" in str(refusal.value), (
         f"the refusal does not show what arrived: {refusal.value}"
     )
+
+
+@pytest.mark.parametrize(
+    "line",
+    [b"[1, 2]\n", b'"ready"\n', b'{"jsonrpc": "2.0", "id": [1], "result": {}}\n'],
+    ids=["an array", "a string", "an unhashable id"],
+)
+def test_json_that_is_not_a_message_is_refused_like_a_line_that_is_not_json(line):
+    """Parsed, but not JSON-RPC: an object is the only message, and its id is looked up by value."""
+    with pytest.raises(ValueError) as refusal:
+        Framer().feed(line)
+
+    assert line.strip().decode() in str(refusal.value), (
+        f"the refusal does not show what arrived: {refusal.value}"
+    )
+
+
+@pytest.mark.parametrize("line", [b"[1, 2]\n", b'{"jsonrpc": "2.0", "id": {}, "result": {}}\n'])
+async def test_a_reply_that_is_not_a_message_fails_the_call_waiting_rather_than_the_reader(
+    tmp_path, line
+):
+    """The reader stops and says why to everyone waiting; it does not die and leave them waiting.
+
+    Driven on a stream fed by hand, because the case is one no server this suite spawns would
+    write, and the hang it guards against would show up as a timeout rather than as a failure.
+    """
+    client = MCPClient(Path("dpm-mcp.js"), cwd=tmp_path)
+    waiting = asyncio.get_running_loop().create_future()
+    client._awaiting[1] = waiting
+    stream = asyncio.StreamReader()
+    stream.feed_data(line)
+    stream.feed_eof()
+
+    await asyncio.wait_for(client._read(stream), timeout=1)
+
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(waiting, timeout=1)
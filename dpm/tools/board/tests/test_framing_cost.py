@@ -0,0 +1,84 @@
+"""NFR6 — the framer's cost is linear in the bytes it is fed, whatever size the reads come in.
+
+The framer used to re-join its carry with every chunk and split the lot again, so a reply that
+arrived in many reads was copied once per read: harmless at a kilobyte, quadratic at the megabytes
+a project's sections can come to on one line. These feed replies of 1 KB, 1 MB and 20 MB through
+reads of several sizes and pin two things — every reply comes out whole, and the time per byte at
+20 MB is within a small factor of the time per byte at 1 MB.
+
+**A ratio, not a stopwatch.** An absolute budget measures the machine the suite runs on; the ratio
+of two sizes measured on the same machine measures the shape of the cost, which is the property.
+"""
+
+from __future__ import annotations
+
+import json
+from time import perf_counter
+
+import pytest
+
+from mcp_client import Framer
+
+#: Reply sizes, in bytes of the text a reply carries.
+SIZES = {"1 KB": 1_000, "1 MB": 1_000_000, "20 MB": 20_000_000}
+
+#: Read sizes: a small pipe read, a typical one, and the 64 KiB the stream reader hands over whole.
+CHUNKS = (512, 4096, 65536)
+
+#: How many times each measurement is repeated; the fastest is the one kept.
+RUNS = 3
+
+#: How much dearer a byte of a 20 MB reply may be than a byte of a 1 MB one. Linear cost is 1;
+#: quadratic cost, at twenty times the size, is twenty.
+FLAT = 4.0
+
+
+def reply(size: int) -> dict:
+    """A response carrying ``size`` characters, with multi-byte ones for chunks to split."""
+    text = ("section body é — " * (size // 16 + 1))[:size]
+
+    return {"jsonrpc": "2.0", "id": 7, "result": {"content": [{"type": "text", "text": text}]}}
+
+
+def wire(message: dict) -> bytes:
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode()
+
+
+def framed(data: bytes, chunk: int) -> list[dict]:
+    framer = Framer()
+    messages = []
+
+    for offset in range(0, len(data), chunk):
+        messages.extend(framer.feed(data[offset : offset + chunk]))
+
+    return messages
+
+
+def per_byte(data: bytes, chunk: int) -> float:
+    fastest = float("inf")
+
+    for _ in range(RUNS):
+        started = perf_counter()
+        framed(data, chunk)
+        fastest = min(fastest, perf_counter() - started)
+
+    return fastest / len(data)
+
+
+@pytest.mark.parametrize("chunk", CHUNKS)
+@pytest.mark.parametrize("size", SIZES.values(), ids=SIZES.keys())
+def test_a_reply_fed_in_reads_of_any_size_comes_out_whole(size, chunk):
+    message = reply(size)
+    data = wire(message) * 2
+
+    assert framed(data, chunk) == [message, message]
+
+
+@pytest.mark.parametrize("chunk", CHUNKS)
+def test_a_byte_of_a_large_reply_costs_what_a_byte_of_a_small_one_does(chunk):
+    small = per_byte(wire(reply(SIZES["1 MB"])), chunk)
+    large = per_byte(wire(reply(SIZES["20 MB"])), chunk)
+
+    assert large / small < FLAT, (
+        f"at {chunk}-byte reads a 20 MB reply cost {large / small:.1f}× per byte what a 1 MB one did"
+    )
@@ -0,0 +1,140 @@
+"""`board.py list` reads concurrently and streams its rows in registry order (FR1, NFR3).
+
+The CLI read one project after another and printed nothing until the last had answered, so a cron
+job or a status line calling it waited on every server in turn. These pin the replacement: projects
+read a bounded number at a time, each row printed as soon as it and every row above it are in, the
+registry's order kept whatever order the servers answered in, and the two JSON forms a script can
+consume.
+
+The order and streaming tests stand a planted ``read_project`` in for the servers, timed per
+project, because what they are about is the scheduling around the reads; the concurrency test runs
+the real stand-in with a slow handshake, because what it is about is servers starting together.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from contextlib import nullcontext
+from pathlib import Path
+from time import monotonic
+
+import board
+from conftest import stand_in_pool
+
+from board import run_cli
+from mcp_client import NO_DATABASE
+from registry import add_project
+
+#: How long the stand-in takes over its handshake in the concurrency test.
+DELAY = 0.5
+
+#: How many projects the concurrency test registers — fewer than the width, so all start at once.
+PROJECTS = 6
+
+
+class Stamped(io.StringIO):
+    """An output stream that remembers when each line was written."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.times: list[float] = []
+
+    def write(self, text: str) -> int:
+        if text.strip():
+            self.times.append(monotonic())
+
+        return super().write(text)
+
+
+def registered(tmp_path: Path, project, count: int) -> Path:
+    registry_file = tmp_path / "registry.json"
+
+    for n in range(count):
+        add_project(str(project(f"p{n}")), registry_file=registry_file)
+
+    return registry_file
+
+
+def planted(monkeypatch, delays: list[float]) -> None:
+    """``read_project`` answering the nth project after ``delays[n]`` seconds, with ``n`` as counts."""
+
+    async def read_project(pool, root: Path) -> dict[str, int]:
+        n = int(root.name[1:])
+        await asyncio.sleep(delays[n])
+
+        return {"epics": n, "stories": n, "tasks": n}
+
+    monkeypatch.setattr(board, "read_project", read_project)
+
+
+def test_projects_are_read_together_rather_than_one_after_another(
+    tmp_path, project, transcript, monkeypatch
+):
+    monkeypatch.setenv("RECORDING_DELAY", str(DELAY))
+    registry_file = registered(tmp_path, project, PROJECTS)
+    out, err = io.StringIO(), io.StringIO()
+    started = monotonic()
+
+    code = run_cli(["list"], registry_file=registry_file, out=out, err=err, make_pool=stand_in_pool)
+    elapsed = monotonic() - started
+
+    assert code == 0, err.getvalue()
+    assert len(out.getvalue().splitlines()) == PROJECTS
+    assert elapsed < DELAY * PROJECTS / 2, (
+        f"{PROJECTS} projects took {elapsed:.2f}s against a {DELAY}s handshake each — one at a time"
+    )
+
+
+def test_rows_keep_registry_order_and_are_printed_as_soon_as_they_can_be(
+    tmp_path, project, monkeypatch
+):
+    """The first project answers at once and the last takes a second; the middle are in between.
+
+    Printed in registry order regardless, and the first row is out long before the last is read —
+    which is the difference between streaming and printing at the end.
+    """
+    registry_file = registered(tmp_path, project, 4)
+    planted(monkeypatch, [0.0, 0.3, 0.1, 1.0])
+    out = Stamped()
+    started = monotonic()
+
+    code = run_cli(["list"], registry_file=registry_file, out=out, make_pool=nullcontext)
+
+    assert code == 0
+    assert [line.split()[-2] for line in out.getvalue().splitlines()] == ["0", "1", "2", "3"]
+    assert out.times[0] - started < 0.5, "the first row waited for the slowest project"
+    assert out.times[-1] - started >= 1.0
+
+
+def test_ndjson_streams_an_object_per_row_and_json_prints_one_array(
+    tmp_path, project, monkeypatch
+):
+    registry_file = registered(tmp_path, project, 3)
+    planted(monkeypatch, [0.0, 0.0, 0.0])
+
+    streamed, whole = io.StringIO(), io.StringIO()
+    run_cli(["list", "--ndjson"], registry_file=registry_file, out=streamed, make_pool=nullcontext)
+    run_cli(["list", "--json"], registry_file=registry_file, out=whole, make_pool=nullcontext)
+
+    objects = [json.loads(line) for line in streamed.getvalue().splitlines()]
+
+    assert objects == json.loads(whole.getvalue())
+    assert [record["epics"] for record in objects] == [0, 1, 2]
+    assert all(record["state"] is None for record in objects)
+
+
+def test_a_project_that_cannot_be_read_is_a_record_with_its_state(tmp_path, project):
+    registry_file = tmp_path / "registry.json"
+    gone = project("gone")
+    add_project(str(gone), registry_file=registry_file)
+    (gone / ".dpm" / "dpm.db").unlink()
+
+    out = io.StringIO()
+    run_cli(["list", "--json"], registry_file=registry_file, out=out, make_pool=stand_in_pool)
+    [record] = json.loads(out.getvalue())
+
+    assert record["path"] == str(gone)
+    assert record["state"] == NO_DATABASE, record
+    assert record["remedy"]
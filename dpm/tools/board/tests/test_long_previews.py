@@ -0,0 +1,143 @@
+"""A long preview is laid out as far as the panel shows, and the rest as it is scrolled to (FR6, NFR3).
+
+A spec rasterised whole held its panel blank for as long as the whole of it took, so the wait for a
+first line grew with the document — a megabyte of markdown was seconds of nothing. These pin what
+replaced that: the document is cut at its headings, the sections on screen are laid out first, and
+the wait for them is the same whatever follows; sections further down are laid out as the panel
+nears them, and sections far behind it are let go.
+
+**Counted at the renderer, not at a clock.** What the first paint costs is how much markdown was
+rendered for it, and that is a number a loaded machine cannot make flaky.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pilot import board, preview, until
+from textual.containers import VerticalScroll
+
+import board as board_module
+from board import KEEP, PROGRESSIVE_AT, PreviewBody, Sections, sections_of
+from board_view import EpicView, ProjectView
+
+#: A section's worth of prose, and a fence inside it whose lines look like headings and are not.
+PROSE = (
+    "A paragraph long enough to wrap at any width a panel has, so that each section is several "
+    "lines tall and the panel fills with a few of them rather than with dozens. "
+) * 6
+FENCE = "```markdown\n# not a heading\n\n## nor this\n```"
+
+
+def spec(sections: int) -> str:
+    """A document of ``sections`` numbered sections, each a heading, prose and a fence."""
+    return "\n\n".join(
+        f"## Section {n}\n\n{PROSE}\n\n{FENCE}\n\n{PROSE}" for n in range(sections)
+    )
+
+
+def test_a_document_is_cut_at_its_headings_and_never_inside_a_fence():
+    pieces = sections_of(spec(200))
+
+    assert len(pieces) > 1
+    assert all(piece.startswith("## Section ") for piece in pieces), (
+        "a section began somewhere other than a heading"
+    )
+    assert all(piece.count("```") % 2 == 0 for piece in pieces), "a fence was cut in two"
+    assert "".join(pieces).replace("\n", "") == spec(200).replace("\n", "")
+
+
+def test_the_first_paint_renders_as_much_of_a_megabyte_as_of_a_tenth_of_one(monkeypatch):
+    rendered: list[int] = []
+    rasterised = board_module._rasterised
+
+    def counted(markup: str, width: int):
+        rendered.append(len(markup))
+        return rasterised(markup, width)
+
+    monkeypatch.setattr(board_module, "_rasterised", counted)
+    costs = []
+
+    for length in (100 * 1024, 1024 * 1024):
+        monkeypatch.setattr(board_module, "RASTER_CACHE", board_module.Rasters())
+        source = spec(length // len(spec(1)))
+        rendered.clear()
+
+        Sections.lay_out(source, 80, 40)
+
+        costs.append(sum(rendered))
+
+    assert costs[0] == costs[1], f"a longer document cost more to first paint: {costs}"
+    assert costs[1] < PROGRESSIVE_AT
+
+
+def one_epic() -> list[ProjectView]:
+    return [ProjectView("fixture", Path("/fixture"), epics=(EpicView("e1", "An epic", "ready"),))]
+
+
+async def test_the_last_section_is_laid_out_when_the_panel_is_scrolled_to_it():
+    source = spec(300)
+
+    async def read(root: Path, row) -> str:
+        return source
+
+    async with board(one_epic(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        assert await until(pilot, lambda: "Section 0" in " ".join(preview(app, "epic")))
+
+        panel = app.query_one("#epic-preview", VerticalScroll)
+        body = app.query_one("#epic-preview-body", PreviewBody)
+        sections = body._sections
+
+        assert sections is not None and not sections.done, "the document was laid out whole"
+
+        async def at_the_end() -> bool:
+            panel.scroll_end(animate=False)
+            await pilot.pause()
+
+            return sections.done and not body._extending
+
+        for _ in range(300):
+            if await at_the_end():
+                break
+
+        assert sections.done, "scrolling to the end did not lay the document out to its end"
+        assert await until(pilot, lambda: "Section 299" in " ".join(preview(app, "epic")))
+        assert sum(sections.heights[index] for index in sections.rasters) <= (
+            2 * KEEP + panel.size.height + max(sections.heights)
+        ), "sections far above the panel were kept after it scrolled past them"
+
+
+async def test_a_resize_keeps_the_section_the_reader_was_on_in_view():
+    source = spec(300)
+
+    async def read(root: Path, row) -> str:
+        return source
+
+    async with board(one_epic(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        panel = app.query_one("#epic-preview", VerticalScroll)
+        body = app.query_one("#epic-preview-body", PreviewBody)
+
+        assert await until(pilot, lambda: body._sections is not None)
+
+        for _ in range(10):
+            panel.scroll_end(animate=False)
+            await pilot.pause()
+
+        reading = body._sections.at(round(panel.scroll_y))
+        narrow = body._sections.width
+
+        await pilot.resize_terminal(160, 40)
+
+        assert await until(
+            pilot, lambda: body._sections.width != narrow and not body._reflowing
+        ), "the sections were not laid out again at the new width"
+        await pilot.pause()
+        assert body._sections.at(round(panel.scroll_y)) == reading, (
+            "the resize moved the reader to another section"
+        )
+        heading = body._sections.pieces[reading].splitlines()[0].lstrip("# ")
+        assert heading in " ".join(preview(app, "epic"))
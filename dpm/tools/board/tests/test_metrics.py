@@ -0,0 +1,157 @@
+"""Where the board's time goes, by phase, by tool and by project (NFR3).
+
+A slow board said nothing about *why* — a spawn, a handshake, one tool, one project or the raster —
+and the only way to find out was a profiler. These pin the registry that answers it instead: every
+phase a cold read passes through is timed under the project and the tool it was for, the cache's
+outcomes are counted, and both ways out — ``board.py stats --json`` and the snapshot on exit — carry
+the same figures.
+
+The survey tests run the real stand-in servers, because a timing for a phase the real pool never
+enters would be one recorded by the test rather than by the board.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+
+from conftest import STAND_IN, stand_in_pool
+
+import board
+from board import markdown_content, run_cli
+from cache import HIT, MISSED, Cache
+from mcp_client import ServerPool
+from metrics import (
+    BOUNDS,
+    CACHE,
+    CALL,
+    HANDSHAKE,
+    METRICS,
+    ON_EXIT,
+    RASTER,
+    RASTERS,
+    SPAWN,
+    TOOLS_LIST,
+    Histogram,
+    Metrics,
+)
+from registry import add_project
+from status_model import EPICS, STORIES
+
+
+def test_stats_times_each_phase_under_the_project_and_the_tool_it_was_for(
+    tmp_path, project, transcript
+):
+    registry_file = tmp_path / "registry.json"
+    roots = [project("one"), project("two")]
+
+    for root in roots:
+        add_project(str(root), registry_file=registry_file)
+
+    out, err = io.StringIO(), io.StringIO()
+    code = run_cli(
+        ["stats", "--json"], registry_file=registry_file, out=out, err=err, make_pool=stand_in_pool
+    )
+
+    assert code == 0, err.getvalue()
+
+    timings = json.loads(out.getvalue())["timings"]
+
+    for phase in (SPAWN, HANDSHAKE, CALL):
+        assert set(timings[phase]["projects"]) == {str(root) for root in roots}, phase
+
+    # Asked of one server for the pool, which is every server's executable (NFR3).
+    assert set(timings[TOOLS_LIST]["projects"]) <= {str(root) for root in roots}
+    assert timings[TOOLS_LIST]["all"]["count"] == 1
+
+    assert {EPICS.name, STORIES.name} <= set(timings[CALL]["tools"])
+    assert timings[CALL]["tools"][EPICS.name]["count"] >= len(roots)
+    assert timings[SPAWN]["all"]["count"] == len(roots)
+
+
+def test_the_text_report_names_the_phases_and_the_projects(tmp_path, project, transcript):
+    registry_file = tmp_path / "registry.json"
+    root = project()
+    add_project(str(root), registry_file=registry_file)
+    out = io.StringIO()
+
+    assert run_cli(["stats"], registry_file=registry_file, out=out, make_pool=stand_in_pool) == 0
+
+    report = out.getvalue()
+
+    for named in (SPAWN, HANDSHAKE, CALL, str(root), EPICS.name):
+        assert named in report, named
+
+
+async def test_the_cache_counts_what_it_served_and_what_it_did_not(
+    tmp_path, project, transcript, monkeypatch
+):
+    # A server that reports no schema has answers that cannot be stamped, and so are never cached.
+    monkeypatch.setenv("RECORDING_SCHEMA", "1")
+    root = project()
+    metrics = Metrics()
+    pool = ServerPool(
+        STAND_IN, node=sys.executable, cache=Cache(tmp_path / "cache.json"), metrics=metrics
+    )
+
+    async with pool:
+        await pool.read(root, EPICS)
+        await pool.read(root, EPICS)
+
+    counts = metrics.snapshot()["counts"][CACHE]
+
+    assert counts["all"] == {MISSED: 1, HIT: 1}
+    assert counts["tools"][EPICS.name] == {MISSED: 1, HIT: 1}
+    assert counts["projects"][str(root)] == {MISSED: 1, HIT: 1}
+
+
+def test_a_snapshot_is_written_on_exit_when_asked_for(tmp_path, monkeypatch):
+    monkeypatch.setenv(ON_EXIT, "1")
+    out, err = io.StringIO(), io.StringIO()
+
+    code = run_cli(["remove", str(tmp_path)], registry_file=tmp_path / "r.json", out=out, err=err)
+
+    assert code == 0
+
+    assert set(json.loads(err.getvalue().splitlines()[-1])) == {"timings", "counts"}
+
+
+def test_nothing_is_written_on_exit_unless_asked_for(tmp_path, monkeypatch):
+    monkeypatch.delenv(ON_EXIT, raising=False)
+    err = io.StringIO()
+
+    run_cli(
+        ["remove", str(tmp_path)], registry_file=tmp_path / "r.json", out=io.StringIO(), err=err
+    )
+
+    assert err.getvalue() == ""
+
+
+def test_a_raster_is_timed_when_it_is_made_and_counted_when_it_is_reused(monkeypatch):
+    monkeypatch.setattr(board, "RASTER_CACHE", board.Rasters())
+    before, reused = METRICS.timing(RASTER).count, METRICS.counted(RASTERS)[HIT]
+
+    markdown_content("# A heading\n\nAnd a paragraph.", 60)
+    markdown_content("# A heading\n\nAnd a paragraph.", 60)
+
+    assert METRICS.timing(RASTER).count == before + 1
+    assert METRICS.counted(RASTERS)[HIT] == reused + 1
+
+
+def test_quantiles_are_within_a_bucket_and_merging_loses_nothing():
+    fast, slow = Histogram(), Histogram()
+
+    for _ in range(90):
+        fast.add(0.001)
+
+    for _ in range(10):
+        slow.add(1.0)
+
+    merged = fast.merge(slow)
+
+    assert merged.count == 100
+    assert merged.quantile(0.5) <= 0.001 * 2
+    assert merged.quantile(0.99) == 1.0
+    assert merged.longest == 1.0
+    assert len(merged.buckets) == len(BOUNDS) + 1
@@ -0,0 +1,125 @@
+"""A long list fills in within a round trip or two, and is still read whole (FR5, NFR3).
+
+``rows`` used to follow ``more`` one reply at a time, so a project with 5,000 stories was ten round
+trips end to end before its row could paint. These pin the pipelining that replaced it — pages
+asked for together once a full page says there are more, page size and count taken from what the
+last whole read came to — and the property none of that may cost: every row, once, in order,
+whether the guess was right, too high or too low.
+
+**Counted in round trips**, off a planted pool that answers as dpm's query does: a page of
+``limit`` rows from ``offset``, with ``more`` and never a total. A round trip is a read that went
+out with nothing else in flight — which is what a caller waits for, whatever the reads cost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from cache import Cache, Stamp, shard_name
+from status_model import MAX_PAGE, PAGE, STORIES, rows
+
+#: How many stories the large project holds.
+LARGE = 5_000
+
+#: How long the planted server takes over one page.
+DELAY = 0.02
+
+ROOT = Path("/projects/large")
+
+
+class Paged:
+    """A pool over one list of ``total`` rows, remembering a count the way the cache would."""
+
+    def __init__(self, total: int, *, expected: int | None = None) -> None:
+        self.items = [{"id": n} for n in range(total)]
+        self.expected = expected
+        self.limits: set[int] = set()
+        self.rounds = 0
+        self._in_flight = 0
+
+    async def read(self, root, call, arguments, **_keywords) -> dict:
+        if not self._in_flight:
+            self.rounds += 1
+
+        self._in_flight += 1
+        self.limits.add(arguments["limit"])
+
+        try:
+            await asyncio.sleep(DELAY)
+        finally:
+            self._in_flight -= 1
+
+        offset, limit = arguments["offset"], arguments["limit"]
+
+        return {"items": self.items[offset : offset + limit], "more": len(self.items) > offset + limit}
+
+    def expected_rows(self, root, call, arguments=None) -> int | None:
+        return self.expected
+
+    def counted(self, root, call, arguments, count: int) -> None:
+        self.expected = count
+
+
+def whole(found: list[dict], total: int) -> bool:
+    return [row["id"] for row in found] == list(range(total))
+
+
+async def test_with_no_count_to_go_by_later_pages_are_asked_for_together():
+    pool = Paged(LARGE)
+
+    found = await rows(pool, ROOT, STORIES)
+
+    assert whole(found, LARGE)
+    assert pool.rounds <= 4, f"{pool.rounds} round trips for {LARGE // PAGE} pages"
+    assert pool.expected == LARGE, "the whole read's count was not remembered for next time"
+
+
+async def test_with_last_session_s_count_a_large_list_is_one_round_trip():
+    pool = Paged(LARGE, expected=LARGE)
+
+    found = await rows(pool, ROOT, STORIES)
+
+    assert whole(found, LARGE)
+    assert pool.rounds == 1, f"{pool.rounds} round trips with the count known"
+    assert pool.limits == {MAX_PAGE}
+
+
+@pytest.mark.parametrize("held, remembered", [(300, LARGE), (LARGE, 100), (0, 50), (PAGE, PAGE)])
+async def test_a_wrong_count_costs_round_trips_and_never_rows(held, remembered):
+    pool = Paged(held, expected=remembered)
+
+    assert whole(await rows(pool, ROOT, STORIES), held)
+    assert pool.expected == held
+
+
+async def test_a_small_list_asks_for_the_page_it_always_did():
+    """A page size is part of every page's cache key, so the common case must not move it."""
+    pool = Paged(40, expected=40)
+
+    await rows(pool, ROOT, STORIES)
+
+    assert pool.limits == {PAGE}
+    assert pool.rounds == 1
+
+
+def test_the_count_outlives_the_session_beside_the_entries(tmp_path):
+    path = tmp_path / "store"
+    writer = Cache(path)
+    writer.put(ROOT, "list_story", {"limit": PAGE, "offset": 0}, Stamp(1, 1, 1), {"items": []})
+    writer.count(ROOT, "list_story", {}, LARGE)
+    writer.save()
+
+    assert Cache(path).rows_for(ROOT, "list_story", {}) == LARGE
+    assert Cache(path).rows_for(ROOT, "list_story", {"ready": True}) is None
+
+
+def test_a_count_alone_leaves_nothing_on_disk(tmp_path):
+    path = tmp_path / "store"
+    cache = Cache(path)
+    cache.count(ROOT, "list_story", {}, LARGE)
+    cache.save()
+
+    assert not (path / shard_name(ROOT)).exists()
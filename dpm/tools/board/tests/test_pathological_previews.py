@@ -13,10 +13,12 @@ control is separate, and drives the failure through a renderer that raises.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from time import perf_counter, sleep
 
 import pytest
-from pilot import board, preview
+from pilot import board, preview, until
 
 import board as board_module
 from board import markdown_content
@@ -104,6 +106,9 @@ def a_renderer_that_raises(monkeypatch) -> None:
         raise RuntimeError("the renderer fell over")
 
     monkeypatch.setattr(board_module, "_rasterised", broken)
+    # And nothing already made to answer from instead: a raster kept from an earlier test would be
+    # served without the renderer being asked, and the guard would be demonstrated on nothing.
+    monkeypatch.setattr(board_module, "RASTER_CACHE", board_module.Rasters())
 
 
 async def test_a_render_that_raises_leaves_the_source_on_screen(monkeypatch):
@@ -150,3 +155,64 @@ def test_without_the_guard_the_same_render_takes_the_board_down(monkeypatch):
     assert "fell over" in str(raised.value), (
         f"something other than the render failed, so the control shows nothing: {raised.value}"
     )
+
+
+#: What each raster is made to cost in :func:`test_dragging_a_split_keeps_the_board_answering`:
+#: long enough that a drag across fourteen widths is over well before a raster per width could be.
+SLOW_RASTER = 0.5
+
+
+async def test_dragging_a_split_keeps_the_board_answering(monkeypatch):
+    """NFR3, on the resize path: a raster per resize was the board frozen for every column dragged.
+
+    **The renderer is made slow rather than the document made large.** A large document is also a
+    large layout, and Textual lays a panel's text out on the event loop whatever the raster does —
+    so a test over one would be measuring Textual. Slowed, every raster costs far more than a frame
+    and paints a few lines, and the one way the board can stall on it is making one on the loop.
+
+    **Asserted on where and how often rasters ran, not on how long the loop waited.** A gap timed
+    on the loop moves with whatever else the machine is doing, and a test of it passes alone and
+    fails in the suite. Which thread made each raster does not: none may be the loop's. And the
+    rasters made, because a drag is a resize per column and a raster per column is work for widths
+    nobody sees: one runs at a time, and the next is at wherever the panel has got to when it lands.
+    """
+    render = board_module._rasterised
+    loop = threading.get_ident()
+    made: list[int] = []
+    threads: list[int] = []
+
+    def slow(markup: str, width: int):
+        made.append(width)
+        threads.append(threading.get_ident())
+        sleep(SLOW_RASTER)
+
+        return render(markup, width)
+
+    monkeypatch.setattr(board_module, "_rasterised", slow)
+    monkeypatch.setattr(board_module, "RASTER_CACHE", board_module.Rasters())
+
+    async with board(one_epic(), size=(160, 40), reader=previewed("# A heading")) as (app, pilot):
+        await pilot.press("right")
+        assert await until(pilot, lambda: "A heading" in " ".join(preview(app, "epic")))
+
+        body = app.query_one("#epic-preview-body", board_module.PreviewBody)
+        made.clear()
+        threads.clear()
+        started = perf_counter()
+
+        for width in range(158, 130, -2):
+            await pilot.resize_terminal(width, 40)
+            await pilot.pause()
+
+        dragged = perf_counter() - started
+
+        settled = await until(pilot, lambda: made and made[-1] == board_module._panel_width(body))
+        await pilot.pause(SLOW_RASTER + 0.1)
+
+    assert settled, f"the preview was never rasterised at the width the drag ended at: {made}"
+    assert loop not in threads, "a resized preview was rasterised on the event loop"
+    # One at a time, each at the width the panel had when the one before it landed, and the last at
+    # where the drag ended: however many widths the drag crossed, no more than fit end to end in it.
+    assert len(made) <= dragged / SLOW_RASTER + 2, (
+        f"{len(made)} rasters in a {dragged:.2f}s drag across 14 widths: {made}"
+    )
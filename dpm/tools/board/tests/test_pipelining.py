@@ -0,0 +1,99 @@
+"""One server, many calls in flight — the client pipelines rather than taking turns (AD4, NFR3).
+
+The pool gives each project one server, and the browser puts several reads on it at once: a
+project's survey, an epic's preview and a story's. A client that made each of those wait for the
+reply before it could write its own request — or that scanned every stray reply on every turn —
+would make a burst cost more per call the bigger it got, which is the shape that only shows up on
+the registries people actually have.
+
+**Measured against the recording stand-in,** which answers each line as it arrives and does no work
+of its own, so what is timed is the client's framing, routing and writing and nothing else. The
+assertion is on the *shape* — per-call cost at a hundred in flight against per-call cost at one —
+rather than on absolute numbers, which belong to the machine running the suite.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from time import perf_counter
+
+from conftest import STAND_IN
+from recording_server import transcript_of
+
+from mcp_client import MCPClient
+
+#: The burst sizes the criterion names.
+BURSTS = (1, 10, 100)
+
+#: How many times each burst is timed; the fastest run is the one kept, as everywhere in this suite.
+RUNS = 5
+
+#: How much dearer a call may be at the largest burst than at one. Flat is 1; this is generous
+#: because a single call is dominated by a round trip the larger bursts amortise, and what it must
+#: rule out is growth with the burst — N calls costing N² — not noise.
+FLAT = 3.0
+
+
+async def stand_in(tmp_path) -> tuple[MCPClient, object]:
+    transcript = tmp_path / "transcript.jsonl"
+    client = MCPClient(
+        STAND_IN,
+        cwd=tmp_path,
+        env={**os.environ, "RECORDING_TRANSCRIPT": str(transcript)},
+        node=sys.executable,
+    )
+
+    return await client.start(), transcript
+
+
+async def per_call(client: MCPClient, burst: int) -> float:
+    """The fastest of :data:`RUNS` bursts of ``burst`` concurrent calls, per call, in seconds."""
+    fastest = float("inf")
+
+    for _ in range(RUNS):
+        started = perf_counter()
+        await asyncio.gather(*(client.call("list_epic", {"n": n}) for n in range(burst)))
+        fastest = min(fastest, perf_counter() - started)
+
+    return fastest / burst
+
+
+async def test_per_call_latency_stays_flat_as_the_burst_grows(tmp_path):
+    client, _ = await stand_in(tmp_path)
+
+    try:
+        costs = {burst: await per_call(client, burst) for burst in BURSTS}
+    finally:
+        await client.close()
+
+    report = ", ".join(f"{burst}: {cost * 1000:.2f} ms" for burst, cost in costs.items())
+
+    assert costs[BURSTS[-1]] <= costs[BURSTS[0]] * FLAT, (
+        f"a call costs more the more of them are in flight — per call at each burst: {report}"
+    )
+
+
+async def test_a_hundred_calls_in_flight_each_get_their_own_answer(tmp_path):
+    """The correctness half: pipelined writes, one reader, and every reply routed to its caller.
+
+    The arguments are distinct per call and the stand-in answers with the tool it was asked for, so
+    the transcript is what proves the calls were *sent* without waiting: all hundred requests are in
+    it, and none of the answers went to the wrong coroutine.
+    """
+    client, transcript = await stand_in(tmp_path)
+
+    try:
+        answers = await asyncio.gather(
+            *(client.call(f"tool_{n}", {"n": n}) for n in range(100))
+        )
+    finally:
+        await client.close()
+
+    assert [answer["tool"] for answer in answers] == [f"tool_{n}" for n in range(100)]
+
+    calls = [message for message in transcript_of(transcript) if message["method"] == "tools/call"]
+
+    assert sorted(call["params"]["arguments"]["n"] for call in calls) == list(range(100))
+    assert not client._unmatched, f"replies nobody claimed: {client._unmatched}"
@@ -0,0 +1,124 @@
+"""A held arrow key reads the row it stops on, not every row it passes (FR6, NFR3).
+
+Every highlight used to start a preview worker of its own and leave the last one standing: a key
+held down the Epics column queued a read and a raster per row, each thrown away only once it had
+finished. These pin the scheduler that replaced that: a panel has one read in flight at most, the
+cursor leaving a row cancels that row's read where it stands, and a read cancelled after it was
+sent is withdrawn — and its reply, which dpm's server sends regardless, is dropped on arrival
+rather than held by the client for the rest of the session.
+
+**Counted at the reader and on the wire.** What a held key costs is how many reads were started
+and how many the server was asked for, and neither depends on how fast the machine is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from conftest import stand_in_pool
+from pilot import board, preview, until
+from recording_server import transcript_of
+from textual import events
+
+import board as board_module
+from board_view import EpicView, ProjectView
+from mcp_client import CANCELLED
+
+#: Rows in the column the key is held down.
+ROWS = 40
+
+
+def many_epics() -> list[ProjectView]:
+    epics = tuple(EpicView(f"e{n}", f"Epic {n}", "ready") for n in range(ROWS))
+
+    return [ProjectView("fixture", Path("/fixture"), epics=epics)]
+
+
+async def test_a_held_key_reads_at_most_one_preview_at_a_time_and_paints_the_last(monkeypatch):
+    # Nothing read ahead of the cursor, whose reads are the cursor's own business and are pinned
+    # in ``test_read_ahead``: what is counted here is what the cursor itself asked for.
+    monkeypatch.setattr(board_module, "PREFETCH_ROWS", 0)
+    started: list[str] = []
+    cancelled: list[str] = []
+    reading: set[str] = set()
+    most = 0
+
+    async def read(root: Path, row) -> str:
+        nonlocal most
+        started.append(row.id)
+        reading.add(row.id)
+        most = max(most, len(reading))
+
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            cancelled.append(row.id)
+            raise
+        finally:
+            reading.discard(row.id)
+
+        return f"# Preview of {row.title}"
+
+    async with board(many_epics(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        # Posted together, as a key held down arrives: faster than the board can settle between
+        # them, which one `pilot.press` after another would wait for it to.
+        for _ in range(ROWS - 1):
+            app._driver.send_message(events.Key("down", None))
+
+        last = f"Preview of Epic {ROWS - 1}"
+
+        assert await until(pilot, lambda: last in " ".join(preview(app, "epic")))
+
+    assert most == 1, f"{most} previews were read at once for one panel"
+    assert len(started) < ROWS // 2, f"{len(started)} reads for {ROWS} rows passed over"
+    assert set(started) - set(cancelled) <= {"e0", f"e{ROWS - 1}"}, (
+        "a row the cursor left was read to the end"
+    )
+
+
+async def test_a_read_abandoned_after_it_was_sent_is_withdrawn_and_its_late_reply_dropped(
+    transcript, project, monkeypatch
+):
+    monkeypatch.setenv("RECORDING_CALL_DELAY", "0.5")
+    root = project()
+
+    async with stand_in_pool() as pool:
+        reading = asyncio.create_task(pool.read(root, "list_epic", {"limit": 5}))
+
+        async def sent() -> list[dict]:
+            return [m for m in transcript_of(transcript) if m.get("method") == "tools/call"]
+
+        while not await sent():
+            await asyncio.sleep(0.01)
+
+        reading.cancel()
+        await asyncio.gather(reading, return_exceptions=True)
+
+        for _ in range(200):
+            if any(m.get("method") == CANCELLED for m in transcript_of(transcript)):
+                break
+
+            await asyncio.sleep(0.01)
+
+        call = (await sent())[0]
+        client = pool.running(root)
+
+        # The stand-in answers anyway, as dpm's server does, once its delay is over.
+        for _ in range(200):
+            if not client._withdrawn:
+                break
+
+            await asyncio.sleep(0.01)
+
+        assert not client._withdrawn, "the withdrawn read's reply never arrived"
+        assert not client._unmatched, f"the reply nobody wanted was kept: {client._unmatched}"
+
+    withdrawn = [m for m in transcript_of(transcript) if m.get("method") == CANCELLED]
+
+    assert [m["params"]["requestId"] for m in withdrawn] == [call["id"]], (
+        "the abandoned read was not withdrawn, or something else was"
+    )
+    assert not pool._flights, "the abandoned read was left registered as in flight"
@@ -15,13 +15,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-from pilot import board, lines, preview, strips
+from pilot import board, lines, preview, strips, until
 from rich.console import Console
 from rich.segment import Segments
 from textual.content import Content
 from textual.selection import Selection
 from textual.widgets import Markdown, Static
 
+import board as board_module
 from board import markdown_content
 from board_view import EpicView, ProjectView
 
@@ -136,8 +137,10 @@ async def test_resizing_the_panel_renders_the_preview_again():
         wide = preview(app, "epic")
 
         await pilot.resize_terminal(140, 40)
-        await pilot.pause()
-        await pilot.pause()
+        # Until the new raster is up, rather than for a fixed number of pauses: the re-render
+        # settles and runs on a thread (see `PreviewBody`), so it lands after the resize rather
+        # than with it, and the old raster is what the panel shows in between.
+        await until(pilot, lambda: "The eighth epic" in preview(app, "epic"), timeout=5.0)
 
         narrow = preview(app, "epic")
 
@@ -242,3 +245,52 @@ async def test_a_rendered_preview_reaches_a_256_colour_terminal_in_colour():
         "24-bit colour codes reached a console that reports 256 colours, so the preview is being "
         "sent colours the terminal cannot render"
     )
+
+
+def test_moving_between_two_documents_rasterises_each_once_per_width(monkeypatch):
+    """A raster is its source and its width, so a revisit is the raster made last time (NFR3)."""
+    made = []
+    render = board_module._rasterised
+
+    def counted(markup: str, width: int) -> Content:
+        made.append((markup, width))
+
+        return render(markup, width)
+
+    monkeypatch.setattr(board_module, "_rasterised", counted)
+    monkeypatch.setattr(board_module, "RASTER_CACHE", board_module.Rasters())
+    other = SOURCE.replace("eighth", "ninth")
+
+    for _ in range(4):
+        first, second = markdown_content(SOURCE, 60), markdown_content(other, 60)
+
+    assert first.plain != second.plain
+    assert markdown_content(SOURCE, 60) is first, "a revisit was made again rather than reused"
+    assert len(made) == 2, made
+
+    markdown_content(SOURCE, 40)
+    # Both below the floor are laid out at it, so they are one raster.
+    markdown_content(SOURCE, 3)
+    markdown_content(SOURCE, 5)
+
+    assert len(made) == 4, made
+
+
+def test_the_kept_rasters_stay_within_their_budget_dropping_the_least_recently_used():
+    one, two, three = (markdown_content(f"# Document {n}\n\n" + "text " * 200, 60) for n in "123")
+    rasters = board_module.Rasters(budget=board_module.Rasters.weigh(one) * 2 + 10)
+    keys = [board_module.Rasters.key(f"document {n}", 60) for n in "123"]
+
+    rasters.put(keys[0], one)
+    rasters.put(keys[1], two)
+    assert rasters.get(keys[0]) is one  # the first is now the more recently used
+    rasters.put(keys[2], three)
+
+    assert rasters.get(keys[1]) is None, "the least recently used raster was kept over budget"
+    assert rasters.get(keys[0]) is one and rasters.get(keys[2]) is three
+    assert rasters.bytes == sum(map(board_module.Rasters.weigh, (one, three))) <= rasters.budget
+
+    rasters.put(keys[1], markdown_content("# Huge\n\n" + "text " * 20_000, 60))
+
+    assert rasters.get(keys[1]) is None, "a raster larger than the whole budget emptied it"
+    assert len(rasters) == 2
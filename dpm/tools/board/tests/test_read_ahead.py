@@ -0,0 +1,280 @@
+"""The rows around the cursor are read before it gets there, and only while nothing else is (NFR3).
+
+Every step down the Epics column used to start from nothing: a settle, a read and a raster for the
+row just reached, with the row under it not asked about until the cursor arrived. These pin the
+read-ahead that replaced that: once the highlighted row's preview is up, the rows either side of it
+and the highlighted epic's first story are read and rasterised; a step onto one of them paints
+without reading it again; no read ahead starts while a panel's own read or raster is in flight,
+nor waits behind one; a row the cursor left mid-read is read ahead afresh rather than handed the
+cancelled read; and what is held stays inside its budget.
+
+**Counted at the reader.** A row painted from what was read ahead is a row the reader was asked for
+once, which is the one thing a quick machine could not make look true by being quick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from conftest import stand_in_pool
+from pilot import board, preview, until
+from recording_server import transcript_of
+
+import board as board_module
+from board import PREFETCH_ROWS, ReadAhead, neighbours
+from board_view import EpicView, ProjectView, StoryView
+
+#: Epics in the column, each with this many stories.
+EPICS = 10
+STORIES = 2
+
+
+def a_project() -> list[ProjectView]:
+    epics = tuple(
+        EpicView(
+            f"e{n}",
+            f"Epic {n}",
+            "ready",
+            stories=tuple(StoryView(f"s{n}-{m}", f"Story {n}.{m}", "pending") for m in range(STORIES)),
+        )
+        for n in range(EPICS)
+    )
+
+    return [ProjectView("fixture", Path("/fixture"), epics=epics)]
+
+
+def test_the_nearest_rows_come_first_and_the_one_below_before_the_one_above():
+    assert neighbours(list(range(10)), 5, 3) == [6, 4, 7, 3, 8, 2]
+    assert neighbours(list(range(10)), 0, 2) == [1, 2]
+    assert neighbours(list(range(3)), 2, 5) == [1, 0]
+
+
+def test_what_is_read_ahead_is_kept_within_its_budget_and_only_for_the_row_it_was_read_for():
+    held = ReadAhead(budget=100)
+    root = Path("/fixture")
+    rows = [StoryView(f"s{n}", f"Story {n}", "pending") for n in range(4)]
+
+    for row in rows:
+        assert held.put(root, row, "x" * 40)
+
+    assert held.size <= 100 and len(held) == 2, "the oldest were not let go to make room"
+    assert held.get(root, rows[0]) is None
+    assert held.get(root, rows[3]) == "x" * 40
+    assert held.get(root, StoryView("s3", "Story 3", "complete")) is None, (
+        "a row that changed since was answered with what was read for it before"
+    )
+    assert not held.put(root, rows[0], "x" * 101), "a preview over the whole budget was held"
+
+    other = Path("/other")
+    held.put(other, rows[0], "y" * 10)
+    held.forget(root)
+
+    assert held.get(other, rows[0]) == "y" * 10, "another project's previews were let go"
+    assert len(held) == 1 and held.size == 10
+
+
+async def test_the_rows_around_the_cursor_are_read_ahead_and_painted_without_reading_again():
+    asked: list[str] = []
+
+    async def read(root: Path, row) -> str:
+        asked.append(row.id)
+
+        return f"# Preview of {row.title}"
+
+    async with board(a_project(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        ahead = {f"e{n}" for n in range(1, PREFETCH_ROWS + 1)} | {"s0-0", "s0-1"}
+
+        assert await until(pilot, lambda: ahead <= set(asked)), (
+            f"only {sorted(asked)} were read with the cursor on the first epic"
+        )
+
+        await pilot.press("down")
+
+        assert await until(pilot, lambda: "Preview of Epic 1" in " ".join(preview(app, "epic")))
+        assert asked.count("e1") == 1, "a row read ahead of the cursor was read again on arrival"
+
+
+async def test_a_repaint_with_the_same_rows_keeps_what_was_read_ahead():
+    asked: list[str] = []
+
+    async def read(root: Path, row) -> str:
+        asked.append(row.id)
+
+        return f"# Preview of {row.title}"
+
+    async with board(a_project(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        assert await until(pilot, lambda: "e1" in asked)
+
+        # What a survey of another project landing, or a pill arriving, repaints with.
+        app.show(list(app.selection.projects))
+        await pilot.press("down")
+
+        assert await until(pilot, lambda: "Preview of Epic 1" in " ".join(preview(app, "epic")))
+        assert asked.count("e1") == 1, "a repaint let go of what was read ahead for rows it kept"
+
+
+async def test_a_write_to_the_project_lets_go_of_what_was_read_ahead_in_it():
+    asked: list[str] = []
+    surveyed: list[bool] = []
+
+    async def read(root: Path, row) -> str:
+        asked.append(row.id)
+
+        return f"# Preview of {row.title}"
+
+    async def survey(project: ProjectView, *, fresh: bool = False) -> ProjectView:
+        surveyed.append(fresh)
+
+        return project
+
+    async with board(a_project(), size=(120, 40), reader=read, survey=survey) as (app, pilot):
+        await pilot.press("right")
+
+        assert await until(pilot, lambda: "e1" in asked)
+
+        # A section rewritten leaves every row as it was, and the preview it is in is not.
+        app.database_changed(Path("/fixture"))
+
+        assert await until(pilot, lambda: True in surveyed)
+
+        await pilot.press("down")
+
+        assert await until(pilot, lambda: "Preview of Epic 1" in " ".join(preview(app, "epic")))
+        assert await until(pilot, lambda: not app._looking_ahead)
+        assert asked.count("e1") == 2, "a preview read ahead before the write was painted after it"
+
+
+async def test_nothing_is_read_ahead_while_a_panel_s_own_read_is_in_flight():
+    events: list[tuple[str, str]] = []
+    foreground = {"e0", "s0-0"}
+
+    async def read(root: Path, row) -> str:
+        events.append(("start", row.id))
+        # The cursor's own rows are the slow ones, so a read ahead that did not wait for them
+        # would start inside the window.
+        await asyncio.sleep(0.2 if row.id in foreground else 0)
+        events.append(("end", row.id))
+
+        return f"# Preview of {row.title}"
+
+    async with board(a_project(), size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        assert await until(pilot, lambda: ("start", "e1") in events)
+
+    ended = max(events.index(("end", row)) for row in foreground if ("end", row) in events)
+    ahead = [
+        events.index(event)
+        for event in events
+        if event[0] == "start" and event[1] not in foreground
+    ]
+
+    assert min(ahead) > ended, f"a read ahead started while the cursor's was in flight: {events}"
+
+
+async def test_the_cursor_s_raster_does_not_wait_behind_one_made_ahead_of_it(monkeypatch):
+    # The first raster of each preview but the cursor's first is slow, and the one read ahead is
+    # always first; the cursor's own raster of that row, made while it is still going, is quick.
+    monkeypatch.setattr(board_module, "RASTER_CACHE", board_module.Rasters())
+    first = "# Preview of Epic 0"
+    rasterised = board_module._rasterised
+    made: list[str] = []
+
+    def first_is_slow(markup: str, width: int):
+        made.append(markup)
+
+        # Previews only: a row's label is rasterised on the loop, the moment the cursor lands.
+        if made.count(markup) == 1 and markup.startswith("# Preview of") and markup != first:
+            time.sleep(1.0)
+
+        return rasterised(markup, width)
+
+    monkeypatch.setattr(board_module, "_rasterised", first_is_slow)
+
+    async def read(root: Path, row) -> str:
+        return f"# Preview of {row.title}"
+
+    projects = [replace(project, epics=tuple(replace(epic, stories=()) for epic in project.epics))
+                for project in a_project()]
+
+    async with board(projects, size=(120, 40), reader=read) as (app, pilot):
+        await pilot.press("right")
+
+        assert await until(pilot, lambda: "# Preview of Epic 1" in made), "nothing was read ahead"
+
+        pressed = time.perf_counter()
+        await pilot.press("down")
+
+        assert await until(pilot, lambda: "Preview of Epic 1" in " ".join(preview(app, "epic")))
+        waited = time.perf_counter() - pressed
+
+    assert waited < 0.5, f"the cursor's raster waited {waited:.2f}s behind one made ahead of it"
+
+
+async def test_a_row_left_mid_read_and_read_ahead_at_once_is_read_afresh(
+    transcript, project, monkeypatch
+):
+    # The cursor leaves a row whose read is its only caller, for one already read: that one paints
+    # at once, and the row it left is the first read ahead of it — asked for on the turn of the
+    # loop the read it left was cancelled on, which is the read most likely to be handed that
+    # cancellation rather than an answer (see `ServerPool._single_flight`).
+    monkeypatch.setenv("RECORDING_CALL_DELAY", "0.3")
+    monkeypatch.setattr(board_module, "PREFETCH_ROWS", 0)
+    root = project()
+
+    async with stand_in_pool() as pool:
+        ask = pool._ask
+
+        async def slow_to_cancel(*arguments):
+            # A cancelled read that takes a while to finish being cancelled — a withdrawal still
+            # being written — holds that turn of the loop open long enough to land in.
+            try:
+                return await ask(*arguments)
+            except asyncio.CancelledError:
+                await asyncio.shield(asyncio.sleep(0.2))
+                raise
+
+        monkeypatch.setattr(pool, "_ask", slow_to_cancel)
+
+        async def read(root: Path, row) -> str:
+            await pool.read(root, "list_epic", {"search": row.id})
+
+            return f"# Preview of {row.title}"
+
+        projects = [replace(project, path=root) for project in a_project()]
+
+        async with board(projects, size=(120, 40), reader=read) as (app, pilot):
+            await pilot.press("right", "down", "down")
+
+            assert await until(pilot, lambda: "Preview of Epic 2" in " ".join(preview(app, "epic")))
+
+            monkeypatch.setattr(board_module, "PREFETCH_ROWS", 1)
+            await pilot.press("down")
+
+            assert await until(pilot, lambda: asked(transcript, "e3")), "the row was never read"
+
+            await pilot.press("up")
+
+            assert await until(pilot, lambda: app._read_ahead.get(root, app.selection.epics[3])), (
+                "the row left mid-read was not read ahead of the cursor"
+            )
+
+            await pilot.press("down")
+
+            assert await until(pilot, lambda: "Preview of Epic 3" in " ".join(preview(app, "epic")))
+            assert not [worker for worker in app.workers if worker.error is not None]
+
+
+def asked(transcript: Path, row: str) -> bool:
+    return any(
+        message.get("method") == "tools/call"
+        and message["params"]["arguments"].get("search") == row
+        for message in transcript_of(transcript)
+    )
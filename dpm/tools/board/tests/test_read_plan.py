@@ -0,0 +1,115 @@
+"""A project's reads as one plan: concurrent, capped per project, and all-or-nothing (FR13, NFR3).
+
+The survey asks eight questions of one project's server and none of them needs another's answer,
+so a row that waited for them in a line was waiting for the sum of eight round trips. These pin the
+three things the plan has to keep while it stops doing that: it costs its slowest read rather than
+their total, a failure still ends the whole read with the state the failing read named, and the
+pool — not the plan — decides how many reads reach one server at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from time import perf_counter
+
+import pytest
+from conftest import STAND_IN, stand_in_pool
+from recording_server import transcript_of
+
+from board import read_view
+from mcp_client import MCPClient, ServerPool, Unreadable
+from status_model import execute
+
+#: How long each planted read takes. Long enough that eight of them in a line are unmistakably
+#: longer than one, short enough to pay for on every run.
+READ = 0.1
+
+
+async def test_a_plan_costs_its_slowest_read_rather_than_their_sum():
+    started = perf_counter()
+    planned = await execute({f"read {n}": asyncio.sleep(READ, result=n) for n in range(8)})
+    took = perf_counter() - started
+
+    assert planned.values == {f"read {n}": n for n in range(8)}
+    assert took < READ * 4, f"eight reads of {READ}s took {took:.2f}s — they ran in a line"
+    assert READ <= planned.critical_path <= took, (
+        f"the critical path {planned.critical_path:.3f}s is not the longest read of a plan that "
+        f"took {took:.3f}s"
+    )
+
+
+async def test_one_failing_read_ends_the_plan_with_its_own_state_and_cancels_the_rest():
+    """The state is the read's own ``Unreadable``, not a group wrapping it.
+
+    Every caller names a project's state by catching :class:`Unreadable` itself, so an
+    ``ExceptionGroup`` here would turn every named state into the catch-all's server-failed row.
+    """
+    abandoned = asyncio.Event()
+
+    async def failing():
+        raise Unreadable("no-database", "planted")
+
+    async def slow():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+
+    with pytest.raises(Unreadable) as state:
+        await execute({"slow": slow(), "failing": failing()})
+
+    assert state.value.state == "no-database"
+    assert abandoned.is_set(), "the read still in flight was left running after the plan failed"
+
+
+async def test_the_survey_makes_all_eight_reads_and_reports_its_critical_path(
+    transcript, project
+):
+    root = project()
+
+    async with stand_in_pool() as pool:
+        view = await read_view(pool, root, "project")
+
+    asked = {
+        message["params"]["name"]
+        for message in transcript_of(transcript)
+        if message["method"] == "tools/call"
+    }
+
+    assert asked == {
+        "list_epic", "list_story", "list_spec", "list_retro", "list_dependency",
+        "list_dependency_kind", "check_integrity",
+    }, f"the plan did not ask for what the survey reads: {sorted(asked)}"
+    assert view.read_time is not None and view.read_time > 0
+
+
+async def test_the_pool_caps_the_reads_on_one_server_at_its_width(
+    transcript, project, monkeypatch
+):
+    """Twenty reads asked for at once, and never more than the width on the wire together."""
+    width = 2
+    in_flight = 0
+    most = 0
+    call = MCPClient.call
+
+    async def counted(self, *args, **kwargs):
+        nonlocal in_flight, most
+        in_flight += 1
+        most = max(most, in_flight)
+
+        try:
+            await asyncio.sleep(0.01)
+
+            return await call(self, *args, **kwargs)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(MCPClient, "call", counted)
+    root = project()
+
+    async with ServerPool(STAND_IN, node=sys.executable, width=width) as pool:
+        await asyncio.gather(*(pool.read(root, "list_epic", {"n": n}) for n in range(20)))
+
+    assert most == width, f"{most} reads were on one server at once against a width of {width}"
@@ -0,0 +1,148 @@
+"""Servers are reaped when idle and capped in number, and come back on the next read (AD4, NFR3).
+
+A board left open over a long registry used to hold a Node process and an open database for every
+project it had ever read, for as long as it stayed open. These pin the bound on that — an idle
+timeout, a cap with the least recently read server going first, and neither ever closing a server
+with a read in flight — and the property that makes it invisible: a reaped project's next read
+spawns its server again, exactly as its first did.
+
+**Asserted from outside the pool**, as the pool's other tests are: a server is gone when its pid no
+longer answers a signal, and a respawn is a second ``initialize`` in the transcript.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+from clock import Clock
+from conftest import STAND_IN, is_running
+from recording_server import transcript_of
+
+from mcp_client import MCPClient, ServerPool
+from status_model import EPICS, STORIES
+
+
+def handshakes(transcript) -> int:
+    return sum(1 for message in transcript_of(transcript) if message["method"] == "initialize")
+
+
+async def gone(pid: int, *, timeout: float) -> bool:
+    """Whether ``pid`` exits within ``timeout`` seconds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+
+    while is_running(pid):
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+
+        await asyncio.sleep(0.05)
+
+    return True
+
+
+def pool(**budget) -> ServerPool:
+    return ServerPool(STAND_IN, node=sys.executable, **budget)
+
+
+async def test_an_idle_server_is_reaped_and_respawned_by_its_next_read(transcript, project):
+    root = project()
+    clock = Clock()
+
+    async with pool(idle=60.0, clock=clock) as servers:
+        await servers.read(root, EPICS)
+        first = (await servers.client(root)).pid
+
+        clock.now += 30
+        assert await servers.reap_idle() == 0, "a server read half a timeout ago was reaped"
+
+        clock.now += 60
+        assert await servers.reap_idle() == 1
+        assert not is_running(first), "the reaped server is still running"
+
+        answer = await servers.read(root, STORIES)
+
+    assert answer["tool"] == STORIES.name
+    assert handshakes(transcript) == 2, "the read after the reap did not respawn the server"
+    assert servers.reaped == {"idle": 1}
+
+
+async def test_the_pool_reaps_idle_servers_on_its_own(transcript, project):
+    root = project()
+
+    async with pool(idle=0.2) as servers:
+        await servers.read(root, EPICS)
+        pid = (await servers.client(root)).pid
+
+        assert await gone(pid, timeout=5.0), (
+            "an idle server was never reaped while the board stayed open"
+        )
+
+
+async def test_past_the_cap_the_server_read_longest_ago_makes_room(transcript, project):
+    roots = [project("one"), project("two"), project("three")]
+    clock = Clock()
+
+    async with pool(max_live=2, idle=None, clock=clock) as servers:
+        pids = []
+
+        for root in roots:
+            clock.now += 1
+            await servers.read(root, EPICS)
+            pids.append((await servers.client(root)).pid)
+
+        assert [is_running(pid) for pid in pids] == [False, True, True]
+        assert len(servers._clients) == 2
+        assert servers.reaped == {"evicted": 1}
+
+
+async def test_a_server_with_a_read_in_flight_is_never_reaped(transcript, project, monkeypatch):
+    root = project()
+    clock = Clock()
+    release = asyncio.Event()
+    call = MCPClient.call
+
+    async def held(self, *args, **kwargs):
+        await release.wait()
+
+        return await call(self, *args, **kwargs)
+
+    monkeypatch.setattr(MCPClient, "call", held)
+
+    async with pool(idle=1.0, clock=clock) as servers:
+        reading = asyncio.create_task(servers.read(root, EPICS))
+
+        while not servers._clients:
+            await asyncio.sleep(0.01)
+
+        clock.now += 100
+
+        assert await servers.reap_idle() == 0, "the server was reaped under a read"
+
+        release.set()
+
+        assert (await reading)["tool"] == EPICS.name
+        assert handshakes(transcript) == 1
+
+
+async def test_each_live_server_reports_its_resident_memory_from_one_ps(
+    transcript, project, monkeypatch
+):
+    roots = [project("one"), project("two"), project("three")]
+    spawn = asyncio.create_subprocess_exec
+    asked: list[tuple[str, ...]] = []
+
+    async def counted(*argv, **options):
+        asked.append(argv)
+
+        return await spawn(*argv, **options)
+
+    async with pool() as servers:
+        for root in roots:
+            await servers.read(root, EPICS)
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", counted)
+        memory = await servers.memory()
+
+    assert sorted(memory) == sorted(root.resolve() for root in roots)
+    assert all(rss is not None and rss > 0 for rss in memory.values()), memory
+    assert [argv[0] for argv in asked] == ["ps"], f"{len(asked)} processes for one reading: {asked}"
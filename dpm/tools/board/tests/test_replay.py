@@ -0,0 +1,135 @@
+"""A session recorded once plays back offline, at its own pace or a scaled one (NFR3).
+
+Benchmarks against live servers measured Node and the disk as much as the board. These pin the
+pair that replaces them: a pool records every message each way with when it crossed, and the replay
+stand-in answers a board from that file — the same rows, no Node and no real databases, at the
+recorded latency or a multiple of it, and with an error naming any request the recording never saw.
+
+Recorded from the stand-in rather than from ``bin/dpm-mcp.js``: what is under test is the recording
+and the replay, and the stand-in's handshake delay is what makes the latency something to assert.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from conftest import NETGUARD, STAND_IN
+from replay_server import PROJECTS, stage
+
+from board import survey_project
+from board_view import ProjectView
+from mcp_client import RECEIVED, SENT, Recorder, ServerPool, Unreadable
+from metrics import HANDSHAKE, Metrics
+from status_model import EPICS
+
+REPLAY = NETGUARD / "replay_server.py"
+
+#: The stand-in's handshake delay while recording, in seconds.
+DELAY = 0.4
+
+
+async def recorded(
+    tmp_path: Path, roots: list[Path], monkeypatch
+) -> tuple[Path, list[ProjectView]]:
+    """A survey of ``roots`` through the stand-in, recorded; the file and the rows it produced."""
+    monkeypatch.setenv("RECORDING_DELAY", str(DELAY))
+    stream = io.StringIO()
+
+    async with ServerPool(STAND_IN, node=sys.executable, record=Recorder(stream)) as pool:
+        views = [
+            await survey_project(pool, ProjectView(name=root.name, path=root, pending=True))
+            for root in roots
+        ]
+
+    monkeypatch.delenv("RECORDING_DELAY")
+    recording = tmp_path / "session.jsonl"
+    recording.write_text(stream.getvalue())
+
+    return recording, views
+
+
+def replaying(monkeypatch, recording: Path, into: Path, *, scale: float = 1.0) -> dict[str, Path]:
+    staged = stage(recording, into)
+    monkeypatch.setenv("REPLAY_RECORDING", str(recording))
+    monkeypatch.setenv("REPLAY_PROJECTS", str(into / PROJECTS))
+    monkeypatch.setenv("REPLAY_SCALE", str(scale))
+
+    return staged
+
+
+async def test_every_message_is_recorded_each_way_with_its_project_and_when(
+    tmp_path, project, transcript, monkeypatch
+):
+    root = project()
+    recording, _ = await recorded(tmp_path, [root], monkeypatch)
+    lines = [json.loads(line) for line in recording.read_text().splitlines()]
+
+    sent = [line["message"]["method"] for line in lines if line["direction"] == SENT]
+    answered = {line["message"].get("id") for line in lines if line["direction"] == RECEIVED}
+    asked = {
+        line["message"]["id"]
+        for line in lines
+        if line["direction"] == SENT and "id" in line["message"]
+    }
+
+    assert sent[:3] == ["initialize", "notifications/initialized", "tools/list"]
+    assert "tools/call" in sent
+    assert asked == answered, "a request with no reply recorded, or a reply with no request"
+    assert {line["project"] for line in lines} == {str(root.resolve())}
+    assert [line["at"] for line in lines] == sorted(line["at"] for line in lines)
+
+
+async def test_a_replayed_survey_paints_the_rows_the_live_one_did_with_no_server_behind_it(
+    tmp_path, project, transcript, monkeypatch
+):
+    roots = [project("one"), project("two")]
+    recording, live = await recorded(tmp_path, roots, monkeypatch)
+    staged = replaying(monkeypatch, recording, tmp_path / "staged", scale=0)
+    calls_before = transcript.read_text()
+
+    async with ServerPool(REPLAY, node=sys.executable) as pool:
+        replayed = [
+            await survey_project(
+                pool, ProjectView(name=root.name, path=staged[str(root.resolve())], pending=True)
+            )
+            for root in roots
+        ]
+
+    assert replayed == [replace(view, path=staged[str(view.path.resolve())]) for view in live]
+    assert transcript.read_text() == calls_before, "the recording stand-in answered the replay"
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.1])
+async def test_the_recorded_latency_is_replayed_and_can_be_scaled(
+    tmp_path, project, transcript, monkeypatch, scale
+):
+    root = project()
+    recording, _ = await recorded(tmp_path, [root], monkeypatch)
+    staged = replaying(monkeypatch, recording, tmp_path / "staged", scale=scale)
+    metrics = Metrics()
+
+    async with ServerPool(REPLAY, node=sys.executable, metrics=metrics) as pool:
+        await survey_project(pool, ProjectView(name="p", path=staged[str(root.resolve())]))
+
+    handshake = metrics.timing(HANDSHAKE).longest
+
+    assert DELAY * scale * 0.9 <= handshake < DELAY * scale + 0.3, (
+        f"a {DELAY}s handshake replayed at ×{scale} took {handshake:.3f}s"
+    )
+
+
+async def test_a_request_the_recording_never_saw_is_refused_by_name(
+    tmp_path, project, transcript, monkeypatch
+):
+    root = project()
+    recording, _ = await recorded(tmp_path, [root], monkeypatch)
+    staged = replaying(monkeypatch, recording, tmp_path / "staged", scale=0)
+
+    async with ServerPool(REPLAY, node=sys.executable) as pool:
+        with pytest.raises(Unreadable, match="not in the recording"):
+            await pool.read(staged[str(root.resolve())], EPICS, {"limit": 7, "offset": 700})
@@ -0,0 +1,228 @@
+"""Stale-while-revalidate: an answer past its window is painted, and asked for again behind it (FR13).
+
+A window that expired used to make a warm board a cold one: every read past it went out, behind a
+spawn, and the row said `reading…` over figures that were nearly always still right. These pin the
+replacement — the stamp still decides what is servable at all, the window now decides only whether
+the pool asks again, and the row is repainted when the answer actually changed.
+
+**Counted on the wire, as the rest of the cache's tests are.** Whether a revalidation happened is
+read off the stand-in's transcript rather than off the pool's account of itself.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from clock import Clock
+from conftest import STAND_IN
+from pilot import board, lines, until
+from recording_server import transcript_of
+
+from board import SURVEY_WIDTH, registry_views, revalidate_project, survey_project
+from board_view import REFRESHING
+from cache import MISS, WINDOW, Cache, stamp_of
+from mcp_client import MCPClient, ServerPool
+from registry import RegistryEntry
+from status_model import EPICS, INTEGRITY, WINDOWS
+
+#: The schema the stand-in reports, so entries are servable at all.
+SCHEMA = 1
+
+#: How long the stand-in takes over its handshake in the session that revalidates — long enough
+#: that the stale row is unmistakably on screen before the re-read can land.
+SLOW = 1.0
+
+#: How long a survey is given to land before a test reads what it painted.
+SETTLE = 30.0
+
+#: Projects on the board that revalidates them all — far more than the survey gate's width.
+REGISTRY = 30
+
+#: How long each of their handshakes takes, so the spawns the re-reads cause overlap visibly.
+HANDSHAKE = 0.2
+
+
+def calls(transcript) -> list[str]:
+    return [
+        message["params"]["name"]
+        for message in transcript_of(transcript)
+        if message.get("method") == "tools/call"
+    ]
+
+
+def test_each_tool_is_trusted_for_its_own_window(tmp_path, project):
+    """Long for the integrity sweep, short for the epic list — the table's two ends."""
+    assert WINDOWS[EPICS.name] < WINDOW < WINDOWS[INTEGRITY.name]
+
+    root = project()
+    clock = Clock()
+    cache = Cache(tmp_path / "cache.json", windows=WINDOWS, clock=clock)
+    stamp = stamp_of(root, SCHEMA)
+
+    for call in (EPICS, INTEGRITY):
+        cache.put(root, call.name, None, stamp, {"from": call.name})
+
+    clock.now = WINDOWS[EPICS.name] + 1
+
+    assert cache.get(root, EPICS.name, None, stamp) is MISS, "the epic list outlived its window"
+    assert cache.get(root, INTEGRITY.name, None, stamp) == {"from": INTEGRITY.name}
+
+    # Past its window but stamped against the same database, so it is stale rather than gone.
+    assert cache.lookup(root, EPICS.name, None, stamp) == ({"from": EPICS.name}, True)
+
+
+async def test_a_stale_answer_is_served_at_once_and_asked_for_again(
+    tmp_path, project, transcript, monkeypatch
+):
+    monkeypatch.setenv("RECORDING_SCHEMA", str(SCHEMA))
+    root = project()
+    clock = Clock()
+    cache = Cache(tmp_path / "cache.json", clock=clock)
+
+    async with ServerPool(STAND_IN, node=sys.executable, cache=cache) as pool:
+        first = await pool.read(root, EPICS)
+        cache.put(root, EPICS.name, None, stamp_of(root, SCHEMA), {"planted": True})
+        clock.now = WINDOW + 1
+
+        served = await pool.read(root, EPICS, stale=True)
+
+        assert served == {"planted": True}, "the stale answer was not the one served"
+        assert pool.revalidating(root), "nothing was asked for again behind the stale answer"
+        assert await pool.settled(root), "a re-read that replaced the planted answer changed nothing"
+        assert cache.get(root, EPICS.name, None, stamp_of(root, SCHEMA)) == first
+
+    assert calls(transcript) == [EPICS.name, EPICS.name]
+
+
+async def test_a_re_read_that_changes_nothing_rebuilds_no_row(
+    tmp_path, project, transcript, monkeypatch
+):
+    """``None`` from :func:`revalidate_project`, which is what keeps the board from flickering."""
+    monkeypatch.setenv("RECORDING_SCHEMA", str(SCHEMA))
+    root = project()
+    clock = Clock()
+    view = registry_views([RegistryEntry(str(root))])[0]
+
+    async with ServerPool(
+        STAND_IN, node=sys.executable, cache=Cache(tmp_path / "cache.json", clock=clock)
+    ) as pool:
+        read = await survey_project(pool, view)
+        clock.now = WINDOW * 100
+        stale = await survey_project(pool, view)
+
+        assert stale.refreshing and not read.refreshing
+        assert stale == read
+        assert await revalidate_project(pool, stale) is None
+
+
+async def test_a_warm_board_paints_stale_rows_marked_and_clears_the_mark(
+    tmp_path, project, transcript, monkeypatch
+):
+    """The feature, end to end: a second session past every window, behind a slow server.
+
+    The first session fills the cache and teaches it the schema. The second starts with every
+    entry stale and a stand-in slow to answer its handshake — so the row on screen before that
+    handshake is the stale one, marked, and the mark going is the re-read landing.
+    """
+    monkeypatch.setenv("RECORDING_SCHEMA", str(SCHEMA))
+    root = project()
+    clock = Clock()
+    path = tmp_path / "cache.json"
+    entries = [RegistryEntry(str(root))]
+
+    async with ServerPool(STAND_IN, node=sys.executable, cache=Cache(path, clock=clock)) as pool:
+        await survey_project(pool, registry_views(entries)[0])
+
+    surveyed = calls(transcript)
+    clock.now = WINDOW * 100
+    monkeypatch.setenv("RECORDING_DELAY", str(SLOW))
+    pool = ServerPool(STAND_IN, node=sys.executable, cache=Cache(path, clock=clock))
+
+    try:
+        async with board(
+            registry_views(entries),
+            survey=lambda view, *, fresh=False: survey_project(pool, view, fresh=fresh),
+            revalidate=lambda view: revalidate_project(pool, view),
+        ) as (app, pilot):
+            marked = await until(
+                pilot, lambda: any(REFRESHING in row for row in lines(app, "projects")), timeout=SLOW
+            )
+
+            assert marked, f"no row was painted stale and marked: {lines(app, 'projects')}"
+
+            assert calls(transcript) == surveyed, "the stale row waited for the server to paint"
+
+            cleared = await until(
+                pilot,
+                lambda: not any(REFRESHING in row for row in lines(app, "projects")),
+                timeout=SETTLE,
+            )
+
+            assert cleared, f"the mark stayed after the re-read: {lines(app, 'projects')}"
+    finally:
+        await pool.close()
+
+    assert sorted(calls(transcript)) == sorted(surveyed * 2), (
+        "the stale answers were not each asked for again"
+    )
+
+
+async def test_a_warm_start_past_the_window_starts_no_more_servers_at_once_than_a_cold_one(
+    tmp_path, project, transcript, monkeypatch
+):
+    """Every row stale means every project asked for again — through the same bound as a survey.
+
+    A cold start spawns a survey's worth of servers at a time. Past the window, the surveys are
+    answered from the cache without a spawn and the re-reads behind them are what spawn, one per
+    project; unbounded, that was the whole registry starting at once. Counted at
+    :meth:`MCPClient.start`, which is where a spawn begins and its handshake ends.
+    """
+    monkeypatch.setenv("RECORDING_SCHEMA", str(SCHEMA))
+    clock = Clock()
+    path = tmp_path / "cache.json"
+    entries = [RegistryEntry(str(project(f"p{n:02d}"))) for n in range(REGISTRY)]
+
+    async with ServerPool(STAND_IN, node=sys.executable, cache=Cache(path, clock=clock)) as pool:
+        for view in registry_views(entries):
+            await survey_project(pool, view)
+
+    starting = widest = 0
+    start = MCPClient.start
+
+    async def counted(client: MCPClient) -> MCPClient:
+        nonlocal starting, widest
+        starting += 1
+        widest = max(widest, starting)
+
+        try:
+            return await start(client)
+        finally:
+            starting -= 1
+
+    monkeypatch.setattr(MCPClient, "start", counted)
+    monkeypatch.setenv("RECORDING_DELAY", str(HANDSHAKE))
+    clock.now = WINDOW * 100
+    pool = ServerPool(STAND_IN, node=sys.executable, cache=Cache(path, clock=clock))
+
+    try:
+        async with board(
+            registry_views(entries),
+            survey=lambda view, *, fresh=False: survey_project(pool, view, fresh=fresh),
+            revalidate=lambda view: revalidate_project(pool, view),
+        ) as (app, pilot):
+            settled = await until(
+                pilot,
+                lambda: not any(
+                    row.pending or row.refreshing for row in app.selection.projects
+                ),
+                timeout=SETTLE,
+            )
+
+            assert settled, f"the board never finished revalidating: {lines(app, 'projects')}"
+    finally:
+        await pool.close()
+
+    assert widest, "nothing was asked for again, so the test says nothing about how many at once"
+    assert widest <= SURVEY_WIDTH, (
+        f"{widest} servers started at once on a warm start, against a gate of {SURVEY_WIDTH}"
+    )
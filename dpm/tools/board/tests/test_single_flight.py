@@ -0,0 +1,122 @@
+"""Identical reads in flight together share one request (FR13, NFR3).
+
+A preview worker per highlighted row, a survey, a search and a revalidation can all ask one project
+for the same thing inside a single round trip, and each used to be its own ``tools/call``. These pin
+the coalescing: identical reads — by the key the cache uses — are one call on the wire, different
+ones are not, the pool counts what it saved, and a caller that leaves does not take the others'
+answer with it.
+
+**Counted on the wire**, off the stand-in's transcript, as the cache's tests are.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from conftest import stand_in_pool
+from recording_server import transcript_of
+
+from mcp_client import MCPClient
+
+#: How many callers ask at once — enough that any per-caller send is unmistakable.
+CALLERS = 10
+
+
+def calls(transcript) -> list[dict]:
+    return [message for message in transcript_of(transcript) if message["method"] == "tools/call"]
+
+
+async def test_identical_reads_in_flight_together_are_one_call(transcript, project):
+    root = project()
+
+    async with stand_in_pool() as pool:
+        answers = await asyncio.gather(
+            *(pool.read(root, "list_epic", {"limit": 5}) for _ in range(CALLERS))
+        )
+
+    assert len(calls(transcript)) == 1, f"{len(calls(transcript))} calls for one read"
+    assert all(answer == answers[0] for answer in answers)
+    assert pool.saved == {"list_epic": CALLERS - 1}
+
+
+async def test_reads_that_differ_in_their_arguments_are_not_shared(transcript, project):
+    root = project()
+
+    async with stand_in_pool() as pool:
+        await asyncio.gather(*(pool.read(root, "list_epic", {"n": n}) for n in range(CALLERS)))
+
+    assert len(calls(transcript)) == CALLERS
+    assert not pool.saved
+
+
+async def test_a_caller_that_leaves_does_not_cancel_the_read_the_others_wait_on(
+    transcript, project, monkeypatch
+):
+    root = project()
+    release = asyncio.Event()
+    entered = asyncio.Event()
+    abandoned = asyncio.Event()
+    call = MCPClient.call
+
+    async def held(self, *args, **kwargs):
+        entered.set()
+
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+
+        return await call(self, *args, **kwargs)
+
+    monkeypatch.setattr(MCPClient, "call", held)
+
+    async with stand_in_pool() as pool:
+        leaving = asyncio.create_task(pool.read(root, "list_epic"))
+        staying = asyncio.create_task(pool.read(root, "list_epic"))
+        await asyncio.sleep(0)
+
+        leaving.cancel()
+        release.set()
+
+        assert await staying is not None
+        assert not abandoned.is_set(), "the read was cancelled with a caller still waiting on it"
+
+        with pytest.raises(asyncio.CancelledError):
+            await leaving
+
+        # And once every caller has gone, the read goes with them rather than answering nobody.
+        release.clear()
+        entered.clear()
+        alone = asyncio.create_task(pool.read(root, "list_story"))
+        await asyncio.wait_for(entered.wait(), timeout=5)
+        alone.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await alone
+
+        await asyncio.wait_for(abandoned.wait(), timeout=5)
+        await asyncio.sleep(0)
+
+        assert not pool._flights, "a cancelled read was left registered as in flight"
+
+
+async def test_a_read_made_just_after_the_last_caller_left_is_a_flight_of_its_own(
+    transcript, project
+):
+    root = project()
+
+    async with stand_in_pool() as pool:
+        alone = asyncio.create_task(pool.read(root, "list_epic"))
+        await asyncio.sleep(0)
+        alone.cancel()
+
+        # On the same turn of the loop, before the cancelled flight has finished being cancelled.
+        again = asyncio.create_task(pool.read(root, "list_epic"))
+
+        with pytest.raises(asyncio.CancelledError):
+            await alone
+
+        assert await again is not None, "the new read was handed the old one's cancellation"
+        assert not pool._flights
@@ -13,16 +13,19 @@ raw string names is here too: the declaration has to *be* the call, not accompan
 from __future__ import annotations
 
 import ast
+import asyncio
 import json
+import sys
 from pathlib import Path
 
 import pytest
-from conftest import BOARD_DIR, stand_in_pool
-from recording_server import DEFAULT_TOOLS
+from conftest import BOARD_DIR, STAND_IN, stand_in_pool
+from recording_server import DEFAULT_TOOLS, transcript_of
 
 # Imported for its side effect as much as its contents: importing the module that makes the calls
 # is what puts them in `SURFACE`, which is the point of declaring at the call site.
 import board
+from cache import Cache
 from mcp_client import (
     SURFACE,
     SURFACE_MISMATCH,
@@ -189,3 +192,58 @@ async def test_a_mismatched_server_is_not_left_running(transcript, project, monk
             await servers.read(root, board.EPICS)
 
         assert servers._clients == {}, "the mismatched server was kept in the pool"
+
+
+def listings(transcript: Path) -> int:
+    """How many ``tools/list`` requests reached any stand-in — the servers' count, not the pool's."""
+    return sum(message.get("method") == "tools/list" for message in transcript_of(transcript))
+
+
+async def test_a_pool_of_servers_starting_at_once_asks_one_of_them_for_its_tools(
+    transcript, project
+):
+    """The reconciliation is per executable, and every server in a pool is the same one (NFR3)."""
+    roots = [project(f"p{n}") for n in range(6)]
+
+    async with stand_in_pool() as servers:
+        await asyncio.gather(*(servers.read(root, board.EPICS) for root in roots))
+
+    assert listings(transcript) == 1
+
+
+async def test_the_listing_is_kept_for_the_next_session_and_asked_again_of_a_new_executable(
+    tmp_path, transcript, project, monkeypatch
+):
+    # A schema to stamp against, because a session that cached no answers keeps nothing at all.
+    monkeypatch.setenv("RECORDING_SCHEMA", "1")
+    root = project()
+    path = tmp_path / "cache.json"
+    upgraded = tmp_path / "upgraded" / STAND_IN.name
+    upgraded.parent.mkdir()
+    upgraded.write_bytes(STAND_IN.read_bytes() + b"\n")
+
+    for server in (STAND_IN, STAND_IN, upgraded):
+        async with ServerPool(server, node=sys.executable, cache=Cache(path)) as servers:
+            await servers.read(root, board.EPICS)
+
+    # The control is the middle session: without it, one ask per executable could as well be a
+    # cache that kept nothing and a stand-in that was only ever asked twice.
+    assert listings(transcript) == 2
+
+
+async def test_a_known_mismatch_refuses_the_next_project_without_spawning_it(
+    transcript, project, spawned, monkeypatch
+):
+    monkeypatch.setenv("RECORDING_TOOLS", "[]")
+    first, second = project("first"), project("second")
+
+    async with stand_in_pool() as servers:
+        with pytest.raises(Unreadable) as asked:
+            await servers.read(first, board.EPICS)
+
+        with pytest.raises(Unreadable) as known:
+            await servers.read(second, board.EPICS)
+
+    assert asked.value.state == known.value.state == SURFACE_MISMATCH
+    assert known.value.detail == asked.value.detail.replace(str(first), str(second))
+    assert len(spawned()) == 1, "a server was spawned to be asked what its twin already answered"
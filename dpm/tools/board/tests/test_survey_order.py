@@ -0,0 +1,192 @@
+"""Surveys are admitted a few at a time, the project under the cursor first (NFR3).
+
+The board used to start every project's survey at once — on a long registry, a handshake per
+project competing for the same cores, with the highlighted row finishing when the last did. These
+pin the gate that replaced that: never more than its width reading at once, and each freed slot going
+to the highlighted project, then to the rows on screen, then to the rest — decided when the slot
+frees, so a cursor that moved while the board was reading is followed. A warm start past the window
+goes through the same gate a second time: each row painted stale is refreshed in a slot of its own,
+after every first survey and in the same order among themselves.
+
+**Read off the survey's own call order**, which is the order the gate admitted projects in. Every
+survey here is held until the test lets it go, so the order is the gate's and not the scheduler's.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from pathlib import Path
+
+import board
+from pilot import board as open_board
+from pilot import until
+
+from board import PriorityGate
+from board_view import ProjectView
+
+#: How many projects are registered — more than the column shows at the test's size.
+PROJECTS = 40
+
+#: The gate's width for these tests, narrowed so a queue forms behind it.
+WIDTH = 2
+
+#: Where the cursor is moved to while the first surveys are still reading.
+CURSOR = 6
+
+
+async def test_a_freed_slot_goes_to_whoever_ranks_best_at_that_moment():
+    ranks = {"a": 1, "b": 2, "c": 3}
+    gate = PriorityGate(1, lambda key: ranks[key])
+    admitted: list[str] = []
+    release = asyncio.Event()
+
+    async def holder(key: str) -> None:
+        async with gate.slot(key):
+            admitted.append(key)
+            await release.wait()
+
+    first = asyncio.create_task(holder("first"))
+    await asyncio.sleep(0)
+    waiting = [asyncio.create_task(holder(key)) for key in ranks]
+    await asyncio.sleep(0)
+
+    # Reranked while they wait: the change has to be seen, without anybody telling the gate.
+    ranks["c"] = 0
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert admitted == ["first", "c", "a", "b"]
+
+
+async def test_a_waiter_that_is_cancelled_gives_up_its_place_and_never_its_slot():
+    gate = PriorityGate(1, lambda key: key)
+    release = asyncio.Event()
+    admitted: list[int] = []
+
+    async def holder(key: int) -> None:
+        async with gate.slot(key):
+            admitted.append(key)
+            await release.wait()
+
+    holding = asyncio.create_task(holder(0))
+    await asyncio.sleep(0)
+    cancelled, after = asyncio.create_task(holder(1)), asyncio.create_task(holder(2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(holding, after, cancelled, return_exceptions=True)
+
+    assert admitted == [0, 2]
+
+
+async def test_the_highlighted_project_and_the_visible_rows_are_surveyed_first(monkeypatch):
+    monkeypatch.setattr(board, "SURVEY_WIDTH", WIDTH)
+    views = [
+        ProjectView(name=f"project {n:02d}", path=Path(f"/projects/{n:02d}"), pending=True)
+        for n in range(PROJECTS)
+    ]
+    started: list[int] = []
+    reading = 0
+    widest = 0
+    permits = asyncio.Semaphore(0)
+
+    async def survey(view: ProjectView, *, fresh: bool = False) -> ProjectView:
+        nonlocal reading, widest
+        started.append(int(view.path.name))
+        reading += 1
+        widest = max(widest, reading)
+        await permits.acquire()
+        reading -= 1
+
+        return replace(view, pending=False)
+
+    async with open_board(views, size=(120, 20), survey=survey) as (app, pilot):
+        assert await until(pilot, lambda: len(started) == WIDTH)
+
+        for _ in range(CURSOR):
+            await pilot.press("down")
+
+        visible = app._on_screen()
+
+        for _ in range(PROJECTS):
+            permits.release()
+
+        assert await until(pilot, lambda: len(started) == PROJECTS)
+
+    assert widest == WIDTH, f"{widest} surveys read at once against a width of {WIDTH}"
+    assert visible.stop < PROJECTS, "every row is on screen, so the test says nothing about order"
+
+    queued = started[WIDTH:]
+    on_screen = [index for index in queued if index in visible]
+
+    assert queued[0] == CURSOR, f"the highlighted project was not next: {queued}"
+    assert queued[: len(on_screen)] == on_screen, f"an off-screen row went before a visible one: {queued}"
+    assert on_screen[1:] == sorted(on_screen[1:]), f"the visible rows went out of order: {queued}"
+
+
+async def test_a_warm_start_refreshes_its_stale_rows_through_the_same_slots_and_order(monkeypatch):
+    """Every row painted stale at once, and every refresh a possible spawn — so gated like a survey.
+
+    The surveys answer at once, as a warm cache does; the refreshes are held, as a spawn would hold
+    them. A refresh ranks after any first survey still waiting, so the surveys queued behind the
+    first refreshes all go before the next refresh does.
+    """
+    monkeypatch.setattr(board, "SURVEY_WIDTH", WIDTH)
+    views = [
+        ProjectView(name=f"project {n:02d}", path=Path(f"/projects/{n:02d}"), pending=True)
+        for n in range(PROJECTS)
+    ]
+    order: list[tuple[str, int]] = []
+    refreshed: list[int] = []
+    reading = 0
+    widest = 0
+    permits = asyncio.Semaphore(0)
+
+    async def survey(view: ProjectView, *, fresh: bool = False) -> ProjectView:
+        order.append(("survey", int(view.path.name)))
+
+        return replace(view, pending=False, refreshing=True)
+
+    async def revalidate(view: ProjectView) -> ProjectView | None:
+        nonlocal reading, widest
+        order.append(("refresh", int(view.path.name)))
+        refreshed.append(int(view.path.name))
+        reading += 1
+        widest = max(widest, reading)
+        await permits.acquire()
+        reading -= 1
+
+        return None
+
+    async with open_board(views, size=(120, 20), survey=survey, revalidate=revalidate) as (
+        app,
+        pilot,
+    ):
+        assert await until(pilot, lambda: len(refreshed) == WIDTH)
+
+        for _ in range(CURSOR):
+            await pilot.press("down")
+
+        visible = app._on_screen()
+
+        for _ in range(PROJECTS):
+            permits.release()
+
+        assert await until(pilot, lambda: len(refreshed) == PROJECTS)
+        assert await until(pilot, lambda: not any(row.refreshing for row in app.selection.projects))
+
+    assert widest == WIDTH, f"{widest} rows refreshed at once against a width of {WIDTH}"
+
+    last_survey = max(at for at, (kind, _) in enumerate(order) if kind == "survey")
+    queued = refreshed[WIDTH:]
+
+    assert order.index(("refresh", queued[0])) > last_survey, (
+        f"a queued refresh went before a first survey: {order}"
+    )
+
+    on_screen = [index for index in queued if index in visible]
+
+    assert queued[0] == CURSOR, f"the highlighted project was not refreshed next: {queued}"
+    assert queued[: len(on_screen)] == on_screen, f"an off-screen row went before a visible one: {queued}"
+    assert on_screen[1:] == sorted(on_screen[1:]), f"the visible rows went out of order: {queued}"
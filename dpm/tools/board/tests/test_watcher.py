@@ -0,0 +1,160 @@
+"""A project is re-read when its database is written, and only that project (FR13, NFR3).
+
+The board used to learn of a write when the user pressed ``R`` or a window ran out. These pin the
+watcher that replaced that: a write to the database or its log is reported once its burst has
+settled, a write to anything else under ``.dpm/`` is not, a burst that never settles is still
+reported, and on the board the report re-reads the one project it names, fresh — once its first
+survey has landed, if it came while that was reading.
+
+**Both ways of watching**, inotify and the ``stat`` poll it falls back to, run the same tests: the
+fallback is what a Mac gets, and a fallback nothing exercises is one that has quietly stopped
+working.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+
+import pytest
+from pilot import board, until
+
+from board_view import ProjectView
+from watcher import Inotify, Watcher, watch_projects
+
+#: Fast enough for a test, in the same proportions as the defaults.
+TIMING = {"debounce": 0.1, "latest": 0.6, "poll": 0.1}
+
+
+def write(root: Path, name: str = "dpm.db-wal", data: bytes = b"page") -> None:
+    with (root / ".dpm" / name).open("ab") as file:
+        file.write(data)
+
+
+@pytest.fixture(params=["inotify", "polled"])
+def backend(request) -> bool:
+    if request.param == "polled":
+        return False
+
+    probe = Inotify.start()
+
+    if probe is None:
+        pytest.skip("no inotify on this platform")
+
+    probe.close()
+
+    return True
+
+
+async def watched(roots: list[Path], backend: bool, during) -> list[Path]:
+    """Every report a watcher over ``roots`` makes while ``during()`` runs, and a beat after."""
+    reported: list[Path] = []
+    watcher = Watcher(lambda: roots, reported.append, inotify=backend, **TIMING)
+    running = asyncio.create_task(watcher.run())
+    await asyncio.sleep(TIMING["poll"] * 2)
+
+    try:
+        await during()
+        await asyncio.sleep(TIMING["latest"] + TIMING["poll"] * 3)
+    finally:
+        running.cancel()
+        await asyncio.gather(running, return_exceptions=True)
+
+    return reported
+
+
+async def test_a_burst_of_writes_is_one_report_for_the_project_written(project, backend):
+    quiet, busy = project("quiet"), project("busy")
+
+    async def burst() -> None:
+        for _ in range(5):
+            write(busy)
+            await asyncio.sleep(0.01)
+
+        write(busy, "dpm.db")
+
+    assert await watched([quiet, busy], backend, burst) == [busy]
+
+
+async def test_the_shared_memory_file_is_not_a_change(project, backend):
+    """Every reader writes it, the board's own servers included."""
+    root = project()
+
+    async def read() -> None:
+        write(root, "dpm.db-shm")
+
+    assert await watched([root], backend, read) == []
+
+
+async def test_writes_that_never_stop_are_still_reported(project, backend):
+    root = project()
+
+    async def endless() -> None:
+        for _ in range(30):
+            write(root)
+            await asyncio.sleep(0.05)
+
+    reported = await watched([root], backend, endless)
+
+    assert len(reported) >= 2, f"{len(reported)} reports over 1.5s of writes with a 0.6s limit"
+
+
+async def test_on_the_board_a_write_re_reads_that_project_fresh_and_no_other(project):
+    roots = [project("one"), project("two"), project("three")]
+    views = [ProjectView(name=root.name, path=root, pending=True) for root in roots]
+    surveyed: list[tuple[str, bool]] = []
+
+    async def survey(view: ProjectView, *, fresh: bool = False) -> ProjectView:
+        surveyed.append((view.name, fresh))
+
+        return replace(view, pending=False)
+
+    watch = partial(watch_projects, **TIMING)
+
+    async with board(views, survey=survey, watch=watch) as (app, pilot):
+        assert await until(pilot, lambda: len(surveyed) == len(roots))
+        await asyncio.sleep(TIMING["poll"] * 2)
+
+        write(roots[1])
+
+        assert await until(pilot, lambda: len(surveyed) > len(roots), timeout=5.0), (
+            "the write was never noticed"
+        )
+        await asyncio.sleep(TIMING["latest"])
+
+    assert surveyed[len(roots) :] == [("two", True)]
+
+
+async def test_a_write_during_a_project_s_first_survey_re_reads_it_once_that_lands(project):
+    roots = [project("one"), project("two")]
+    views = [ProjectView(name=root.name, path=root, pending=True) for root in roots]
+    surveyed: list[tuple[str, bool]] = []
+    release = asyncio.Event()
+
+    async def survey(view: ProjectView, *, fresh: bool = False) -> ProjectView:
+        surveyed.append((view.name, fresh))
+
+        if not fresh:
+            await release.wait()
+
+        return replace(view, pending=False)
+
+    async with board(views, survey=survey) as (app, pilot):
+        assert await until(pilot, lambda: len(surveyed) == len(roots))
+
+        # Some of the first survey's reads may have been answered before this write.
+        app.database_changed(roots[1])
+        await pilot.pause()
+
+        assert len(surveyed) == len(roots), "a second survey was started beside the first"
+
+        release.set()
+
+        assert await until(pilot, lambda: len(surveyed) > len(roots)), (
+            "the write made while the project was first read was never read"
+        )
+        await pilot.pause()
+
+    assert surveyed[len(roots) :] == [("two", True)]
@@ -0,0 +1,277 @@
+"""Live refresh: noticing that a project's database was written, without reading it (FR13, NFR3).
+
+Without this the board learns of a change when the user presses ``R`` or when a later read finds
+the cache's window (:data:`cache.WINDOW`) has run out — which, beside a ralph session writing
+stories as it goes, is a board that is minutes behind the thing it is there to show. With it, a
+project is re-read, fresh and on its own, as soon as its database has stopped changing.
+
+**Watched, never opened** (FR2). What is watched is each project's ``.dpm/`` directory, for events
+naming the database or its write-ahead log, and what decides that a project changed is a ``stat``
+of those two files — the same two attributes :func:`cache.stamp_of` stamps by. The log is in it
+because a write in WAL mode lands there and reaches the database only at a checkpoint: a watcher on
+the database alone would see nothing until then. The shared-memory file is left out for the opposite
+reason: every reader touches it, the board's own servers included, and a refresh that caused the
+next refresh would never stop.
+
+**inotify where there is one, a poll where there is not.** inotify(7) is reached through ``ctypes``
+rather than a package, because the board's one dependency is Textual (see :mod:`board`) and a
+watcher is not worth a second. A platform without it, a project whose ``.dpm/`` does not exist yet,
+and a descriptor that has run out of watches all fall back to the same thing: a ``stat`` every
+:data:`POLL` seconds.
+
+**Debounced, so a burst is one refresh.** A transaction is several writes, and a session writing
+stories is many transactions; a re-read per event would put a project's server under a survey per
+write. A project is re-read once it has been quiet for :data:`DEBOUNCE` seconds — or once a burst
+has gone on for :data:`LATEST`, so a session that never stops writing still shows its progress.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+from cache import WAL
+from registry import DATABASE
+
+#: The files under a project's ``.dpm/`` whose writes are a change: the database and its log.
+WATCHED = (DATABASE.name, WAL.name)
+
+#: How long a project's database has to be quiet before it is re-read, in seconds.
+DEBOUNCE = 0.5
+
+#: The longest a burst of writes can hold a re-read back, in seconds.
+LATEST = 3.0
+
+#: Seconds between passes over the registry — for projects that came and went, and for a ``stat``
+#: of each project inotify is not watching.
+POLL = 1.0
+
+# inotify(7)'s event bits, from <sys/inotify.h>. Creation and moves are in the mask because SQLite
+# creates the log at the first write after a checkpoint removed it.
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_IGNORED = 0x00008000
+MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+#: ``struct inotify_event`` up to its name: watch descriptor, mask, cookie, name length.
+EVENT = struct.Struct("iIII")
+
+
+def signature(root: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Each watched file's ``(mtime, size)``, or ``None`` for one that is not there. Stat-ed only."""
+    found = []
+
+    for name in WATCHED:
+        try:
+            stat = (root / DATABASE.parent / name).stat()
+        except OSError:
+            found.append(None)
+        else:
+            found.append((stat.st_mtime_ns, stat.st_size))
+
+    return tuple(found)
+
+
+class Inotify:
+    """One inotify descriptor with a watch per project's ``.dpm/``. Linux only; see :meth:`start`."""
+
+    def __init__(self, libc: ctypes.CDLL, fd: int) -> None:
+        self._libc = libc
+        self.fd = fd
+        self._roots: dict[int, Path] = {}
+        self._watches: dict[Path, int] = {}
+
+    @classmethod
+    def start(cls) -> "Inotify | None":
+        """A descriptor, or ``None`` where there is no inotify to be had."""
+        if not sys.platform.startswith("linux"):
+            return None
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+
+        return cls(libc, fd) if fd >= 0 else None
+
+    def watching(self, root: Path) -> bool:
+        return root in self._watches
+
+    def add(self, root: Path) -> bool:
+        """Watch ``root``'s ``.dpm/``. ``False`` when it cannot be — it is polled instead."""
+        watch = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(root / DATABASE.parent), MASK
+        )
+
+        if watch < 0:
+            return False
+
+        self._roots[watch] = root
+        self._watches[root] = watch
+
+        return True
+
+    def remove(self, root: Path) -> None:
+        watch = self._watches.pop(root, None)
+
+        if watch is not None:
+            self._roots.pop(watch, None)
+            self._libc.inotify_rm_watch(self.fd, watch)
+
+    def stirred(self) -> set[Path]:
+        """The projects with an event for a watched file since the last call. Never blocks."""
+        found: set[Path] = set()
+
+        while True:
+            try:
+                events = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return found
+
+            offset = 0
+
+            while offset < len(events):
+                watch, mask, _, length = EVENT.unpack_from(events, offset)
+                name = events[offset + EVENT.size : offset + EVENT.size + length].rstrip(b"\0")
+                offset += EVENT.size + length
+                root = self._roots.get(watch)
+
+                # The directory itself went: the kernel has dropped the watch, and the next pass
+                # either watches it again or polls it.
+                if mask & IN_IGNORED and root is not None:
+                    del self._roots[watch], self._watches[root]
+                elif root is not None and os.fsdecode(name) in WATCHED:
+                    found.add(root)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class Watcher:
+    """Which registered projects' databases changed, reported once each burst of writes settles.
+
+    ``roots`` is asked again on every pass rather than read once, because the board registers and
+    unregisters projects for as long as it is open. ``changed`` is called on the event loop, once
+    per settled burst, with the root as ``roots`` gave it.
+    """
+
+    def __init__(
+        self,
+        roots: Callable[[], list[Path]],
+        changed: Callable[[Path], None],
+        *,
+        debounce: float = DEBOUNCE,
+        latest: float = LATEST,
+        poll: float = POLL,
+        inotify: bool = True,
+    ) -> None:
+        self._roots = roots
+        self._changed = changed
+        self._debounce = debounce
+        self._latest = latest
+        self._poll = poll
+        self._inotify = Inotify.start() if inotify else None
+        #: Each project's signature as of the last time it was reported — or first seen, which is
+        #: not a change: a board opening does not re-read every project it is already reading.
+        self._seen: dict[Path, tuple] = {}
+        #: Each stirred project's pending report, and when the burst behind it began.
+        self._pending: dict[Path, asyncio.TimerHandle] = {}
+        self._began: dict[Path, float] = {}
+
+    async def run(self) -> None:
+        """Watch until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        if self._inotify is not None:
+            loop.add_reader(self._inotify.fd, self._read_events)
+
+        try:
+            while True:
+                self._pass()
+                await asyncio.sleep(self._poll)
+        finally:
+            if self._inotify is not None:
+                loop.remove_reader(self._inotify.fd)
+                self._inotify.close()
+
+            for pending in self._pending.values():
+                pending.cancel()
+
+    def _pass(self) -> None:
+        """Follow the registry, and ``stat`` every project inotify is not watching."""
+        roots = list(dict.fromkeys(self._roots()))
+
+        for gone in set(self._seen) - set(roots):
+            del self._seen[gone]
+            self._began.pop(gone, None)
+
+            if (pending := self._pending.pop(gone, None)) is not None:
+                pending.cancel()
+
+            if self._inotify is not None:
+                self._inotify.remove(gone)
+
+        for root in roots:
+            if root not in self._seen:
+                self._seen[root] = signature(root)
+
+            if self._inotify is not None and (
+                self._inotify.watching(root) or self._inotify.add(root)
+            ):
+                continue
+
+            if signature(root) != self._seen[root]:
+                self._stir(root)
+
+    def _read_events(self) -> None:
+        for root in self._inotify.stirred():
+            if root in self._seen:
+                self._stir(root)
+
+    def _stir(self, root: Path) -> None:
+        """Put ``root``'s report back by :data:`DEBOUNCE`, but not past :data:`LATEST` in all."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        began = self._began.setdefault(root, now)
+
+        if (pending := self._pending.pop(root, None)) is not None:
+            pending.cancel()
+
+        delay = min(self._debounce, max(0.0, began + self._latest - now))
+        self._pending[root] = loop.call_later(delay, self._settle, root)
+
+    def _settle(self, root: Path) -> None:
+        """Report ``root`` if its files are not as they were when it was last reported.
+
+        The ``stat`` is what decides, not the event: an event is a write *attempted*, and one that
+        left both files as they were — or a burst that ended where it began — has nothing to show.
+        """
+        self._pending.pop(root, None)
+        self._began.pop(root, None)
+        now = signature(root)
+
+        if root in self._seen and now != self._seen[root]:
+            self._seen[root] = now
+            self._changed(root)
+
+
+async def watch_projects(
+    roots: Callable[[], list[Path]], changed: Callable[[Path], None], **options
+) -> None:
+    """Run a :class:`Watcher` over ``roots`` until cancelled — what the board is handed as ``watch``."""
+    await Watcher(roots, changed, **options).run()